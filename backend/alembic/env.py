@@ -17,6 +17,8 @@ from app.models.event import Event
 from app.models.ticker_entry import TickerEntry
 from app.models.user_favorite import UserFavorite
 from app.models.synthetic_event import SyntheticEvent
+from app.models.llm_cache_entry import LLMCacheEntry
+from app.models.import_cooldown import ImportCooldown
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,95 @@
+"""add indexes for hot query paths
+
+Revision ID: b8e4f2a6d9c3
+Revises: a7d3e9f1c5b8
+Create Date: 2026-10-18 17:03:44.581920
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f2a6d9c3'
+down_revision: Union[str, None] = 'a7d3e9f1c5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+# (Name, Tabelle, Spalten, WHERE) – Prüfung: python -m tools.check_query_plans
+#
+# Existiert auf der Tabelle schon ein gleichwertiger Index (gleiche Spalten in
+# gleicher Reihenfolge, ohne WHERE/Ausdrücke, z.B. aus init.sql), wird keiner
+# angelegt – ein zweiter Index kostet nur Schreibzeit. get_by_date bzw.
+# /matches/today nutzt idx_matches_date aus init.sql.
+INDEXES = [
+    # MatchRepository.get_live, IngestionService._live_matches
+    ('ix_matches_live', 'matches', 'match_date', "status = 'live'"),
+    # get_by_league_season (ORDER BY match_date)
+    ('ix_matches_league_season_date', 'matches', 'league_season_id, match_date', None),
+    # get_by_round, get_by_team_competition_matchday
+    ('ix_matches_league_season_round', 'matches', 'league_season_id, round, match_date', None),
+    # get_by_team, Favoriten (OR über beide Spalten → BitmapOr)
+    ('ix_matches_home_team_date', 'matches', 'home_team_id, match_date', None),
+    ('ix_matches_away_team_date', 'matches', 'away_team_id, match_date', None),
+    # TickerEntryRepository.get_published
+    ('ix_ticker_entries_match_status_minute', 'ticker_entries', 'match_id, status, minute', None),
+    # Prematch-/Live-Stats-Joins, _upsert_synthetic
+    ('ix_synthetic_events_match_type', 'synthetic_events', 'match_id, event_type', None),
+    # LineupRepository.get_by_match / starters / substitutes
+    ('ix_lineups_match_substitute_grid', 'lineups', 'match_id, is_substitute, grid', None),
+    # MatchStatisticRepository.get_by_team
+    ('ix_match_statistics_team_id', 'match_statistics', 'team_id', None),
+]
+
+
+def _equivalent_index(bind, table: str, columns: str):
+    """Name eines vorhandenen B-Tree-Index exakt auf diesen Spalten (oder None)."""
+    names = [c.strip() for c in columns.split(',')]
+    return bind.execute(sa.text("""
+        SELECT i.relname
+        FROM pg_index ix
+        JOIN pg_class i ON i.oid = ix.indexrelid
+        JOIN pg_am am ON am.oid = i.relam
+        WHERE ix.indrelid = CAST(:table AS regclass)
+          AND am.amname = 'btree'
+          AND ix.indexprs IS NULL
+          AND ix.indpred IS NULL
+          AND ix.indnkeyatts = :n
+          AND ARRAY(
+                SELECT a.attname::text
+                FROM unnest(ix.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+                JOIN pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = k.attnum
+                WHERE k.ord <= :n
+                ORDER BY k.ord
+              ) = CAST(:columns AS text[])
+        LIMIT 1
+    """), {'table': table, 'n': len(names), 'columns': names}).scalar()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # CONCURRENTLY: keine Schreibsperre auf matches während eines Spieltags;
+    # geht nur außerhalb einer Transaktion
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            if where is None:
+                existing = _equivalent_index(bind, table, columns)
+                if existing:
+                    logger.info(f'{table}({columns}): {existing} vorhanden, {name} übersprungen')
+                    continue
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})"
+                + (f" WHERE {where}" if where else "")
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
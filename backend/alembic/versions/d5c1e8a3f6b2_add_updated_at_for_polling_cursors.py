@@ -0,0 +1,62 @@
+"""add updated_at to events and ticker_entries for polling cursors
+
+Revision ID: d5c1e8a3f6b2
+Revises: b8e4f2a6d9c3
+Create Date: 2026-10-18 21:14:52.307614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5c1e8a3f6b2'
+down_revision: Union[str, None] = 'b8e4f2a6d9c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ['events', 'ticker_entries']
+
+# Trigger statt nur ORM-onupdate: die n8n-Workflows schreiben Events per
+# ON CONFLICT DO UPDATE direkt in die DB. updated_at ändert sich nur, wenn
+# sich der Inhalt ändert – sonst käme bei jedem Upsert-Durchlauf die ganze
+# Liste erneut beim since=-Poller an.
+SET_UPDATED_AT = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    IF (to_jsonb(NEW) - 'updated_at') IS DISTINCT FROM (to_jsonb(OLD) - 'updated_at') THEN
+        NEW.updated_at = now();
+    ELSE
+        NEW.updated_at = OLD.updated_at;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(SET_UPDATED_AT)
+    for table in TABLES:
+        op.add_column(table, sa.Column(
+            'updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False
+        ))
+        # Bestand: letzter bekannter Änderungszeitpunkt
+        backfill = 'coalesce(published_at, created_at)' if table == 'ticker_entries' else 'created_at'
+        op.execute(f'UPDATE {table} SET updated_at = coalesce({backfill}, now())')
+        op.execute(
+            f'CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} '
+            'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+        op.create_index(f'ix_{table}_match_updated', table, ['match_id', 'updated_at', 'id'])
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.drop_index(f'ix_{table}_match_updated', table_name=table)
+        op.execute(f'DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}')
+        op.drop_column(table, 'updated_at')
+    op.execute('DROP FUNCTION IF EXISTS set_updated_at()')
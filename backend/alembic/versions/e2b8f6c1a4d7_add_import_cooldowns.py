@@ -0,0 +1,30 @@
+"""add import_cooldowns
+
+Revision ID: e2b8f6c1a4d7
+Revises: c4e7a1d2b9f3
+Create Date: 2026-10-18 11:03:27.518402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b8f6c1a4d7'
+down_revision: Union[str, None] = 'c4e7a1d2b9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('import_cooldowns',
+    sa.Column('key', sa.String(length=200), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('import_cooldowns')
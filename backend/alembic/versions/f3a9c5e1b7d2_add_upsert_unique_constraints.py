@@ -0,0 +1,118 @@
+"""add unique constraints for bulk upserts
+
+Revision ID: f3a9c5e1b7d2
+Revises: e2b8f6c1a4d7
+Create Date: 2026-10-18 12:41:09.203117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c5e1b7d2'
+down_revision: Union[str, None] = 'e2b8f6c1a4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Bestehende DBs haben diese Schlüssel meist schon, teils unter anderem Namen
+# (die n8n-Workflows nutzen ON CONFLICT ON CONSTRAINT unique_event). Ein
+# vorhandener Unique-Index auf denselben Spalten wird daher wiederverwendet.
+#
+# events.player_id ist NULL bei Events ohne Spieler (VAR, Trainer-Karten):
+# NULLS NOT DISTINCT (Postgres 15), sonst matcht ON CONFLICT diese Zeilen nie.
+# Ein vorhandenes unique_event ohne NULLS NOT DISTINCT wird unter gleichem
+# Namen ersetzt.
+#
+# Duplikate werden NICHT gelöscht: die Migration bricht mit einer Liste ab,
+# die Bereinigung ist ein eigener, bewusster Schritt.
+CONSTRAINTS = [
+    ('events', 'unique_event', ('match_id', 'minute', 'player_id', 'type'), True),
+    ('lineups', 'uq_lineups_match_player', ('match_id', 'player_id'), False),
+]
+
+
+def _unique_indexes(bind, table: str, columns: tuple[str, ...]) -> list:
+    """Unique-Indizes (auch Constraints) exakt auf diesen Spalten."""
+    rows = bind.execute(sa.text("""
+        SELECT i.relname AS index_name,
+               c.conname AS constraint_name,
+               ix.indnullsnotdistinct AS nulls_not_distinct,
+               array_agg(a.attname::text) AS columns
+        FROM pg_index ix
+        JOIN pg_class i ON i.oid = ix.indexrelid
+        JOIN pg_attribute a ON a.attrelid = ix.indrelid AND a.attnum = ANY(ix.indkey)
+        LEFT JOIN pg_constraint c ON c.conindid = ix.indexrelid
+        WHERE ix.indrelid = CAST(:table AS regclass)
+          AND ix.indisunique
+          AND ix.indexprs IS NULL
+          AND ix.indpred IS NULL
+        GROUP BY i.relname, c.conname, ix.indnullsnotdistinct, ix.indnkeyatts
+        HAVING ix.indnkeyatts = :n
+    """), {'table': table, 'n': len(columns)}).all()
+    return [r for r in rows if sorted(r.columns) == sorted(columns)]
+
+
+def _constraint_exists(bind, table: str, name: str) -> bool:
+    return bind.execute(sa.text(
+        'SELECT 1 FROM pg_constraint WHERE conrelid = CAST(:table AS regclass) AND conname = :name'
+    ), {'table': table, 'name': name}).first() is not None
+
+
+def _fail_on_duplicates(bind, table: str, columns: tuple[str, ...], nulls_not_distinct: bool) -> None:
+    cols = ', '.join(columns)
+    # GROUP BY fasst NULLs zusammen – entspricht NULLS NOT DISTINCT
+    where = '' if nulls_not_distinct else 'WHERE ' + ' AND '.join(f'{c} IS NOT NULL' for c in columns)
+    duplicates = bind.execute(sa.text(f"""
+        SELECT {cols}, array_agg(id ORDER BY id) AS ids
+        FROM {table} {where}
+        GROUP BY {cols}
+        HAVING count(*) > 1
+        ORDER BY {cols}
+        LIMIT 50
+    """)).all()
+    if duplicates:
+        lines = '\n'.join(
+            '  ' + ', '.join(f'{c}={getattr(row, c)}' for c in columns) + f' → ids {row.ids}'
+            for row in duplicates
+        )
+        raise RuntimeError(
+            f'{table}: doppelte Zeilen für UNIQUE ({cols}), Migration abgebrochen.\n'
+            f'{lines}\n'
+            f'Duplikate bereinigen (z.B. je Gruppe die älteste id behalten) und '
+            f'die Migration erneut ausführen.'
+        )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for table, name, columns, nulls_not_distinct in CONSTRAINTS:
+        existing = _unique_indexes(bind, table, columns)
+        if any(e.nulls_not_distinct or not nulls_not_distinct for e in existing):
+            continue
+
+        replace = any(e.constraint_name == name for e in existing)
+        if _constraint_exists(bind, table, name) and not replace:
+            raise RuntimeError(
+                f'{table}: Constraint {name} existiert auf anderen Spalten als '
+                f'({", ".join(columns)}) – bitte manuell prüfen.'
+            )
+        _fail_on_duplicates(bind, table, columns, nulls_not_distinct)
+
+        # Ersetzen in einem Statement, damit unique_event für n8n nie fehlt
+        actions = [f'DROP CONSTRAINT {name}'] if replace else []
+        nulls = ' NULLS NOT DISTINCT' if nulls_not_distinct else ''
+        actions.append(f'ADD CONSTRAINT {name} UNIQUE{nulls} ({", ".join(columns)})')
+        op.execute(f'ALTER TABLE {table} ' + ', '.join(actions))
+
+
+def downgrade() -> None:
+    # unique_event bleibt bestehen (n8n), nur wieder mit NULLs als verschieden
+    op.execute(
+        'ALTER TABLE events DROP CONSTRAINT IF EXISTS unique_event, '
+        'ADD CONSTRAINT unique_event UNIQUE (match_id, minute, player_id, type)'
+    )
+    op.execute('ALTER TABLE lineups DROP CONSTRAINT IF EXISTS uq_lineups_match_player')
@@ -4,25 +4,58 @@ Events API Endpoints.
 GET /api/v1/events - Liste aller Events
 GET /api/v1/events/match/{match_id} - Events für ein Match
 GET /api/v1/events/{id} - Einzelnes Event
+PUT /api/v1/events/match/{match_id} - Bulk-Upsert aller Events eines Matches
+
+Inkrementelles Polling (Keyset-Pagination, siehe app.core.cursor): ?since_id=
+liefert neu angelegte Events, ?since= zusätzlich per Upsert korrigierte. Der
+nächste Cursor (gleiche Art) steht im Header X-Next-Cursor.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.cursor import format_since, parse_since
 from app.core.database import get_db
+from app.core.http_cache import last_modified_of, set_cache_policy
 from app.repositories.event_repository import EventRepository
 from app.schemas.event import Event, EventCreate, EventUpdate
+from app.schemas.bulk_upsert import BulkUpsertResponse
 
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
+def _events_since(
+    repo: EventRepository,
+    response: Response,
+    match_id: int,
+    since_id: int | None,
+    since: str | None,
+    limit: int,
+) -> list:
+    if since is not None:
+        stamp, after_id = parse_since(since)
+        events = repo.get_by_match_changed(match_id, stamp, after_id, limit=limit)
+        next_cursor = (
+            format_since(events[-1].updated_at, events[-1].id) if events else since
+        )
+    else:
+        events = repo.get_by_match_since(match_id, since_id, limit=limit)
+        next_cursor = str(events[-1].id if events else since_id)
+    response.headers["X-Next-Cursor"] = next_cursor
+    return events
+
+
 @router.get("/", response_model=list[Event])
 def get_events(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     match_id: int | None = Query(None),  # ← NEU!
     event_type: str | None = Query(None, max_length=50),
+    since_id: int | None = Query(None),
+    since: str | None = Query(None, description="Zeitpunkt bzw. X-Next-Cursor"),
     db: Session = Depends(get_db),
 ):
     """
@@ -32,10 +65,14 @@ def get_events(
     - **limit**: Max. Anzahl Ergebnisse (default: 100)
     - **match_id**: Optional - Filter nach Match-ID
     - **event_type**: Optional - Filter nach Typ (goal, card, substitution, etc.)
+    - **since_id** / **since**: Optional - nur neue bzw. geänderte Events eines
+      Matches (Cursor)
     """
     repo = EventRepository(db)
 
     # Filter nach Match-ID (WICHTIGSTER Filter!)
+    if match_id and (since_id is not None or since is not None):
+        return _events_since(repo, response, match_id, since_id, since, limit)
     if match_id:
         return repo.get_by_match(match_id, skip=skip, limit=limit)
 
@@ -49,7 +86,14 @@ def get_events(
 
 @router.get("/match/{match_id}", response_model=list[Event])
 def get_match_events(
-    match_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+    match_id: int,
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    since_id: int | None = Query(None),
+    since: str | None = Query(None, description="Zeitpunkt bzw. X-Next-Cursor"),
+    db: Session = Depends(get_db),
 ):
     """
     Holt alle Events für ein bestimmtes Match, chronologisch sortiert.
@@ -57,9 +101,39 @@ def get_match_events(
     - **match_id**: Match-ID
     - **skip**: Anzahl zu überspringender Einträge (default: 0)
     - **limit**: Max. Anzahl Ergebnisse (default: 100)
+    - **since_id** / **since**: Optional - nur neue bzw. geänderte Events nach
+      dem Cursor
+    """
+    repo = EventRepository(db)
+    if since_id is not None or since is not None:
+        events = _events_since(repo, response, match_id, since_id, since, limit)
+    else:
+        events = repo.get_by_match(match_id, skip=skip, limit=limit)
+    set_cache_policy(request, "revalidate", last_modified=last_modified_of(events))
+    return events
+
+
+@router.put("/match/{match_id}", response_model=BulkUpsertResponse)
+def upsert_match_events(
+    match_id: int, events: list[EventCreate], db: Session = Depends(get_db)
+):
+    """
+    Bulk-Upsert aller Events eines Matches in einem Statement
+    (INSERT ... ON CONFLICT (match_id, minute, player_id, type) DO UPDATE).
     """
+    if any(item.match_id != match_id for item in events):
+        raise HTTPException(
+            status_code=400, detail="match_id in body does not match URL"
+        )
     repo = EventRepository(db)
-    return repo.get_by_match(match_id, skip=skip, limit=limit)
+    try:
+        upserted = repo.upsert_many([item.model_dump() for item in events])
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown match_id or team_id")
+    return BulkUpsertResponse(
+        match_id=match_id, received=len(events), upserted=upserted
+    )
 
 
 @router.get("/{event_id}", response_model=Event)
@@ -86,7 +160,8 @@ def create_event(event: EventCreate, db: Session = Depends(get_db)):
     - **event**: Event-Daten
     """
     repo = EventRepository(db)
-    return repo.create(event)
+    created = repo.create(event)
+    return created
 
 
 @router.patch("/{event_id}", response_model=Event)
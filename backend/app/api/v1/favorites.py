@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.query_inspector import query_budget
 from app.repositories.user_favorite_repository import UserFavoriteRepository
 from app.repositories.match_repository import MatchRepository
 from app.schemas.user_favorite import UserFavorite, UserFavoriteCreate
@@ -26,7 +27,11 @@ def get_user_favorites(user_id: int = 1, db: Session = Depends(get_db)):
     return repo.get_by_user(user_id)
 
 
-@router.get("/matches", response_model=list[Match])
+@router.get(
+    "/matches",
+    response_model=list[Match],
+    dependencies=[Depends(query_budget(2))],
+)
 def get_favorite_team_matches(user_id: int = 1, db: Session = Depends(get_db)):
     """
     Holt alle Matches der Favoriten-Teams eines Users.
@@ -44,20 +49,7 @@ def get_favorite_team_matches(user_id: int = 1, db: Session = Depends(get_db)):
         return []
 
     # Matches aller Favoriten-Teams holen
-    from app.models.match import Match as MatchModel
-
-    matches = (
-        db.query(MatchModel)
-        .filter(
-            (MatchModel.home_team_id.in_(team_ids))
-            | (MatchModel.away_team_id.in_(team_ids))
-        )
-        .order_by(MatchModel.match_date.desc())
-        .limit(50)
-        .all()
-    )
-
-    return matches
+    return match_repo.get_by_teams(team_ids, limit=50)
 
 
 @router.post("/", response_model=UserFavorite, status_code=201)
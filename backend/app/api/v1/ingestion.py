@@ -0,0 +1,73 @@
+# app/api/v1/ingestion.py
+"""
+Native Ingestion API (API-Football → Postgres ohne n8n).
+POST /api/v1/ingestion/fixtures/{fixture_id} - Datenarten einer Fixture importieren
+POST /api/v1/ingestion/live                  - alle laufenden Matches aktualisieren
+POST /api/v1/ingestion/live-stats            - nur Statistiken + Schwellwert-Erkennung
+GET  /api/v1/ingestion/stats                 - Client-Statistik (Cache, Coalescing)
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.services.api_football_client import ApiFootballError, api_football_client
+from app.services.ingestion_service import ENDPOINTS, ingestion_service
+from app.services.live_stats_detector import live_stats_detector
+
+router = APIRouter(prefix="/ingestion", tags=["ingestion"])
+
+
+@router.post("/fixtures/{fixture_id}")
+async def ingest_fixture(
+    fixture_id: int,
+    kinds: list[str]
+    | None = Query(
+        None, description=f"Datenarten, Standard: alle ({', '.join(ENDPOINTS)})"
+    ),
+):
+    """Importiert eine Fixture (API-Football ID) direkt aus API-Football."""
+    unknown = set(kinds or ()) - set(ENDPOINTS)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unbekannte Datenarten: {sorted(unknown)}"
+        )
+    return {
+        "fixture_id": fixture_id,
+        "results": await ingestion_service.import_fixture(fixture_id, kinds),
+    }
+
+
+@router.post("/live")
+async def ingest_live():
+    """Aktualisiert Spielstand, Events und Statistiken aller Live-Matches."""
+    try:
+        results = await ingestion_service.import_live()
+    except ApiFootballError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    return {"matches": len(results), "results": results}
+
+
+@router.post("/live-stats")
+async def ingest_live_stats():
+    """
+    Lädt die Statistiken aller Live-Matches und erzeugt live_stats_update
+    Events, sobald Schwellwerte überschritten werden (ersetzt den n8n Live-Stats
+    Workflow bis zur Ticker-Generierung).
+    """
+    results = await ingestion_service.import_live_stats()
+    return {
+        "matches": len(results),
+        "live_stats_events": [
+            event_id
+            for summary in results.values()
+            for event_id in summary.get("live_stats_events", [])
+        ],
+        "results": results,
+    }
+
+
+@router.get("/stats")
+def get_ingestion_stats():
+    return {
+        **api_football_client.stats(),
+        "live_stats_snapshots": live_stats_detector.snapshot_count(),
+    }
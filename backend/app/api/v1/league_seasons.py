@@ -2,10 +2,13 @@
 LeagueSeasons API Endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.query_inspector import query_budget
 from app.repositories.league_season_repository import LeagueSeasonRepository
 from app.repositories.match_repository import MatchRepository
 from app.schemas.league_season import (
@@ -14,31 +17,48 @@ from app.schemas.league_season import (
     LeagueSeasonUpdate,
 )
 from app.schemas.match import Match
+from app.services.reference_cache import reference_cache
 
 
 router = APIRouter(prefix="/league-seasons", tags=["league-seasons"])
 
 
 @router.get("/", response_model=list[LeagueSeason])
-def get_league_seasons(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_league_seasons(
+    request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+):
     """Holt alle LeagueSeasons."""
     repo = LeagueSeasonRepository(db)
-    return repo.get_all(skip=skip, limit=limit)
+    return reference_cache.respond(
+        request,
+        ("league_seasons", "all", skip, limit),
+        lambda: repo.get_all(skip=skip, limit=limit),
+        list[LeagueSeason],
+        tags=("leagues", "seasons"),
+    )
 
 
 @router.get("/{league_season_id}", response_model=LeagueSeason)
-def get_league_season(league_season_id: int, db: Session = Depends(get_db)):
+def get_league_season(
+    league_season_id: int, request: Request, db: Session = Depends(get_db)
+):
     """Holt LeagueSeason nach ID."""
     repo = LeagueSeasonRepository(db)
-    league_season = repo.get_by_id(league_season_id)
-
-    if not league_season:
-        raise HTTPException(status_code=404, detail="LeagueSeason not found")
-
-    return league_season
+    return reference_cache.respond(
+        request,
+        ("league_seasons", league_season_id),
+        lambda: repo.get_by_id(league_season_id),
+        LeagueSeason,
+        tags=("leagues", "seasons"),
+        not_found="LeagueSeason not found",
+    )
 
 
-@router.get("/{league_season_id}/matches", response_model=list[Match])
+@router.get(
+    "/{league_season_id}/matches",
+    response_model=list[Match],
+    dependencies=[Depends(query_budget(2))],
+)
 def get_league_season_matches(
     league_season_id: int,
     round: str | None = None,
@@ -56,24 +76,27 @@ def get_league_season_matches(
 
 
 @router.get("/{league_season_id}/rounds", response_model=list[str])
-def get_league_season_rounds(league_season_id: int, db: Session = Depends(get_db)):
+def get_league_season_rounds(
+    league_season_id: int, request: Request, db: Session = Depends(get_db)
+):
     """Holt alle Spieltage einer LeagueSeason."""
-    repo = LeagueSeasonRepository(db)
-    league_season = repo.get_by_id(league_season_id)
-
-    if not league_season:
-        raise HTTPException(status_code=404, detail="LeagueSeason not found")
 
-    if not league_season.rounds:
-        return []
-
-    import json
-
-    rounds = league_season.rounds
-    if isinstance(rounds, str):
-        rounds = json.loads(rounds)
-
-    return rounds
+    def load_rounds() -> list[str] | None:
+        league_season = LeagueSeasonRepository(db).get_by_id(league_season_id)
+        if not league_season:
+            return None
+        rounds = league_season.rounds or []
+        if isinstance(rounds, str):
+            rounds = json.loads(rounds)
+        return rounds
+
+    return reference_cache.respond(
+        request,
+        ("league_seasons", league_season_id, "rounds"),
+        load_rounds,
+        list[str],
+        not_found="LeagueSeason not found",
+    )
 
 
 @router.post("/", response_model=LeagueSeason, status_code=201)
@@ -93,7 +116,9 @@ def create_league_season(
             detail=f"LeagueSeason for league {league_season.league_id} and season {league_season.season_id} already exists",
         )
 
-    return repo.create(league_season)
+    created = repo.create(league_season)
+    reference_cache.invalidate("league_seasons")
+    return created
 
 
 @router.patch("/{league_season_id}", response_model=LeagueSeason)
@@ -109,4 +134,5 @@ def update_league_season(
     if not updated_league_season:
         raise HTTPException(status_code=404, detail="LeagueSeason not found")
 
+    reference_cache.invalidate("league_seasons")
     return updated_league_season
@@ -2,7 +2,7 @@
 Leagues API Endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -10,42 +10,59 @@ from app.repositories.league_repository import LeagueRepository
 from app.repositories.league_season_repository import LeagueSeasonRepository
 from app.schemas.league import League, LeagueCreate, LeagueUpdate
 from app.schemas.league_season import LeagueSeason
+from app.services.reference_cache import reference_cache
 
 
 router = APIRouter(prefix="/leagues", tags=["leagues"])
 
 
 @router.get("/", response_model=list[League])
-def get_leagues(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_leagues(
+    request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+):
     """Holt alle Ligen."""
     repo = LeagueRepository(db)
-    return repo.get_all(skip=skip, limit=limit)
+    return reference_cache.respond(
+        request,
+        ("leagues", "all", skip, limit),
+        lambda: repo.get_all(skip=skip, limit=limit),
+        list[League],
+    )
 
 
 @router.get("/{league_id}", response_model=League)
-def get_league(league_id: int, db: Session = Depends(get_db)):
+def get_league(league_id: int, request: Request, db: Session = Depends(get_db)):
     """Holt Liga nach ID."""
     repo = LeagueRepository(db)
-    league = repo.get_by_id(league_id)
-
-    if not league:
-        raise HTTPException(status_code=404, detail="League not found")
-
-    return league
+    return reference_cache.respond(
+        request,
+        ("leagues", league_id),
+        lambda: repo.get_by_id(league_id),
+        League,
+        not_found="League not found",
+    )
 
 
 @router.get("/{league_id}/seasons", response_model=list[LeagueSeason])
-def get_league_seasons(league_id: int, db: Session = Depends(get_db)):
+def get_league_seasons(league_id: int, request: Request, db: Session = Depends(get_db)):
     """Holt alle Seasons einer Liga."""
     repo = LeagueSeasonRepository(db)
-    return repo.get_by_league(league_id)
+    return reference_cache.respond(
+        request,
+        ("league_seasons", "by-league", league_id),
+        lambda: repo.get_by_league(league_id),
+        list[LeagueSeason],
+        tags=("leagues", "seasons"),
+    )
 
 
 @router.post("/", response_model=League, status_code=201)
 def create_league(league: LeagueCreate, db: Session = Depends(get_db)):
     """Erstellt neue Liga."""
     repo = LeagueRepository(db)
-    return repo.create(league)
+    created = repo.create(league)
+    reference_cache.invalidate("leagues")
+    return created
 
 
 @router.patch("/{league_id}", response_model=League)
@@ -59,6 +76,7 @@ def update_league(
     if not updated_league:
         raise HTTPException(status_code=404, detail="League not found")
 
+    reference_cache.invalidate("leagues")
     return updated_league
 
 
@@ -70,3 +88,5 @@ def delete_league(league_id: int, db: Session = Depends(get_db)):
 
     if not success:
         raise HTTPException(status_code=404, detail="League not found")
+
+    reference_cache.invalidate("leagues")
@@ -1,11 +1,13 @@
 # app/api/v1/endpoints/lineups.py
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
 from app.repositories.lineup_repository import LineupRepository
 from app.schemas.lineup import LineupCreate, LineupUpdate, LineupResponse
+from app.schemas.bulk_upsert import BulkUpsertResponse
 
 router = APIRouter(prefix="/lineups", tags=["lineups"])
 
@@ -37,6 +39,29 @@ def get_substitutes_by_match(match_id: int, db: Session = Depends(get_db)):
     return repo.get_substitutes_by_match(match_id)
 
 
+@router.put("/match/{match_id}", response_model=BulkUpsertResponse)
+def upsert_match_lineups(
+    match_id: int, lineups: list[LineupCreate], db: Session = Depends(get_db)
+):
+    """
+    Bulk-Upsert aller Aufstellungen eines Matches in einem Statement
+    (INSERT ... ON CONFLICT (match_id, player_id) DO UPDATE).
+    """
+    if any(item.match_id != match_id for item in lineups):
+        raise HTTPException(
+            status_code=400, detail="match_id in body does not match URL"
+        )
+    repo = LineupRepository(db)
+    try:
+        upserted = repo.upsert_many([item.model_dump() for item in lineups])
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown match_id or team_id")
+    return BulkUpsertResponse(
+        match_id=match_id, received=len(lineups), upserted=upserted
+    )
+
+
 @router.post("/", response_model=LineupResponse, status_code=201)
 def create_lineup(lineup: LineupCreate, db: Session = Depends(get_db)):
     repo = LineupRepository(db)
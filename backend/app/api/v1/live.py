@@ -0,0 +1,68 @@
+# app/api/v1/live.py
+"""
+Live Push API.
+WS  /api/v1/live/matches/{match_id}/ws     - WebSocket-Subscription
+GET /api/v1/live/matches/{match_id}/stream - Server-Sent Events (Fallback)
+
+Pusht Deltas (ticker_entry, event, match_statistic, score) statt Polling.
+Heartbeat alle WS_HEARTBEAT_INTERVAL Sekunden.
+"""
+
+import asyncio
+import json
+
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.services.live_broadcaster import live_broadcaster
+
+router = APIRouter(prefix="/live", tags=["live"])
+
+
+@router.websocket("/matches/{match_id}/ws")
+async def match_websocket(websocket: WebSocket, match_id: int):
+    await websocket.accept()
+    async with live_broadcaster.subscribe(match_id) as queue:
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(), timeout=settings.WS_HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    message = {"type": "heartbeat", "match_id": match_id}
+                await websocket.send_json(message)
+        except WebSocketDisconnect:
+            pass
+
+
+@router.get("/matches/{match_id}/stream")
+async def match_event_stream(match_id: int, request: Request):
+    async def stream():
+        async with live_broadcaster.subscribe(match_id) as queue:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(
+                        queue.get(), timeout=settings.WS_HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                data = json.dumps(message, ensure_ascii=False)
+                yield f"event: {message['type']}\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/matches/{match_id}/subscribers")
+def get_subscriber_count(match_id: int):
+    return {
+        "match_id": match_id,
+        "subscribers": live_broadcaster.subscriber_count(match_id),
+    }
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
@@ -8,6 +9,7 @@ from app.schemas.match_statistic import (
     MatchStatisticUpdate,
     MatchStatisticResponse,
 )
+from app.schemas.bulk_upsert import BulkUpsertResponse
 
 router = APIRouter(prefix="/match-statistics", tags=["match-statistics"])
 
@@ -33,6 +35,31 @@ def get_match_statistics_by_match(match_id: int, db: Session = Depends(get_db)):
     return repo.get_by_match(match_id)
 
 
+@router.put("/match/{match_id}", response_model=BulkUpsertResponse)
+def upsert_match_statistics(
+    match_id: int,
+    match_stats: list[MatchStatisticCreate],
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk-Upsert aller Team-Statistiken eines Matches in einem Statement
+    (INSERT ... ON CONFLICT unique_match_team_stat (match_id, team_id) DO UPDATE).
+    """
+    if any(item.match_id != match_id for item in match_stats):
+        raise HTTPException(
+            status_code=400, detail="match_id in body does not match URL"
+        )
+    repo = MatchStatisticRepository(db)
+    try:
+        upserted = repo.upsert_many([item.model_dump() for item in match_stats])
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown match_id or team_id")
+    return BulkUpsertResponse(
+        match_id=match_id, received=len(match_stats), upserted=upserted
+    )
+
+
 @router.get("/team/{team_id}", response_model=List[MatchStatisticResponse])
 def get_match_statistics_by_team(team_id: int, db: Session = Depends(get_db)):
     repo = MatchStatisticRepository(db)
@@ -2,22 +2,32 @@
 Matches API Endpoints.
 """
 
-import httpx
-import asyncio
+import hashlib
 import logging
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    BackgroundTasks,
+    Request,
+    Response,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.config import settings
+from app.core.http_cache import set_cache_policy
 from app.repositories.match_repository import MatchRepository
-from app.models.lineup import Lineup
-from app.models.match_statistic import MatchStatistic
-from app.models.player_statistic import PlayerStatistic
-from app.models.event import Event
-from app.models.synthetic_event import SyntheticEvent
+from app.repositories.async_repositories import AsyncMatchRepository
 from app.schemas.match import Match, MatchCreate, MatchUpdate, MatchSimple
+from app.schemas.match_snapshot import MatchSnapshot, SNAPSHOT_FIELDS
+from app.services.match_snapshot import build_match_snapshot
+from app.services.import_scheduler import import_scheduler
+from app.services.ingestion_service import ingestion_service
+from app.services.match_context_cache import match_context_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,72 +35,85 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/matches", tags=["matches"])
 
 
-async def _trigger_lineup_webhook(fixture_id: int) -> None:
-    """Triggert n8n Webhook für Lineup-Import (fire & forget)."""
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_LINEUP, json={"fixture_id": fixture_id}
-            )
-            logger.info(
-                f"Lineup webhook triggered for {fixture_id}: {resp.status_code}"
-            )
-    except Exception as e:
-        logger.error(f"Lineup webhook failed for {fixture_id}: {e}")
-
-
-async def _trigger_stats_webhook(fixture_id: int) -> None:
-    """Triggert n8n Webhook für Statistics-Import (fire & forget)."""
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_STATISTICS, json={"fixture_id": fixture_id}
-            )
-            logger.info(f"Stats webhook triggered for {fixture_id}: {resp.status_code}")
-    except Exception as e:
-        logger.error(f"Stats webhook failed for {fixture_id}: {e}")
-
-
-async def _trigger_player_stats_webhook(fixture_id: int) -> None:
-    """Triggert n8n Webhook für Player-Statistics-Import (fire & forget)."""
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_PLAYER_STATISTICS, json={"fixture_id": fixture_id}
-            )
-            logger.info(
-                f"Player stats webhook triggered for {fixture_id}: {resp.status_code}"
-            )
-    except Exception as e:
-        logger.error(f"Player stats webhook failed for {fixture_id}: {e}")
+# Importart → n8n-Webhook (Payload jeweils {"fixture_id": external_id})
+_IMPORT_WEBHOOKS = {
+    "lineups": settings.N8N_WEBHOOK_LINEUP,
+    "statistics": settings.N8N_WEBHOOK_STATISTICS,
+    "player_statistics": settings.N8N_WEBHOOK_PLAYER_STATISTICS,
+    "events": settings.N8N_WEBHOOK_EVENTS,
+    "prematch": settings.N8N_WEBHOOK_PREMATCH,
+}
+
+# Importart → Datenarten des nativen Imports (INGESTION_MODE=native)
+_NATIVE_IMPORT_KINDS = {
+    "lineups": ("lineups",),
+    "statistics": ("statistics",),
+    "player_statistics": ("player_statistics",),
+    "events": ("fixture", "events"),
+    "prematch": ("injuries", "predictions"),
+}
+
+
+def _missing_imports(db: Session, match) -> list[str]:
+    """Importarten, deren Daten zu einem Match noch fehlen."""
+    if not match.external_id:
+        return []
+    return import_scheduler.missing_kinds(
+        match.id,
+        tuple(_IMPORT_WEBHOOKS),
+        lambda: MatchRepository(db).get_data_presence(match.id),
+    )
 
 
-async def _trigger_events_webhook(fixture_id: int) -> None:
-    """Triggert n8n Webhook für Events-Import (fire & forget)."""
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_EVENTS, json={"fixture_id": fixture_id}
+def _schedule_missing_imports(
+    db: Session, match, background_tasks: BackgroundTasks
+) -> None:
+    """Triggert Imports (n8n oder nativ) für Daten, die zu einem Match noch
+    fehlen. Dedupliziert und mit Cooldown über den ImportScheduler."""
+    for kind in _missing_imports(db, match):
+        if settings.INGESTION_MODE == "native":
+            import_scheduler.schedule_call(
+                background_tasks,
+                kind,
+                match.external_id,
+                ingestion_service.import_fixture,
+                match.external_id,
+                _NATIVE_IMPORT_KINDS[kind],
             )
-            logger.info(
-                f"Events webhook triggered for {fixture_id}: {resp.status_code}"
+        else:
+            import_scheduler.schedule(
+                background_tasks,
+                kind,
+                match.external_id,
+                _IMPORT_WEBHOOKS[kind],
+                {"fixture_id": match.external_id},
             )
-    except Exception as e:
-        logger.error(f"Events webhook failed for {fixture_id}: {e}")
 
 
-async def _trigger_prematch_webhook(fixture_id: int) -> None:
-    """Triggert n8n Webhook für Prematch-Daten-Import (fire & forget)."""
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_PREMATCH, json={"fixture_id": fixture_id}
+async def _schedule_missing_imports_async(
+    db: AsyncSession, match, background_tasks: BackgroundTasks
+) -> None:
+    """_schedule_missing_imports für async Routes: nur die Presence-Query läuft
+    per run_sync, der Cooldown-Store wird außerhalb des Greenlets abgefragt."""
+    missing = await db.run_sync(lambda session: _missing_imports(session, match))
+    for kind in missing:
+        if settings.INGESTION_MODE == "native":
+            await import_scheduler.schedule_call_async(
+                background_tasks,
+                kind,
+                match.external_id,
+                ingestion_service.import_fixture,
+                match.external_id,
+                _NATIVE_IMPORT_KINDS[kind],
             )
-            logger.info(
-                f"Prematch webhook triggered for {fixture_id}: {resp.status_code}"
+        else:
+            await import_scheduler.schedule_async(
+                background_tasks,
+                kind,
+                match.external_id,
+                _IMPORT_WEBHOOKS[kind],
+                {"fixture_id": match.external_id},
             )
-    except Exception as e:
-        logger.error(f"Prematch webhook failed for {fixture_id}: {e}")
 
 
 @router.get("/", response_model=list[Match])
@@ -127,43 +150,71 @@ def get_todays_matches(db: Session = Depends(get_db)):
 @router.get("/{match_id}", response_model=Match)
 async def get_match(
     match_id: int,
+    request: Request,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Holt Match nach ID. Triggert Lineup- und Stats-Webhook falls noch keine Daten vorhanden."""
-    repo = MatchRepository(db)
-    match = repo.get_by_id(match_id)
+    match = await AsyncMatchRepository(db).get_by_id(match_id)
 
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
 
-    lineup_count = db.query(Lineup).filter(Lineup.match_id == match_id).count()
-    if lineup_count == 0 and match.external_id:
-        background_tasks.add_task(_trigger_lineup_webhook, match.external_id)
+    await _schedule_missing_imports_async(db, match, background_tasks)
 
-    stats_count = (
-        db.query(MatchStatistic).filter(MatchStatistic.match_id == match_id).count()
+    # Kein "immutable" für beendete Matches: Lineups, Statistiken und
+    # Korrekturen kommen auch nach Abpfiff noch – Revalidierung per
+    # ETag/Last-Modified (If-None-Match hat Vorrang, deckt auch die
+    # eingebetteten Teams ab, die kein updated_at haben)
+    set_cache_policy(
+        request, "revalidate", last_modified=match.updated_at or match.created_at
     )
-    if stats_count == 0 and match.external_id:
-        background_tasks.add_task(_trigger_stats_webhook, match.external_id)
+    return match
 
-    player_stats_count = (
-        db.query(PlayerStatistic).filter(PlayerStatistic.match_id == match_id).count()
-    )
-    if player_stats_count == 0 and match.external_id:
-        background_tasks.add_task(_trigger_player_stats_webhook, match.external_id)
 
-    events_count = db.query(Event).filter(Event.match_id == match_id).count()
-    if events_count == 0 and match.external_id:
-        background_tasks.add_task(_trigger_events_webhook, match.external_id)
+@router.get(
+    "/{match_id}/snapshot",
+    response_model=MatchSnapshot,
+    response_model_exclude_unset=True,
+    responses={304: {"description": "Snapshot unverändert (ETag)"}},
+)
+def get_match_snapshot(
+    match_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    fields: str | None = Query(None, description="z.B. events,ticker_entries"),
+    db: Session = Depends(get_db),
+):
+    """
+    Alle Daten einer Match-Ansicht in einer Response.
+    Liefert einen ETag; bei passendem If-None-Match kommt 304 ohne Body.
+    """
+    selected = None
+    if fields:
+        selected = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = selected - set(SNAPSHOT_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown snapshot fields: {', '.join(sorted(unknown))}",
+            )
+
+    snapshot = build_match_snapshot(db, match_id, selected)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="Match not found")
+
+    if snapshot.match is not None:
+        _schedule_missing_imports(db, snapshot.match, background_tasks)
 
-    synthetic_count = (
-        db.query(SyntheticEvent).filter(SyntheticEvent.match_id == match_id).count()
-    )
-    if synthetic_count == 0 and match.external_id:
-        background_tasks.add_task(_trigger_prematch_webhook, match.external_id)
+    body = snapshot.model_dump_json(exclude_unset=True)
+    etag = f'W/"{hashlib.sha1(body.encode("utf-8")).hexdigest()}"'
+    # Immer revalidieren, auch nach Abpfiff: Ticker-Einträge werden noch
+    # veröffentlicht und bearbeitet (Polling von useMatchData)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
 
-    return match
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/", response_model=Match, status_code=201)
@@ -178,6 +229,7 @@ def update_match(
     updated = MatchRepository(db).update(match_id, match_update)
     if not updated:
         raise HTTPException(status_code=404, detail="Match not found")
+    match_context_cache.update_match(updated)
     return updated
 
 
@@ -185,3 +237,4 @@ def update_match(
 def delete_match(match_id: int, db: Session = Depends(get_db)):
     if not MatchRepository(db).delete(match_id):
         raise HTTPException(status_code=404, detail="Match not found")
+    match_context_cache.forget(match_id)
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
@@ -8,6 +9,7 @@ from app.schemas.player_statistic import (
     PlayerStatisticUpdate,
     PlayerStatisticResponse,
 )
+from app.schemas.bulk_upsert import BulkUpsertResponse
 
 router = APIRouter(prefix="/player-statistics", tags=["player-statistics"])
 
@@ -66,6 +68,31 @@ def update_player_statistic(
     return updated_stat
 
 
+@router.put("/match/{match_id}", response_model=BulkUpsertResponse)
+def upsert_match_player_statistics(
+    match_id: int,
+    player_stats: list[PlayerStatisticCreate],
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk-Upsert aller Spieler-Statistiken eines Matches in einem Statement
+    (INSERT ... ON CONFLICT unique_match_player (match_id, player_id) DO UPDATE).
+    """
+    if any(item.match_id != match_id for item in player_stats):
+        raise HTTPException(
+            status_code=400, detail="match_id in body does not match URL"
+        )
+    repo = PlayerStatisticRepository(db)
+    try:
+        upserted = repo.upsert_many([item.model_dump() for item in player_stats])
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Unknown match_id or team_id")
+    return BulkUpsertResponse(
+        match_id=match_id, received=len(player_stats), upserted=upserted
+    )
+
+
 @router.delete("/{player_stat_id}", status_code=204)
 def delete_player_statistic(player_stat_id: int, db: Session = Depends(get_db)):
     repo = PlayerStatisticRepository(db)
@@ -2,46 +2,56 @@
 Seasons API Endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.repositories.season_repository import SeasonRepository
 from app.schemas.season import Season, SeasonCreate, SeasonUpdate
+from app.services.reference_cache import reference_cache
 
 
 router = APIRouter(prefix="/seasons", tags=["seasons"])
 
 
 @router.get("/", response_model=list[Season])
-def get_seasons(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_seasons(
+    request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+):
     """Holt alle Seasons."""
     repo = SeasonRepository(db)
-    return repo.get_all(skip=skip, limit=limit)
+    return reference_cache.respond(
+        request,
+        ("seasons", "all", skip, limit),
+        lambda: repo.get_all(skip=skip, limit=limit),
+        list[Season],
+    )
 
 
 @router.get("/current", response_model=Season)
-def get_current_season(db: Session = Depends(get_db)):
+def get_current_season(request: Request, db: Session = Depends(get_db)):
     """Holt die aktuelle Season."""
     repo = SeasonRepository(db)
-    season = repo.get_current()
-
-    if not season:
-        raise HTTPException(status_code=404, detail="No current season found")
-
-    return season
+    return reference_cache.respond(
+        request,
+        ("seasons", "current"),
+        repo.get_current,
+        Season,
+        not_found="No current season found",
+    )
 
 
 @router.get("/{season_id}", response_model=Season)
-def get_season(season_id: int, db: Session = Depends(get_db)):
+def get_season(season_id: int, request: Request, db: Session = Depends(get_db)):
     """Holt Season nach ID."""
     repo = SeasonRepository(db)
-    season = repo.get_by_id(season_id)
-
-    if not season:
-        raise HTTPException(status_code=404, detail="Season not found")
-
-    return season
+    return reference_cache.respond(
+        request,
+        ("seasons", season_id),
+        lambda: repo.get_by_id(season_id),
+        Season,
+        not_found="Season not found",
+    )
 
 
 @router.post("/", response_model=Season, status_code=201)
@@ -56,7 +66,9 @@ def create_season(season: SeasonCreate, db: Session = Depends(get_db)):
             status_code=400, detail=f"Season {season.year} already exists"
         )
 
-    return repo.create(season)
+    created = repo.create(season)
+    reference_cache.invalidate("seasons")
+    return created
 
 
 @router.patch("/{season_id}", response_model=Season)
@@ -70,6 +82,7 @@ def update_season(
     if not updated_season:
         raise HTTPException(status_code=404, detail="Season not found")
 
+    reference_cache.invalidate("seasons")
     return updated_season
 
 
@@ -82,4 +95,5 @@ def set_current_season(season_id: int, db: Session = Depends(get_db)):
     if not season:
         raise HTTPException(status_code=404, detail="Season not found")
 
+    reference_cache.invalidate("seasons")
     return season
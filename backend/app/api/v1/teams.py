@@ -1,126 +1,128 @@
 import logging
-import time
-import httpx
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db
 from app.core.config import settings
 from app.repositories.team_repository import TeamRepository
 from app.repositories.match_repository import MatchRepository
+from app.repositories.async_repositories import (
+    AsyncTeamRepository,
+    AsyncMatchRepository,
+    AsyncLeagueSeasonRepository,
+)
 from app.schemas.team import Team, TeamCreate, TeamUpdate
 from app.schemas.league_season import LeagueSeason
 from app.schemas.match import Match
+from app.services.import_scheduler import import_scheduler
+from app.services.reference_cache import reference_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/teams", tags=["teams"])
 
-_country_webhook_cooldown: dict[str, float] = {}
-_matches_webhook_cooldown: dict[str, float] = {}
 COOLDOWN_SECONDS = 3600  # 1 Stunde
 
 
-async def _trigger_country_webhook(country_name: str) -> None:
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_COUNTRY,
-                json={"country_name": country_name},
-            )
-            logger.info(
-                f"Country webhook triggered for {country_name}: {resp.status_code}"
-            )
-    except Exception as e:
-        logger.error(f"Country webhook failed for {country_name}: {e}")
-
-
-async def _trigger_competitions_webhook(team_external_id: int) -> None:
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_COMPETITIONS,
-                json={"team_external_id": team_external_id},
-            )
-            logger.info(
-                f"Competitions webhook triggered for team {team_external_id}: {resp.status_code}"
-            )
-    except Exception as e:
-        logger.error(f"Competitions webhook failed for team {team_external_id}: {e}")
-
-
-async def _trigger_matches_webhook(
-    team_external_id: int, league_external_id: int, season_year: int
-) -> None:
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                settings.N8N_WEBHOOK_MATCHES,
-                json={
-                    "team_external_id": team_external_id,
-                    "league_external_id": league_external_id,
-                    "season_year": season_year,
-                },
-            )
-            logger.info(
-                f"Matches webhook triggered for team {team_external_id}, league {league_external_id}: {resp.status_code}"
-            )
-    except Exception as e:
-        logger.error(f"Matches webhook failed for team {team_external_id}: {e}")
-
-
 @router.get("/countries", response_model=list[str])
-def get_countries(db: Session = Depends(get_db)):
-    return TeamRepository(db).get_countries()
+def get_countries(request: Request, db: Session = Depends(get_db)):
+    return reference_cache.respond(
+        request,
+        ("teams", "countries"),
+        lambda: TeamRepository(db).get_countries(),
+        list[str],
+    )
 
 
 @router.get("/partners", response_model=list[Team])
-def get_partner_teams(db: Session = Depends(get_db)):
-    return TeamRepository(db).get_partners()
+def get_partner_teams(request: Request, db: Session = Depends(get_db)):
+    return reference_cache.respond(
+        request,
+        ("teams", "partners"),
+        lambda: TeamRepository(db).get_partners(),
+        list[Team],
+    )
 
 
 @router.get("/by-country/{country}", response_model=list[Team])
 async def get_teams_by_country(
-    country: str, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+    country: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Teams eines Landes. Triggert Import wenn noch keine vorhanden oder Cooldown abgelaufen."""
-    teams = TeamRepository(db).get_by_country(country)
-
-    cache_key = f"country:{country}"
-    last_triggered = _country_webhook_cooldown.get(cache_key, 0)
-    if time.time() - last_triggered > COOLDOWN_SECONDS:
-        _country_webhook_cooldown[cache_key] = time.time()
-        background_tasks.add_task(_trigger_country_webhook, country)
-        logger.info(f"Country webhook scheduled for {country}")
-
-    return teams
+    scheduled = await import_scheduler.schedule_async(
+        background_tasks,
+        "country",
+        country,
+        settings.N8N_WEBHOOK_COUNTRY,
+        {"country_name": country},
+        cooldown_seconds=COOLDOWN_SECONDS,
+    )
+    if scheduled:
+        # n8n antwortet sofort, der Import schreibt danach noch: so lange
+        # keine (evtl. halbe) Team-Liste cachen
+        await import_scheduler.mark_async(
+            "teams_country", country, settings.REFERENCE_CACHE_IMPORT_SECONDS
+        )
+        reference_cache.invalidate(f"country:{country}")
+    importing = await import_scheduler.is_cooling_down_async("teams_country", country)
+
+    return await reference_cache.respond_async(
+        request,
+        ("teams", "by-country", country),
+        lambda: AsyncTeamRepository(db).get_by_country(country),
+        list[Team],
+        tags=(f"country:{country}",),
+        store=not importing,
+    )
 
 
 @router.get("/", response_model=list[Team])
-def get_teams(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return TeamRepository(db).get_all(skip=skip, limit=limit)
+def get_teams(
+    request: Request, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
+):
+    return reference_cache.respond(
+        request,
+        ("teams", "all", skip, limit),
+        lambda: TeamRepository(db).get_all(skip=skip, limit=limit),
+        list[Team],
+    )
 
 
 @router.get("/{team_id}", response_model=Team)
-def get_team(team_id: int, db: Session = Depends(get_db)):
-    team = TeamRepository(db).get_by_id(team_id)
-    if not team:
-        raise HTTPException(status_code=404, detail="Team not found")
-    return team
+def get_team(team_id: int, request: Request, db: Session = Depends(get_db)):
+    return reference_cache.respond(
+        request,
+        ("teams", team_id),
+        lambda: TeamRepository(db).get_by_id(team_id),
+        Team,
+        not_found="Team not found",
+    )
 
 
 @router.get("/{team_id}/competitions", response_model=list[LeagueSeason])
 async def get_team_competitions(
-    team_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+    team_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Triggert Competition-Import wenn noch keine vorhanden."""
-    team = TeamRepository(db).get_by_id(team_id)
+    team = await AsyncTeamRepository(db).get_by_id(team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    competitions = MatchRepository(db).get_competitions_by_team(team_id)
+    competitions = await AsyncMatchRepository(db).get_competitions_by_team(team_id)
 
     if len(competitions) == 0 and team.external_id:
-        background_tasks.add_task(_trigger_competitions_webhook, team.external_id)
+        await import_scheduler.schedule_async(
+            background_tasks,
+            "competitions",
+            team.external_id,
+            settings.N8N_WEBHOOK_COMPETITIONS,
+            {"team_external_id": team.external_id},
+        )
 
     return competitions
 
@@ -132,39 +134,36 @@ async def get_team_matchdays(
     team_id: int,
     league_season_id: int,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Triggert Match-Import max. 1x pro Stunde pro Team+Competition."""
-    team = TeamRepository(db).get_by_id(team_id)
+    team = await AsyncTeamRepository(db).get_by_id(team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    matchdays = MatchRepository(db).get_matchdays_by_team_and_competition(
+    matchdays = await AsyncMatchRepository(db).get_matchdays_by_team_and_competition(
         team_id, league_season_id
     )
 
-    if team.external_id:
-        cache_key = f"{team_id}:{league_season_id}"
-        last_triggered = _matches_webhook_cooldown.get(cache_key, 0)
-        if time.time() - last_triggered > COOLDOWN_SECONDS:
-            from app.models.league_season import LeagueSeason as LeagueSeasonModel
-
-            ls = (
-                db.query(LeagueSeasonModel)
-                .filter(LeagueSeasonModel.id == league_season_id)
-                .first()
+    cache_key = f"{team_id}:{league_season_id}"
+    if team.external_id and not await import_scheduler.is_cooling_down_async(
+        "matches", cache_key
+    ):
+        # lädt league + season per joinedload (kein Lazy Load in async)
+        ls = await AsyncLeagueSeasonRepository(db).get_by_id(league_season_id)
+        if ls and ls.league and ls.league.external_id and ls.season:
+            await import_scheduler.schedule_async(
+                background_tasks,
+                "matches",
+                cache_key,
+                settings.N8N_WEBHOOK_MATCHES,
+                {
+                    "team_external_id": team.external_id,
+                    "league_external_id": ls.league.external_id,
+                    "season_year": ls.season.year,
+                },
+                cooldown_seconds=COOLDOWN_SECONDS,
             )
-            if ls and ls.league and ls.league.external_id and ls.season:
-                _matches_webhook_cooldown[cache_key] = time.time()
-                background_tasks.add_task(
-                    _trigger_matches_webhook,
-                    team.external_id,
-                    ls.league.external_id,
-                    ls.season.year,
-                )
-                logger.info(
-                    f"Matches webhook scheduled for team {team_id}, league_season {league_season_id}"
-                )
 
     return matchdays
 
@@ -186,7 +185,9 @@ def get_team_matches_by_matchday(
 
 @router.post("/", response_model=Team, status_code=201)
 def create_team(team: TeamCreate, db: Session = Depends(get_db)):
-    return TeamRepository(db).create(team)
+    created = TeamRepository(db).create(team)
+    reference_cache.invalidate("teams")
+    return created
 
 
 @router.patch("/{team_id}", response_model=Team)
@@ -194,4 +195,5 @@ def update_team(team_id: int, team_update: TeamUpdate, db: Session = Depends(get
     updated = TeamRepository(db).update(team_id, team_update)
     if not updated:
         raise HTTPException(status_code=404, detail="Team not found")
+    reference_cache.invalidate("teams")
     return updated
@@ -1,26 +1,87 @@
 # app/api/v1/ticker.py
 
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db, get_async_sessionmaker
 from app.repositories.synthetic_event_repository import SyntheticEventRepository
-from app.repositories.match_repository import MatchRepository
 from app.schemas.synthetic_event import (
     SyntheticEvent,
     SyntheticEventCreate,
     GenerateSyntheticRequest,
     GenerateSyntheticResponse,
+    GenerateSyntheticBatchRequest,
+    GenerateSyntheticBatchItem,
+    GenerateSyntheticBatchResponse,
+)
+from app.schemas.llm_job import (
+    LLMJob,
+    LLMJobEnqueueRequest,
+    LLMJobEnqueueResponse,
+)
+from app.services.llm_job_queue import llm_job_queue
+from app.services.match_context_cache import match_context_cache
+from app.services.llm_router import llm_router
+from app.services.llm_service import (
+    generate_ticker_text,
+    stream_ticker_text,
+    llm_service,
+    _provider,
 )
-from app.services.llm_service import generate_ticker_text, _provider
+from app.services.match_snapshot import PREMATCH_EVENT_TYPES, LIVE_STATS_EVENT_TYPE
 from app.models.ticker_entry import TickerEntry
 from app.models.synthetic_event import SyntheticEvent as SyntheticEventModel
-from app.models.match import Match
 from app.repositories.event_repository import EventRepository
+from app.repositories.async_repositories import (
+    AsyncEventRepository,
+    AsyncSyntheticEventRepository,
+    AsyncTickerEntryRepository,
+)
 
 
 router = APIRouter(prefix="/ticker", tags=["ticker"])
 
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_and_store(
+    stream: AsyncIterator[str],
+    store: Callable[[AsyncSession, str], Awaitable[dict]],
+) -> AsyncIterator[str]:
+    """
+    Leitet Provider-Tokens als SSE weiter (event: token) und speichert den
+    TickerEntry erst, wenn der Text vollständig ist (event: done). Eigene
+    Session, da der Stream länger lebt als die Request-Dependency.
+    """
+    chunks = []
+    try:
+        async for chunk in stream:
+            chunks.append(chunk)
+            yield _sse("token", {"text": chunk})
+    except Exception as e:
+        yield _sse("error", {"detail": f"LLM error: {str(e) or type(e).__name__}"})
+        return
+
+    # Fehler beim Speichern ebenfalls als SSE melden: die Response läuft
+    # schon, eine Exception würde den Stream nur kommentarlos abbrechen
+    try:
+        async with get_async_sessionmaker()() as db:
+            result = await store(db, "".join(chunks).strip())
+    except Exception as e:
+        yield _sse("error", {"detail": f"Store error: {str(e) or type(e).__name__}"})
+        return
+    yield _sse("done", result)
+
 
 @router.get("/match/{match_id}/synthetic", response_model=list[SyntheticEvent])
 def get_synthetic_events(match_id: int, db: Session = Depends(get_db)):
@@ -28,6 +89,62 @@ def get_synthetic_events(match_id: int, db: Session = Depends(get_db)):
     return repo.get_by_match(match_id)
 
 
+@router.get("/llm-router/stats")
+def get_llm_router_stats():
+    """Latenz-Perzentile, Siege und Hedges pro LLM-Backend."""
+    return llm_router.stats()
+
+
+@router.get("/llm-cache/stats")
+def get_llm_cache_stats():
+    """Hit/Miss-Statistik des LLM-Caches."""
+    if llm_service.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **llm_service.cache.stats()}
+
+
+@router.post("/jobs", response_model=LLMJobEnqueueResponse, status_code=202)
+async def enqueue_jobs(req: LLMJobEnqueueRequest, response: Response):
+    """
+    Reiht Ticker-Generierungen in die LLM Job Queue ein (statt sie im Request
+    abzuwarten). Status über GET /ticker/jobs/{job_id} abfragen.
+    Bei voller Queue werden Vorbericht-Jobs abgelehnt (queue_full, Retry-After).
+    """
+    if not req.synthetic_event_ids and not req.event_ids:
+        raise HTTPException(
+            status_code=400, detail="synthetic_event_ids or event_ids required"
+        )
+    result = await llm_job_queue.enqueue(
+        req.synthetic_event_ids,
+        req.event_ids,
+        req.model_dump(include={"style", "language", "llm_provider", "llm_model"}),
+    )
+    if any(r["reason"] == "queue_full" for r in result["rejected"]):
+        retry_after = str(int(llm_job_queue.retry_max_seconds))
+        if not result["jobs"]:
+            raise HTTPException(
+                status_code=503,
+                detail="LLM job queue is full",
+                headers={"Retry-After": retry_after},
+            )
+        response.headers["Retry-After"] = retry_after
+    return result
+
+
+@router.get("/jobs/stats")
+def get_job_queue_stats():
+    """Queue-Tiefe pro Status, Live vs. Vorbericht, Backpressure."""
+    return llm_job_queue.stats()
+
+
+@router.get("/jobs/{job_id}", response_model=LLMJob)
+def get_job(job_id: int):
+    jobs = llm_job_queue.get_jobs([job_id])
+    if not jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return jobs[0]
+
+
 @router.post("/synthetic", response_model=SyntheticEvent, status_code=201)
 def create_synthetic_event(data: SyntheticEventCreate, db: Session = Depends(get_db)):
     """n8n schreibt synthetische Events direkt (ohne LLM-Generierung)."""
@@ -37,25 +154,27 @@ def create_synthetic_event(data: SyntheticEventCreate, db: Session = Depends(get
 
 @router.post("/generate-synthetic", response_model=GenerateSyntheticResponse)
 async def generate_synthetic(
-    req: GenerateSyntheticRequest, db: Session = Depends(get_db)
+    req: GenerateSyntheticRequest, db: AsyncSession = Depends(get_async_db)
 ):
     """
     n8n triggert diesen Endpoint nach Pre-Match Workflow.
     Liest context_data aus synthetic_event, generiert Ticker-Text via LLM,
     speichert TickerEntry und gibt { ticker_entry_id, text } zurück.
     """
-    syn_repo = SyntheticEventRepository(db)
-    match_repo = MatchRepository(db)
-
-    syn_event = syn_repo.get_by_id(req.synthetic_event_id)
+    syn_event = await AsyncSyntheticEventRepository(db).get_by_id(
+        req.synthetic_event_id
+    )
     if not syn_event:
         raise HTTPException(status_code=404, detail="SyntheticEvent not found")
 
     # Vor dem LLM-Aufruf prüfen ob bereits ein Entry existiert
-    existing = (
-        db.query(TickerEntry)
-        .filter(TickerEntry.synthetic_event_id == req.synthetic_event_id)
-        .first()
+    existing = next(
+        iter(
+            await AsyncTickerEntryRepository(db).get_by_synthetic_event_ids(
+                [req.synthetic_event_id]
+            )
+        ),
+        None,
     )
     if existing:
         return GenerateSyntheticResponse(
@@ -66,19 +185,12 @@ async def generate_synthetic(
             llm_provider=existing.mode,
         )
 
-    match = match_repo.get_by_id(syn_event.match_id)
-    if not match:
+    match_context = await match_context_cache.get_async(
+        db, syn_event.match_id, syn_event.minute
+    )
+    if match_context is None:
         raise HTTPException(status_code=404, detail="Match not found")
 
-    match_context = {
-        "home_team": match.home_team.name,
-        "away_team": match.away_team.name,
-        "score_home": match.score_home,
-        "score_away": match.score_away,
-        "status": match.status,
-        "minute": syn_event.minute,
-    }
-
     try:
         text, model_used = await generate_ticker_text(
             event_type=syn_event.event_type,
@@ -108,8 +220,8 @@ async def generate_synthetic(
     syn_event.ticker_style = req.style
     syn_event.auto_generated = True
 
-    db.commit()
-    db.refresh(entry)
+    await db.commit()
+    await db.refresh(entry)
 
     return GenerateSyntheticResponse(
         ticker_entry_id=entry.id,
@@ -120,6 +232,206 @@ async def generate_synthetic(
     )
 
 
+@router.post("/generate-synthetic/stream")
+async def generate_synthetic_stream(
+    req: GenerateSyntheticRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Streaming-Variante von /generate-synthetic (Server-Sent Events):
+    event: token {text} pro Teilstück, abschließend event: done mit demselben
+    Inhalt wie die Antwort von /generate-synthetic (bzw. event: error).
+    """
+    syn_event = await AsyncSyntheticEventRepository(db).get_by_id(
+        req.synthetic_event_id
+    )
+    if not syn_event:
+        raise HTTPException(status_code=404, detail="SyntheticEvent not found")
+
+    existing = next(
+        iter(
+            await AsyncTickerEntryRepository(db).get_by_synthetic_event_ids(
+                [req.synthetic_event_id]
+            )
+        ),
+        None,
+    )
+    if existing:
+        done = GenerateSyntheticResponse(
+            ticker_entry_id=existing.id,
+            synthetic_event_id=req.synthetic_event_id,
+            text=existing.text,
+            llm_model=existing.llm_model,
+            llm_provider=existing.mode,
+        )
+        return StreamingResponse(
+            iter([_sse("done", done.model_dump())]),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+
+    match_context = await match_context_cache.get_async(
+        db, syn_event.match_id, syn_event.minute
+    )
+    if match_context is None:
+        raise HTTPException(status_code=404, detail="Match not found")
+
+    stream, model_used = stream_ticker_text(
+        event_type=syn_event.event_type,
+        context_data=syn_event.context_data or {},
+        match_context=match_context,
+        style=req.style,
+        language=req.language,
+        provider=req.llm_provider,
+        model=req.llm_model,
+    )
+
+    async def store(session: AsyncSession, text: str) -> dict:
+        entry = TickerEntry(
+            match_id=syn_event.match_id,
+            synthetic_event_id=syn_event.id,
+            minute=syn_event.minute or 0,
+            text=text,
+            mode="auto",
+            style=req.style,
+            language=req.language,
+            llm_model=model_used,
+        )
+        session.add(entry)
+        target = await AsyncSyntheticEventRepository(session).get_by_id(syn_event.id)
+        if target:
+            target.ticker_text = text
+            target.ticker_style = req.style
+            target.auto_generated = True
+        await session.commit()
+        return GenerateSyntheticResponse(
+            ticker_entry_id=entry.id,
+            synthetic_event_id=syn_event.id,
+            text=text,
+            llm_model=model_used,
+            llm_provider=req.llm_provider or _provider,
+        ).model_dump()
+
+    return StreamingResponse(
+        _stream_and_store(stream, store),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.post("/generate-synthetic/batch", response_model=GenerateSyntheticBatchResponse)
+async def generate_synthetic_batch(
+    req: GenerateSyntheticBatchRequest, db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Batch-Variante von /generate-synthetic für n8n.
+    Lädt SyntheticEvents, Matches und bestehende TickerEntries mit je einer
+    Query, generiert alle fehlenden Texte parallel und speichert sie in
+    einer einzigen Transaktion. Ergebnis pro synthetic_event_id.
+    """
+    ids = list(dict.fromkeys(req.synthetic_event_ids))
+
+    syn_events = {
+        e.id: e for e in await AsyncSyntheticEventRepository(db).get_by_ids(ids)
+    }
+    existing = {
+        e.synthetic_event_id: e
+        for e in await AsyncTickerEntryRepository(db).get_by_synthetic_event_ids(ids)
+    }
+    matches = await match_context_cache.get_many_async(
+        db, list({e.match_id for e in syn_events.values()})
+    )
+
+    results: dict[int, GenerateSyntheticBatchItem] = {}
+    pending = []
+    for syn_id in ids:
+        syn_event = syn_events.get(syn_id)
+        if not syn_event:
+            results[syn_id] = GenerateSyntheticBatchItem(
+                synthetic_event_id=syn_id,
+                status="not_found",
+                error="SyntheticEvent not found",
+            )
+        elif syn_id in existing:
+            entry = existing[syn_id]
+            results[syn_id] = GenerateSyntheticBatchItem(
+                synthetic_event_id=syn_id,
+                status="existing",
+                ticker_entry_id=entry.id,
+                text=entry.text,
+                llm_model=entry.llm_model,
+                llm_provider=entry.mode,
+            )
+        elif syn_event.match_id not in matches:
+            results[syn_id] = GenerateSyntheticBatchItem(
+                synthetic_event_id=syn_id,
+                status="not_found",
+                error="Match not found",
+            )
+        else:
+            pending.append(syn_event)
+
+    # LLM-Aufrufe parallel; Parallelität begrenzt der LLMService selbst
+    generated = await asyncio.gather(
+        *[
+            generate_ticker_text(
+                event_type=e.event_type,
+                context_data=e.context_data or {},
+                match_context={**matches[e.match_id], "minute": e.minute},
+                style=req.style,
+                language=req.language,
+                provider=req.llm_provider,
+                model=req.llm_model,
+            )
+            for e in pending
+        ],
+        return_exceptions=True,
+    )
+
+    created: list[tuple[SyntheticEventModel, TickerEntry]] = []
+    for syn_event, outcome in zip(pending, generated):
+        if isinstance(outcome, Exception):
+            results[syn_event.id] = GenerateSyntheticBatchItem(
+                synthetic_event_id=syn_event.id,
+                status="error",
+                error=f"LLM error: {str(outcome)}",
+            )
+            continue
+
+        text, model_used = outcome
+        entry = TickerEntry(
+            match_id=syn_event.match_id,
+            synthetic_event_id=syn_event.id,
+            minute=syn_event.minute or 0,
+            text=text,
+            mode="auto",
+            style=req.style,
+            language=req.language,
+            llm_model=model_used,
+        )
+        db.add(entry)
+
+        syn_event.ticker_text = text
+        syn_event.ticker_style = req.style
+        syn_event.auto_generated = True
+        created.append((syn_event, entry))
+
+    if created:
+        # flush vergibt die IDs, danach ein einziger Commit für alle Einträge
+        await db.flush()
+        for syn_event, entry in created:
+            results[syn_event.id] = GenerateSyntheticBatchItem(
+                synthetic_event_id=syn_event.id,
+                status="created",
+                ticker_entry_id=entry.id,
+                text=entry.text,
+                llm_model=entry.llm_model,
+                llm_provider=req.llm_provider or _provider,
+            )
+        await db.commit()
+
+    return GenerateSyntheticBatchResponse(results=[results[i] for i in ids])
+
+
 @router.get(
     "/match/{match_id}/prematch", response_model=list[GenerateSyntheticResponse]
 )
@@ -133,15 +445,7 @@ def get_prematch_entries(match_id: int, db: Session = Depends(get_db)):
         )
         .filter(
             TickerEntry.match_id == match_id,
-            SyntheticEventModel.event_type.in_(
-                [
-                    "pre_match_prediction",
-                    "pre_match_injuries",
-                    "pre_match_h2h",
-                    "pre_match_team_stats",
-                    "pre_match_standings",
-                ]
-            ),
+            SyntheticEventModel.event_type.in_(PREMATCH_EVENT_TYPES),
         )
         .all()
     )
@@ -168,7 +472,7 @@ def get_live_entries(match_id: int, db: Session = Depends(get_db)):
         )
         .filter(
             TickerEntry.match_id == match_id,
-            SyntheticEventModel.event_type == "live_stats_update",
+            SyntheticEventModel.event_type == LIVE_STATS_EVENT_TYPE,
         )
         .order_by(TickerEntry.created_at.desc())
         .all()
@@ -187,15 +491,13 @@ def get_live_entries(match_id: int, db: Session = Depends(get_db)):
 
 @router.post("/generate/{event_id}")
 async def generate_for_event(
-    event_id: int, style: str = "neutral", db: Session = Depends(get_db)
+    event_id: int, style: str = "neutral", db: AsyncSession = Depends(get_async_db)
 ):
-    from app.models.event import Event
-
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = await AsyncEventRepository(db).get_by_id(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    existing = db.query(TickerEntry).filter(TickerEntry.event_id == event_id).first()
+    existing = await AsyncTickerEntryRepository(db).get_by_event(event_id)
     if existing:
         return {
             "ticker_entry_id": existing.id,
@@ -203,15 +505,9 @@ async def generate_for_event(
             "llm_model": existing.llm_model,
         }
 
-    match = db.query(Match).filter(Match.id == event.match_id).first()
-    match_context = {
-        "home_team": match.home_team.name,
-        "away_team": match.away_team.name,
-        "score_home": match.score_home,
-        "score_away": match.score_away,
-        "status": match.status,
-        "minute": event.minute,
-    }
+    match_context = await match_context_cache.get_async(
+        db, event.match_id, event.minute
+    )
 
     try:
         text, model_used = await generate_ticker_text(
@@ -237,7 +533,7 @@ async def generate_for_event(
         llm_model=model_used,
     )
     db.add(entry)
-    db.commit()
-    db.refresh(entry)
+    await db.commit()
+    await db.refresh(entry)
 
     return {"ticker_entry_id": entry.id, "text": text, "llm_model": model_used}
@@ -4,18 +4,32 @@ GET /api/v1/ticker - Liste aller Ticker-Einträge
 GET /api/v1/ticker/match/{match_id} - Ticker für ein Match
 POST /api/v1/ticker - Neuer Ticker-Eintrag
 POST /api/v1/ticker/generate/{event_id} - Auto-Generierung
+POST /api/v1/ticker/generate/{event_id}/stream - dito als Server-Sent Events
 POST /api/v1/ticker/{id}/publish - Eintrag veröffentlichen
+
+GET /ticker/match/{match_id}?since_id= liefert neu angelegte Einträge, ?since=
+alle neuen, bearbeiteten und nachträglich veröffentlichten (siehe
+app.core.cursor). Der nächste Cursor (gleiche Art) steht im Header
+X-Next-Cursor; mit published_only nur ?since=.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.api.v1.ticker import SSE_HEADERS, _stream_and_store
+from app.core.cursor import format_since, parse_since
+from app.core.database import get_db, get_async_db
+from app.core.http_cache import last_modified_of, set_cache_policy
 from app.repositories.ticker_entry_repository import TickerEntryRepository
-from app.repositories.event_repository import EventRepository
-from app.repositories.team_repository import TeamRepository
+from app.repositories.async_repositories import (
+    AsyncEventRepository,
+    AsyncTeamRepository,
+    AsyncTickerEntryRepository,
+)
 from app.schemas.ticker_entry import TickerEntry, TickerEntryCreate, TickerEntryUpdate
-from app.services.llm_service import llm_service
+from app.services.llm_router import llm_router
 
 router = APIRouter(prefix="/ticker", tags=["ticker"])
 
@@ -36,15 +50,39 @@ def get_ticker_entries(
 @router.get("/match/{match_id}", response_model=list[TickerEntry])
 def get_match_ticker(
     match_id: int,
+    request: Request,
+    response: Response,
     published_only: bool = Query(False),
     skip: int = 0,
     limit: int = 100,
+    since_id: int | None = Query(None),
+    since: str | None = Query(None, description="Zeitpunkt bzw. X-Next-Cursor"),
     db: Session = Depends(get_db),
 ):
     repo = TickerEntryRepository(db)
-    if published_only:
-        return repo.get_published(match_id)
-    return repo.get_by_match(match_id, skip=skip, limit=limit)
+    if since is not None:
+        stamp, after_id = parse_since(since)
+        entries = repo.get_by_match_changed(
+            match_id, stamp, after_id, limit=limit, published_only=published_only
+        )
+        response.headers["X-Next-Cursor"] = (
+            format_since(entries[-1].updated_at, entries[-1].id) if entries else since
+        )
+    elif since_id is not None:
+        if published_only:
+            # Entwürfe werden oft erst nach jüngeren Einträgen veröffentlicht,
+            # ein ID-Cursor wäre dann schon darüber hinweg
+            raise HTTPException(
+                status_code=400, detail="Use since= together with published_only"
+            )
+        entries = repo.get_by_match_since(match_id, since_id, limit=limit)
+        response.headers["X-Next-Cursor"] = str(entries[-1].id if entries else since_id)
+    elif published_only:
+        entries = repo.get_published(match_id)
+    else:
+        entries = repo.get_by_match(match_id, skip=skip, limit=limit)
+    set_cache_policy(request, "revalidate", last_modified=last_modified_of(entries))
+    return entries
 
 
 @router.get("/{entry_id}", response_model=TickerEntry)
@@ -62,25 +100,16 @@ def create_ticker_entry(entry: TickerEntryCreate, db: Session = Depends(get_db))
     return repo.create(entry)
 
 
-@router.post("/generate/{event_id}", response_model=TickerEntry, status_code=201)
-def generate_ticker_for_event(
-    event_id: int,
-    style: str = Query("neutral", pattern="^(neutral|euphorisch|kritisch)$"),
-    mode: str = Query("auto", pattern="^(auto|hybrid|manual)$"),
-    db: Session = Depends(get_db),
-):
-    event_repo = EventRepository(db)
-    team_repo = TeamRepository(db)
-    ticker_repo = TickerEntryRepository(db)
-
-    event = event_repo.get_by_id(event_id)
+async def _event_generation(db: AsyncSession, event_id: int, style: str) -> dict:
+    """LLM-Argumente für ein Event: Team des Events (nicht das Heimteam),
+    bei Toren context_data, damit _build_context_str greift."""
+    event = await AsyncEventRepository(db).get_by_id(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    team = team_repo.get_by_id(event.team_id)
+    team = await AsyncTeamRepository(db).get_by_id(event.team_id)
     team_name = team.name if team else "Unknown Team"
 
-    # context_data für Goal-Events befüllen, damit _build_context_str greift
     context_data = None
     if event.type in ("Goal", "goal"):
         context_data = {
@@ -89,29 +118,81 @@ def generate_ticker_for_event(
             "team_name": team_name,
         }
 
-    generated_text = llm_service.generate_ticker_text(
-        event_type=event.type,
-        event_detail=event.detail,
-        minute=event.minute,
-        player_name=event.player_name,
-        assist_name=event.assist_name,
-        team_name=team_name,
-        style=style,
-        context_data=context_data,
-    )
-
-    ticker_data = TickerEntryCreate(
+    return {
+        "event": event,
+        "kwargs": dict(
+            event_type=event.type,
+            event_detail=event.detail,
+            minute=event.minute,
+            player_name=event.player_name,
+            assist_name=event.assist_name,
+            team_name=team_name,
+            style=style,
+            context_data=context_data,
+        ),
+    }
+
+
+def _ticker_entry_data(
+    event, text: str, mode: str, style: str, backend
+) -> TickerEntryCreate:
+    return TickerEntryCreate(
         match_id=event.match_id,
         event_id=event.id,
         minute=event.minute,
-        text=generated_text,
+        text=text,
         mode=mode,
         style=style,
         language="de",
-        llm_model="mock" if llm_service.provider == "mock" else llm_service.provider,
+        llm_model=(
+            backend.model_label if backend is llm_router.fallback else backend.provider
+        ),
     )
 
-    return ticker_repo.create(ticker_data)
+
+@router.post("/generate/{event_id}", response_model=TickerEntry, status_code=201)
+async def generate_ticker_for_event(
+    event_id: int,
+    style: str = Query("neutral", pattern="^(neutral|euphorisch|kritisch)$"),
+    mode: str = Query("auto", pattern="^(auto|hybrid|manual)$"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    generation = await _event_generation(db, event_id, style)
+    generated_text, backend = await llm_router.generate(**generation["kwargs"])
+
+    ticker_data = _ticker_entry_data(
+        generation["event"], generated_text, mode, style, backend
+    )
+    return await AsyncTickerEntryRepository(db).create(ticker_data)
+
+
+@router.post("/generate/{event_id}/stream")
+async def generate_ticker_for_event_stream(
+    event_id: int,
+    style: str = Query("neutral", pattern="^(neutral|euphorisch|kritisch)$"),
+    mode: str = Query("auto", pattern="^(auto|hybrid|manual)$"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Streaming-Variante von /generate/{event_id} (Server-Sent Events):
+    event: token {text} pro Teilstück, abschließend event: done mit dem
+    gespeicherten TickerEntry (bzw. event: error).
+    """
+    generation = await _event_generation(db, event_id, style)
+    event = generation["event"]
+    stream, backend = llm_router.stream(**generation["kwargs"])
+
+    async def store(session: AsyncSession, text: str) -> dict:
+        entry = await AsyncTickerEntryRepository(session).create(
+            _ticker_entry_data(event, text, mode, style, backend)
+        )
+        return TickerEntry.model_validate(entry).model_dump(mode="json")
+
+    return StreamingResponse(
+        _stream_and_store(stream, store),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
 
 
 @router.post("/{entry_id}/publish", response_model=TickerEntry)
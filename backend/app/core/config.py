@@ -23,6 +23,7 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
+    ASYNC_DATABASE_URL: Optional[str] = None  # Standard: aus DATABASE_URL (asyncpg)
 
     # API Keys
     API_FOOTBALL_KEY: Optional[str] = None
@@ -42,10 +43,74 @@ class Settings(BaseSettings):
     LLM_TEMPERATURE: float = 0.7
     LLM_MAX_TOKENS: int = 100
     OPENROUTER_MODEL: Optional[str] = "google/gemini-2.0-flash-lite"
+    LLM_MAX_CONCURRENCY: int = 20  # gleichzeitige Provider-Aufrufe
+    LLM_TIMEOUT_SECONDS: float = 15.0
+    LLM_HTTP_MAX_CONNECTIONS: int = 50
+    LLM_HTTP_MAX_KEEPALIVE: int = 20
+    LLM_MOCK_LATENCY_MS: int = 0  # simulierte Latenz im Mock-Modus (Lasttests)
+    LLM_MOCK_STREAM_CHUNK_MS: int = 30  # Pause pro Wort im simulierten Stream
+
+    # LLM Routing (mehrere Provider, Hedging)
+    LLM_PROVIDERS: Optional[
+        str
+    ] = None  # z.B. "openrouter,gemini" / "mock:200,mock:1500"
+    LLM_HEDGE_ENABLED: bool = True
+    LLM_HEDGE_AFTER_MS: int = 1500  # Hedge-Schwelle bis genug Messwerte vorliegen
+    LLM_HEDGE_PERCENTILE: float = 95.0  # danach: dieses Perzentil des 1. Backends
+    LLM_HEDGE_MIN_MS: int = 150
+    LLM_ADAPTIVE_TIMEOUT_FACTOR: float = 2.0  # Timeout = p95 × Faktor
+    LLM_ADAPTIVE_TIMEOUT_MIN_MS: int = 1000  # max. bleibt LLM_TIMEOUT_SECONDS
+    LLM_FALLBACK_ENABLED: bool = True  # Template-Text, wenn kein Provider antwortet
+
+    # Template-Fast-Path: Events ohne LLM-Aufruf ("Typ" oder "Typ:Detail")
+    TICKER_TEMPLATES_ENABLED: bool = True
+    TICKER_TEMPLATE_EVENTS: str = "Card:Yellow Card,subst,Var,live_stats_update"
+
+    # Match-Kontext-Cache für die Ticker-Generierung
+    MATCH_CONTEXT_CACHE_MAX_SIZE: int = 500
+    MATCH_CONTEXT_CACHE_TTL_SECONDS: float = 30.0  # Schutz vor fremden Schreibzugriffen
+
+    # Stammdaten-Cache (Teams, Ligen, Seasons, LeagueSeasons)
+    REFERENCE_CACHE_TTL_SECONDS: float = 300.0
+    REFERENCE_CACHE_MAX_AGE_SECONDS: int = 60  # Cache-Control max-age für Clients
+    REFERENCE_CACHE_MAX_SIZE: int = 1000
+    REFERENCE_CACHE_IMPORT_SECONDS: int = 300  # nach Import-Trigger nicht cachen
+
+    # HTTP-Caching (ETag / 304) für GET-Routes
+    HTTP_CACHE_ENABLED: bool = True
+
+    # LLM Circuit Breaker (pro Provider)
+    LLM_BREAKER_ENABLED: bool = True
+    LLM_BREAKER_WINDOW: int = 20  # letzte Aufrufe
+    LLM_BREAKER_MIN_CALLS: int = 5
+    LLM_BREAKER_ERROR_RATE: float = 0.5
+    LLM_BREAKER_SLOW_CALL_MS: int = 5000
+    LLM_BREAKER_SLOW_RATE: float = 0.8
+    LLM_BREAKER_OPEN_SECONDS: float = 30.0
+
+    # LLM Job Queue (Tabelle llm_jobs, SKIP LOCKED)
+    LLM_JOB_WORKERS: int = 4  # pro Prozess, 0 = keine Worker
+    LLM_JOB_LIVE_WORKERS: int = 1  # davon nur für Live-Jobs reserviert
+    LLM_JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    LLM_JOB_MAX_ATTEMPTS: int = 3
+    LLM_JOB_RETRY_BASE_SECONDS: float = 2.0
+    LLM_JOB_RETRY_MAX_SECONDS: float = 60.0
+    LLM_JOB_LOCK_TIMEOUT_SECONDS: float = 120.0
+    LLM_JOB_MAX_QUEUED: int = 500  # darüber werden Vorbericht-Jobs abgelehnt
+
+    # LLM Cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_SIZE: int = 1000
+    LLM_CACHE_TTL_SECONDS: int = 3600
+    LLM_CACHE_PERSISTENT: bool = False  # zusätzlich in Tabelle llm_cache
+    LLM_CACHE_PURGE_INTERVAL_SECONDS: float = 3600  # abgelaufene Zeilen löschen
 
     # API-Football Settings
     API_FOOTBALL_BASE_URL: str = "https://v3.football.api-sports.io"
-    API_FOOTBALL_RATE_LIMIT: int = 100
+    API_FOOTBALL_RATE_LIMIT: int = 100  # Requests pro Minute
+    API_FOOTBALL_TIMEOUT_SECONDS: float = 10.0
+    API_FOOTBALL_MAX_CONNECTIONS: int = 10
+    INGESTION_MODE: str = "n8n"  # n8n | native (Import direkt im Backend)
 
     # n8n Webhooks
     N8N_WEBHOOK_LINEUP: str = "http://localhost:5678/webhook/lineups"
@@ -60,6 +125,23 @@ class Settings(BaseSettings):
     )
     N8N_WEBHOOK_MATCHES: str = "http://localhost:5678/webhook/import-matches"
     N8N_WEBHOOK_COUNTRY: str = "http://localhost:5678/webhook/import-country"
+    IMPORT_COOLDOWN_SECONDS: int = 120  # min. Abstand gleicher Match-Imports
+    IMPORT_COOLDOWN_BACKEND: str = "memory"  # memory | postgres (über Worker geteilt)
+    IMPORT_COOLDOWN_MAX_KEYS: int = 10000
+
+    # Metriken (/metrics, Prometheus) und Profiling pro Request
+    METRICS_ENABLED: bool = True
+    PROFILING_ENABLED: bool = False  # nur Dev/Staging: Header PROFILING_HEADER
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_TOKEN: Optional[str] = None  # wenn gesetzt: Header-Wert muss passen
+    PROFILING_DIR: str = "/tmp/liveticker-profiles"
+    PROFILING_INTERVAL_MS: float = 1.0  # Sampling-Intervall
+
+    # N+1-Erkennung und Query-Budgets (Entwicklung / Tests)
+    QUERY_INSPECTOR_ENABLED: bool = False
+    QUERY_INSPECTOR_N_PLUS_ONE_THRESHOLD: int = 3  # gleiche Relationship lazy
+    QUERY_INSPECTOR_DEFAULT_BUDGET: Optional[int] = None  # Statements pro Request
+    QUERY_INSPECTOR_STRICT: bool = False  # Exception statt Warnung (Tests)
 
     model_config = SettingsConfigDict(
         env_file=".env",
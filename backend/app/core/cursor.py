@@ -0,0 +1,34 @@
+# app/core/cursor.py
+"""
+Polling-Cursor für inkrementelle Listen (Events, Ticker-Einträge).
+
+Zwei Arten, X-Next-Cursor hat immer die Art, die der Client geschickt hat:
+
+- since_id=<id>: nur neu angelegte Zeilen (id > since_id). Sieht keine
+  Änderungen an bereits gelieferten Zeilen.
+- since=<Zeitpunkt>[,<id>]: alle Zeilen, die nach dem Cursor angelegt oder
+  geändert wurden (Keyset auf updated_at, id). Auch Korrekturen per Upsert
+  und nachträglich veröffentlichte Entwürfe kommen so erneut bzw. neu an.
+  Der erste Aufruf schickt nur den Zeitpunkt, danach den Header-Wert.
+"""
+
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+
+
+def parse_since(value: str) -> tuple[datetime, int]:
+    """'2026-10-18T12:00:00Z' bzw. '2026-10-18T12:00:00.123456Z,42'."""
+    stamp, _, after_id = value.partition(",")
+    try:
+        return datetime.fromisoformat(stamp.strip()), int(after_id or 0)
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid since cursor: {value}")
+
+
+def format_since(updated_at: datetime, row_id: int) -> str:
+    if updated_at.tzinfo is not None:
+        stamp = updated_at.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    else:
+        stamp = updated_at.isoformat()
+    return f"{stamp},{row_id}"
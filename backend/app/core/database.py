@@ -8,26 +8,57 @@ Features:
 - Automatic reconnect
 - Session management
 - Type hints
+- Async Engine (asyncpg) + AsyncSession für async Routes; die sync Engine
+  bleibt für Alembic, Skripte und sync Routes (Threadpool)
 
 Author: Jonas Kimmer
 Date: 2025-02-14
 """
 
 import logging
-from typing import Generator
+import time
+from typing import AsyncGenerator, Generator, Optional
 from sqlalchemy import create_engine, event, Engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from app.core import metrics, query_inspector
 from app.core.config import settings
 
 # Logger
 logger = logging.getLogger(__name__)
 
+
+class _TimedQueuePool(QueuePool):
+    """QueuePool mit Messung der Checkout-Wartezeit (db_pool_checkout_wait)."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.db_pool_wait.observe(time.perf_counter() - started, "sync")
+
+
+class _TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.db_pool_wait.observe(time.perf_counter() - started, "async")
+
+
 # SQLAlchemy Engine
 engine = create_engine(
     settings.DATABASE_URL,
-    poolclass=QueuePool,
+    poolclass=_TimedQueuePool,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,  # Test connections before using
@@ -45,6 +76,62 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+# Async Engine (asyncpg) – wird erst beim ersten Zugriff erstellt, damit
+# Alembic und Skripte ohne asyncpg auskommen
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def _to_async_url(url: str) -> str:
+    """postgresql:// bzw. postgresql+psycopg2:// → postgresql+asyncpg://"""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix) :]
+    return url
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.ASYNC_DATABASE_URL or _to_async_url(settings.DATABASE_URL),
+            poolclass=_TimedAsyncQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+            echo=settings.DEBUG,
+        )
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    AsyncSession Factory.
+
+    sync_session_class=SessionLocal.class_ übernimmt die Session-Events von
+    SessionLocal (z.B. Live-Push), expire_on_commit=False verhindert Lazy
+    Loads nach dem Commit (in async nicht erlaubt).
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            sync_session_class=SessionLocal.class_,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Schließt den async Connection Pool (Shutdown)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+
 # Event Listeners (für Logging & Debugging)
 @event.listens_for(Engine, "connect")
 def receive_connect(dbapi_conn, connection_record):
@@ -58,6 +145,31 @@ def receive_close(dbapi_conn, connection_record):
     logger.debug("Database connection closed")
 
 
+# Query-Zeit für /metrics. Die Startzeit liegt am ExecutionContext des
+# Statements: verschachtelte Queries (Listener, die selbst eine Query
+# absetzen) haben ihren eigenen Context, und wirft ein Statement, bleibt in
+# conn.info nichts liegen (after_cursor_execute kommt dann nicht)
+@event.listens_for(Engine, "before_cursor_execute")
+def receive_before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    context._query_start = time.perf_counter()
+    query_inspector.record_statement(statement)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def receive_after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    metrics.record_query(time.perf_counter() - context._query_start)
+
+
+# Lazy Loads für die N+1-Erkennung (gilt für alle Sessions, auch async)
+@event.listens_for(Session, "do_orm_execute")
+def receive_do_orm_execute(orm_execute_state):
+    query_inspector.record_orm_execute(orm_execute_state)
+
+
 # Dependency für FastAPI
 def get_db() -> Generator[Session, None, None]:
     """
@@ -78,6 +190,19 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async Database Dependency für async Routes.
+
+    Usage:
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int, db: AsyncSession = Depends(get_async_db)):
+            return await AsyncItemRepository(db).get_by_id(item_id)
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
 # Health Check
 def check_database_connection() -> bool:
     """
@@ -0,0 +1,193 @@
+# app/core/http_cache.py
+"""
+HTTP-Caching für GET-Routes: ETag, Last-Modified, Cache-Control und 304.
+
+Reine ASGI-Middleware (kein BaseHTTPMiddleware), SSE-Streams und andere
+Nicht-JSON-Antworten laufen unverändert durch.
+
+- JSON-Antworten (200) ohne eigenen ETag werden gepuffert und bekommen
+  einen schwachen ETag (SHA-1 des Bodys). Passt If-None-Match, geht statt
+  des Bodys ein 304 raus; Polling-Clients sparen so die komplette Antwort.
+- If-Modified-Since wird ausgewertet, wenn die Antwort Last-Modified trägt
+  (und kein If-None-Match gesendet wurde).
+- Cache-Policy pro Route: Regex-Regeln auf den Pfad, oder per
+  set_cache_policy() aus dem Endpoint (hat Vorrang). Routes mit eigenem
+  ETag (Snapshot, Stammdaten-Cache) behalten ihren Cache-Control, solange
+  der Endpoint keine Policy setzt.
+- Last-Modified: Endpoints übergeben max(updated_at) ihrer Daten an
+  set_cache_policy (last_modified_of). Kein "immutable": Match-Ansichten,
+  Ticker und Events ändern sich auch nach Abpfiff noch (Korrekturen,
+  veröffentlichte Entwürfe, Lineups, Statistiken).
+"""
+
+import hashlib
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Pfad-Regeln (erste passende gewinnt), sonst DEFAULT_POLICY
+DEFAULT_ROUTE_POLICIES: tuple[tuple[str, str], ...] = (
+    (r"^/api/v1/favorites", "private"),  # userbezogen
+    (r"^/api/v1/live/", "no-store"),  # SSE, Subscriber-Zähler
+    (r"^/api/v1/ingestion/", "no-store"),
+    (r"^/api/v1/ticker/(jobs|llm-)", "no-store"),  # Betriebsstatistiken
+    (r"^/(health|metrics)?$", "no-store"),
+)
+DEFAULT_POLICY = "revalidate"
+
+
+def set_cache_policy(
+    request: Request, policy: str, last_modified: Optional[datetime] = None
+) -> None:
+    """Cache-Policy für die aktuelle Antwort (überschreibt die Pfad-Regeln)."""
+    request.state.cache_policy = policy
+    if last_modified is not None:
+        request.state.last_modified = last_modified
+
+
+def last_modified_of(items: Iterable[Any]) -> Optional[datetime]:
+    """
+    Jüngstes updated_at (bzw. created_at, solange nie geändert) der Zeilen.
+    None, wenn eine Zeile kein updated_at hat – dann wäre Last-Modified
+    geraten und If-Modified-Since lieferte falsche 304.
+    """
+    stamps = []
+    for item in items:
+        if not hasattr(item, "updated_at"):
+            return None
+        stamp = item.updated_at or getattr(item, "created_at", None)
+        if stamp is None:
+            return None
+        stamps.append(stamp)
+    return max(stamps, default=None)
+
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified_since(last_modified: str, if_modified_since: str) -> bool:
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+class HTTPCacheMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        route_policies: tuple[tuple[str, str], ...] = DEFAULT_ROUTE_POLICIES,
+        default_policy: str = DEFAULT_POLICY,
+        max_body_bytes: int = 2_000_000,
+    ):
+        self.app = app
+        self.route_policies = [(re.compile(p), policy) for p, policy in route_policies]
+        self.default_policy = default_policy
+        self.max_body_bytes = max_body_bytes
+        self.cache_control = {
+            "no-store": "no-store",
+            "private": "private, no-cache",
+            "revalidate": "no-cache",
+        }
+
+    def _path_policy(self, path: str) -> str:
+        for pattern, policy in self.route_policies:
+            if pattern.search(path):
+                return policy
+        return self.default_policy
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        path_policy = self._path_policy(scope["path"])
+        start: Optional[Message] = None
+        chunks: list[bytes] = []
+        size = 0
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, size, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                state = scope.get("state", {})
+                route_policy = state.get("cache_policy")
+                policy = route_policy or path_policy
+                if route_policy or "cache-control" not in headers:
+                    headers["Cache-Control"] = self.cache_control[policy]
+                if state.get("last_modified") and "last-modified" not in headers:
+                    headers["Last-Modified"] = http_date(state["last_modified"])
+
+                cacheable = (
+                    message["status"] == 200
+                    and policy != "no-store"
+                    and "etag" not in headers
+                    and headers.get("content-type", "").startswith("application/json")
+                )
+                if not cacheable:
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+
+            # http.response.body
+            chunks.append(message.get("body", b""))
+            size += len(chunks[-1])
+            if size > self.max_body_bytes:
+                # zu groß zum Puffern: ohne ETag weiterstreamen
+                passthrough = True
+                await send(start)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": b"".join(chunks),
+                        "more_body": message.get("more_body", False),
+                    }
+                )
+                return
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            headers = MutableHeaders(scope=start)
+            etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+            headers["ETag"] = etag
+
+            if_none_match = request_headers.get("if-none-match")
+            if_modified_since = request_headers.get("if-modified-since")
+            if if_none_match is not None:
+                not_modified = etag in if_none_match or if_none_match.strip() == "*"
+            else:
+                not_modified = bool(
+                    if_modified_since
+                    and "last-modified" in headers
+                    and not_modified_since(headers["last-modified"], if_modified_since)
+                )
+
+            if not_modified:
+                del headers["content-length"]
+                del headers["content-type"]
+                await send({**start, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
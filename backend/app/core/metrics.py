@@ -0,0 +1,267 @@
+# app/core/metrics.py
+"""
+Prometheus-Metriken (GET /metrics, Text-Format 0.0.4).
+
+Bewusst ohne prometheus_client: ein kleines Registry mit Countern und
+Histogrammen reicht, prozesslokal (bei mehreren uvicorn-Workern pro Worker
+scrapen). Erfasst:
+
+- HTTP: Latenz pro Route-Template, Methode und Status (MetricsMiddleware)
+- DB: Queries und Query-Zeit pro Request (Cursor-Events, siehe database.py),
+  Wartezeit auf eine Connection aus dem Pool
+- LLM: Latenz und Tokens pro Provider und Modell (LLMService)
+- Webhooks / Importe: geplante, übersprungene und ausgeführte Aufrufe
+  (ImportScheduler)
+"""
+
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Iterable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0.0)
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # Labels → [Zähler pro Bucket (nicht kumuliert) + +Inf, Summe]
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labels) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def collect(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = [
+                (labels, list(counts), total)
+                for labels, (counts, total) in self._series.items()
+            ]
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket_labels = _labels(self.labelnames, labels, f'le="{le}"')
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = [line for metric in self._metrics for line in metric.collect()]
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# HTTP
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP-Latenz pro Route",
+        ("method", "route", "status"),
+    )
+)
+
+# DB
+db_queries_per_request = registry.register(
+    Histogram(
+        "db_queries_per_request",
+        "SQL-Statements pro Request",
+        ("route",),
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+db_query_seconds_per_request = registry.register(
+    Histogram(
+        "db_query_seconds_per_request",
+        "Summe der Query-Zeit pro Request",
+        ("route",),
+    )
+)
+db_queries = registry.register(
+    Counter("db_queries_total", "Alle SQL-Statements (auch außerhalb von Requests)")
+)
+db_pool_wait = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Wartezeit auf eine Connection aus dem Pool",
+        ("pool",),
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+
+# LLM
+llm_request_duration = registry.register(
+    Histogram(
+        "llm_request_duration_seconds",
+        "Latenz der Provider-Aufrufe",
+        ("provider", "model", "outcome"),
+        buckets=LLM_BUCKETS,
+    )
+)
+llm_tokens = registry.register(
+    Counter(
+        "llm_tokens_total",
+        "Tokens laut Provider (prompt / completion)",
+        ("provider", "model", "kind"),
+    )
+)
+
+# Webhooks / Importe
+webhook_triggers = registry.register(
+    Counter(
+        "webhook_triggers_total",
+        "Import-Trigger: scheduled, in_flight, cooldown",
+        ("kind", "result"),
+    )
+)
+webhook_runs = registry.register(
+    Counter("webhook_runs_total", "Ausgeführte Importe: ok, error", ("kind", "result"))
+)
+
+
+# ── DB-Statistik pro Request ─────────────────────────────
+
+
+class RequestStats:
+    __slots__ = ("queries", "query_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+# Gesetzt von der Middleware; sync Routes (Threadpool) und AsyncSession.run_sync
+# erben den Context, die Cursor-Events zählen also in den richtigen Request
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def record_query(seconds: float) -> None:
+    """Aufruf aus after_cursor_execute."""
+    db_queries.inc()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += seconds
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    # nicht gematchte Pfade zusammenfassen (sonst beliebig viele Label-Werte)
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Reine ASGI-Middleware: Latenz und DB-Statistik pro Request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            route = _route_template(scope)
+            http_request_duration.observe(
+                time.perf_counter() - started, scope["method"], route, str(status)
+            )
+            db_queries_per_request.observe(stats.queries, route)
+            db_query_seconds_per_request.observe(stats.query_seconds, route)
@@ -0,0 +1,145 @@
+# app/core/profiler.py
+"""
+Opt-in Profiler pro Request (PROFILING_ENABLED, Header PROFILING_HEADER).
+
+Sampling statt cProfile: die meisten Routes sind sync und laufen im
+Threadpool, cProfile sähe nur den Event-Loop-Thread. Der Sampler liest
+während des Requests alle PROFILING_INTERVAL_MS die Stacks des Loop-Threads
+und der Threadpool-Worker (sys._current_frames) und schreibt sie als
+Collapsed Stacks nach PROFILING_DIR – direkt ladbar in speedscope oder
+flamegraph.pl. Es läuft immer nur ein Profil gleichzeitig; parallele
+Requests landen mit im Profil, daher auf einer ruhigen Instanz nutzen.
+
+Die Antwort trägt X-Profile-File sowie Server-Timing mit Gesamt- und
+DB-Zeit (Cursor-Events, siehe metrics).
+"""
+
+import os
+import queue
+import selectors
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import current_request_stats
+
+_WORKER_PREFIX = "AnyIO worker thread"
+# Leerlauf: Worker wartet auf Arbeit, Event-Loop im select
+_IDLE = {(queue.__file__, "get"), (selectors.__file__, "select")}
+_MAX_DEPTH = 128
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+class StackSampler:
+    """Sammelt Stacks ausgewählter Threads in einem Hintergrund-Thread."""
+
+    def __init__(self, thread_ids: set[int], interval: float = 0.001):
+        self.thread_ids = thread_ids
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _threads(self) -> set[int]:
+        workers = {
+            t.ident for t in threading.enumerate() if t.name.startswith(_WORKER_PREFIX)
+        }
+        return self.thread_ids | workers
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in self._threads():
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None and len(stack) < _MAX_DEPTH:
+                    if (frame.f_code.co_filename, frame.f_code.co_name) in _IDLE:
+                        stack = []
+                        break
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                if stack:
+                    self.samples[";".join(reversed(stack))] += 1
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.items())
+
+
+class ProfilerMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        header: str = "X-Profile",
+        token: Optional[str] = None,
+        output_dir: str = "/tmp/liveticker-profiles",
+        interval_ms: float = 1.0,
+    ):
+        self.app = app
+        self.header = header.lower()
+        self.token = token
+        self.output_dir = output_dir
+        self.interval = interval_ms / 1000
+        self._busy = threading.Lock()
+
+    def _wanted(self, scope: Scope) -> bool:
+        value = Headers(scope=scope).get(self.header)
+        if value is None:
+            return False
+        return self.token is None or value == self.token
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self._wanted(scope)
+            or not self._busy.acquire(blocking=False)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        slug = scope["path"].strip("/").replace("/", "_") or "root"
+        path = os.path.join(self.output_dir, f"{stamp}-{slug}.folded")
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Profile-File"] = os.path.basename(path)
+                stats = current_request_stats()
+                timing = [f"app;dur={(time.perf_counter() - started) * 1000:.1f}"]
+                if stats is not None:
+                    timing.append(
+                        f'db;dur={stats.query_seconds * 1000:.1f};desc="{stats.queries} queries"'
+                    )
+                headers.append("Server-Timing", ", ".join(timing))
+            await send(message)
+
+        sampler = StackSampler({threading.get_ident()}, self.interval)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            self._busy.release()
+            with open(path, "w") as f:
+                f.write(sampler.collapsed())
@@ -0,0 +1,169 @@
+# app/core/query_inspector.py
+"""
+N+1-Erkennung und Query-Budgets pro Request (Entwicklung und Tests).
+
+Mit QUERY_INSPECTOR_ENABLED protokolliert QueryInspectorMiddleware alle
+SQL-Statements eines Requests (Cursor-Events, siehe database.py) sowie die
+Lazy Loads von Relationships (Session-Event do_orm_execute). Auffällig ist:
+
+- ein Lazy Load derselben Relationship ab QUERY_INSPECTOR_N_PLUS_ONE_THRESHOLD
+  Mal (klassisches N+1: fehlendes joinedload beim Serialisieren),
+- ein Request mit mehr Statements als sein Budget (query_budget als
+  Route-Dependency, sonst QUERY_INSPECTOR_DEFAULT_BUDGET).
+
+Standard ist eine Warnung im Log plus X-Query-Count im Response. Mit
+QUERY_INSPECTOR_STRICT wirft die Middleware nach dem Response
+QueryBudgetExceeded – TestClient bzw. httpx.ASGITransport reichen die
+Exception an den Test durch. Für Assertions pro Request:
+
+    with capture_queries() as logs:
+        client.get("/api/v1/favorites/matches?user_id=1")
+    assert logs[0].count <= 3
+"""
+
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Request über Budget oder mit N+1-Lazy-Loads (nur im Strict-Modus)."""
+
+
+class QueryLog:
+    """Statements und Lazy Loads eines Requests."""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.budget: Optional[int] = None
+        self.statements: Counter = Counter()
+        self.lazy_loads: Counter = Counter()
+
+    @property
+    def count(self) -> int:
+        return sum(self.statements.values())
+
+    def repeated_lazy_loads(self, threshold: int) -> dict[str, int]:
+        return {rel: n for rel, n in self.lazy_loads.items() if n >= threshold}
+
+    def problems(self, threshold: int, default_budget: Optional[int]) -> list[str]:
+        found = [
+            f"N+1: {rel} lazy-loaded {n}x"
+            for rel, n in self.repeated_lazy_loads(threshold).items()
+        ]
+        budget = self.budget if self.budget is not None else default_budget
+        if budget is not None and self.count > budget:
+            found.append(f"{self.count} queries, budget {budget}")
+        return found
+
+
+# Gesetzt von der Middleware; sync Routes (Threadpool) erben den Context
+_current_log: ContextVar[Optional[QueryLog]] = ContextVar("query_log", default=None)
+
+# Offene capture_queries-Blöcke (Tests laufen in einem anderen Thread als die App)
+_captures: list[list[QueryLog]] = []
+_captures_lock = threading.Lock()
+
+
+def record_statement(statement: str) -> None:
+    """Aufruf aus before_cursor_execute."""
+    log = _current_log.get()
+    if log is not None:
+        log.statements[statement] += 1
+
+
+def _relationship_label(orm_execute_state) -> str:
+    for element in reversed(orm_execute_state.loader_strategy_path.path):
+        parent = getattr(element, "parent", None)
+        if parent is not None and hasattr(element, "key"):
+            return f"{parent.class_.__name__}.{element.key}"
+    return orm_execute_state.lazy_loaded_from.class_.__name__
+
+
+def record_orm_execute(orm_execute_state) -> None:
+    """Aufruf aus do_orm_execute: zählt Lazy Loads pro Relationship."""
+    log = _current_log.get()
+    if log is not None and orm_execute_state.lazy_loaded_from is not None:
+        log.lazy_loads[_relationship_label(orm_execute_state)] += 1
+
+
+def query_budget(max_queries: int):
+    """
+    Route-Dependency: max. Anzahl Statements für diese Route.
+
+    Usage:
+        @router.get("/matches", dependencies=[Depends(query_budget(3))])
+    """
+
+    async def set_budget() -> None:
+        log = _current_log.get()
+        if log is not None:
+            log.budget = max_queries
+
+    return set_budget
+
+
+@contextmanager
+def capture_queries() -> Iterator[list[QueryLog]]:
+    """Sammelt die QueryLogs aller Requests, die im Block fertig werden."""
+    logs: list[QueryLog] = []
+    with _captures_lock:
+        _captures.append(logs)
+    try:
+        yield logs
+    finally:
+        with _captures_lock:
+            _captures.remove(logs)
+
+
+class QueryInspectorMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        n_plus_one_threshold: int = 3,
+        default_budget: Optional[int] = None,
+        strict: bool = False,
+    ):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.default_budget = default_budget
+        self.strict = strict
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog(scope["method"], scope["path"])
+        token = _current_log.set(log)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Query-Count"] = str(log.count)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_log.reset(token)
+            log.route = getattr(scope.get("route"), "path", None)
+            with _captures_lock:
+                for logs in _captures:
+                    logs.append(log)
+
+        problems = log.problems(self.n_plus_one_threshold, self.default_budget)
+        if problems:
+            message = f"{log.method} {log.route or log.path}: " + "; ".join(problems)
+            if self.strict:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
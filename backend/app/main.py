@@ -6,6 +6,7 @@ Liveticker-Backend für KI-gestützte Textgenerierung.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.api.v1 import (
     teams,
@@ -20,8 +21,20 @@ from app.api.v1 import (
     player_statistics,
     match_statistics,
     lineups,
+    live,
+    ingestion,
 )
-from app.core.database import engine, Base
+from app.core.config import settings
+from app.core.database import engine, Base, dispose_async_engine
+from app.core.http_cache import HTTPCacheMiddleware
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.profiler import ProfilerMiddleware
+from app.core.query_inspector import QueryInspectorMiddleware
+from app.services.llm_router import llm_router
+from app.services.llm_service import llm_service
+from app.services.import_scheduler import import_scheduler
+from app.services.api_football_client import api_football_client
+from app.services.llm_job_queue import llm_job_queue
 
 # Import ALL models so they're registered with Base.metadata
 from app.models.team import Team
@@ -36,6 +49,9 @@ from app.models.match_statistic import MatchStatistic
 from app.models.lineup import Lineup
 from app.models.player_statistic import PlayerStatistic
 from app.models.synthetic_event import SyntheticEvent
+from app.models.llm_cache_entry import LLMCacheEntry
+from app.models.import_cooldown import ImportCooldown
+from app.models.llm_job import LLMJob
 from app.models.team_league import TeamLeague
 
 
@@ -53,6 +69,12 @@ app = FastAPI(
 )
 
 
+# ETag / Cache-Control / 304 für GET-Routes (innerhalb von CORS, damit
+# auch 304-Antworten die CORS-Header bekommen)
+if settings.HTTP_CACHE_ENABLED:
+    app.add_middleware(HTTPCacheMiddleware)
+
+
 # CORS (für React Frontend)
 app.add_middleware(
     CORSMiddleware,
@@ -65,9 +87,57 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Next-Cursor"],
 )
 
 
+# N+1-Erkennung / Query-Budgets (nur Entwicklung und Tests)
+if settings.QUERY_INSPECTOR_ENABLED:
+    app.add_middleware(
+        QueryInspectorMiddleware,
+        n_plus_one_threshold=settings.QUERY_INSPECTOR_N_PLUS_ONE_THRESHOLD,
+        default_budget=settings.QUERY_INSPECTOR_DEFAULT_BUDGET,
+        strict=settings.QUERY_INSPECTOR_STRICT,
+    )
+
+# Profiling pro Request (Header PROFILING_HEADER), innerhalb der Metriken,
+# damit Server-Timing die DB-Zeit des Requests kennt
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilerMiddleware,
+        header=settings.PROFILING_HEADER,
+        token=settings.PROFILING_TOKEN,
+        output_dir=settings.PROFILING_DIR,
+        interval_ms=settings.PROFILING_INTERVAL_MS,
+    )
+
+# Latenz und DB-Statistik pro Route (ganz außen: misst auch 304 und CORS)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+
+@app.on_event("startup")
+async def start_llm_job_workers():
+    """Startet den Worker-Pool der LLM Job Queue (LLM_JOB_WORKERS) und das
+    Aufräumen abgelaufener Zeilen im persistenten LLM-Cache."""
+    llm_job_queue.start()
+    if llm_service.cache is not None:
+        llm_service.cache.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    """Stoppt die LLM-Worker und schließt gepoolte HTTP-Clients (LLM,
+    n8n-Webhooks, API-Football) sowie den async DB-Pool."""
+    await llm_job_queue.stop()
+    if llm_service.cache is not None:
+        await llm_service.cache.stop()
+    await llm_router.aclose()
+    await import_scheduler.aclose()
+    await api_football_client.aclose()
+    await dispose_async_engine()
+
+
 # Routes einbinden
 app.include_router(teams.router, prefix="/api/v1")
 app.include_router(matches.router, prefix="/api/v1")
@@ -81,6 +151,14 @@ app.include_router(favorites.router, prefix="/api/v1")
 app.include_router(player_statistics.router, prefix="/api/v1")
 app.include_router(match_statistics.router, prefix="/api/v1")
 app.include_router(lineups.router, prefix="/api/v1")
+app.include_router(live.router, prefix="/api/v1")
+app.include_router(ingestion.router, prefix="/api/v1")
+
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus-Metriken (Text-Format 0.0.4)."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
 
 
 # Health Check
@@ -4,7 +4,17 @@ SQLAlchemy Model für Events-Tabelle.
 Speichert Spielereignisse (Tore, Karten, Wechsel, etc.).
 """
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, func
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    DateTime,
+    Text,
+    func,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -32,10 +42,33 @@ class Event(Base):
     detail = Column(String(100), nullable=True)  # Normal Goal, Yellow Card, etc.
     comments = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Polling-Cursor (since=); in Postgres per Trigger gepflegt, auch bei
+    # Upserts der n8n-Workflows
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
 
     # Relationships
     match = relationship("Match", backref="events")
     team = relationship("Team", foreign_keys=[team_id])
 
+    # Name wie in den bestehenden DBs (n8n: ON CONFLICT ON CONSTRAINT
+    # unique_event); NULLS NOT DISTINCT, damit Events ohne Spieler (VAR,
+    # Trainer-Karten) beim Upsert nicht doppelt angelegt werden (Postgres 15)
+    __table_args__ = (
+        UniqueConstraint(
+            "match_id",
+            "minute",
+            "player_id",
+            "type",
+            name="unique_event",
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("ix_events_match_updated", "match_id", "updated_at", "id"),
+    )
+
     def __repr__(self):
         return f"<Event(id={self.id}, type='{self.type}', minute={self.minute})>"
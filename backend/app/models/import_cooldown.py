@@ -0,0 +1,16 @@
+# app/models/import_cooldown.py
+
+from sqlalchemy import Column, String, DateTime
+from app.core.database import Base
+
+
+class ImportCooldown(Base):
+    """Cooldown pro Import-Trigger, geteilt zwischen allen Workern."""
+
+    __tablename__ = "import_cooldowns"
+
+    key = Column(String(200), primary_key=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<ImportCooldown(key='{self.key}', expires_at={self.expires_at})>"
@@ -9,6 +9,8 @@ from sqlalchemy import (
     DateTime,
     func,
     JSON,
+    Index,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -42,5 +44,10 @@ class Lineup(Base):
     match = relationship("Match", backref="lineups")
     team = relationship("Team")
 
+    __table_args__ = (
+        UniqueConstraint("match_id", "player_id", name="uq_lineups_match_player"),
+        Index("ix_lineups_match_substitute_grid", "match_id", "is_substitute", "grid"),
+    )
+
     def __repr__(self):
         return f"<Lineup(match={self.match_id}, player={self.player_name}, starter={not self.is_substitute})>"
@@ -0,0 +1,19 @@
+# app/models/llm_cache_entry.py
+
+from sqlalchemy import Column, String, Text, DateTime, func
+from app.core.database import Base
+
+
+class LLMCacheEntry(Base):
+    """Persistenter LLM-Cache (Schlüssel = Hash aus Prompt + Modell)."""
+
+    __tablename__ = "llm_cache"
+
+    key = Column(String(64), primary_key=True)
+    model = Column(String(100), nullable=False)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<LLMCacheEntry(key='{self.key[:12]}', model='{self.model}')>"
@@ -0,0 +1,54 @@
+# app/models/llm_job.py
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    Index,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+
+class LLMJob(Base):
+    """LLM-Generierungsauftrag (Queue, abgearbeitet per SELECT ... SKIP LOCKED)."""
+
+    __tablename__ = "llm_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(20), nullable=False)  # synthetic | event
+    target_id = Column(Integer, nullable=False)  # synthetic_event_id bzw. event_id
+    match_id = Column(Integer, nullable=True)
+    event_type = Column(String(50), nullable=True)
+    priority = Column(Integer, nullable=False)  # kleiner = früher
+    status = Column(
+        String(20), nullable=False, default="queued"
+    )  # queued | running | done | failed
+    params = Column(JSONB, nullable=True)  # style, language, llm_provider, llm_model
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime(timezone=True), server_default=func.now())
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    ticker_entry_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("kind", "target_id", name="uq_llm_jobs_kind_target"),
+        Index(
+            "ix_llm_jobs_queued",
+            "priority",
+            "run_after",
+            "id",
+            postgresql_where=(status == "queued"),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<LLMJob(id={self.id}, kind='{self.kind}', status='{self.status}')>"
@@ -2,7 +2,7 @@
 SQLAlchemy Model für Matches mit League-Season-Beziehung.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -41,5 +41,16 @@ class Match(Base):
     )
     # events wird via backref in Event.match erstellt!
 
+    __table_args__ = (
+        Index("ix_matches_live", "match_date", postgresql_where=(status == "live")),
+        Index("idx_matches_date", "match_date"),  # wie init.sql
+        Index("ix_matches_league_season_date", "league_season_id", "match_date"),
+        Index(
+            "ix_matches_league_season_round", "league_season_id", "round", "match_date"
+        ),
+        Index("ix_matches_home_team_date", "home_team_id", "match_date"),
+        Index("ix_matches_away_team_date", "away_team_id", "match_date"),
+    )
+
     def __repr__(self):
         return f"<Match(id={self.id}, home={self.home_team_id} vs away={self.away_team_id})>"
@@ -1,6 +1,14 @@
 # app/models/match_statistic.py
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    Integer,
+    ForeignKey,
+    DateTime,
+    Index,
+    func,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -49,6 +57,7 @@ class MatchStatistic(Base):
 
     __table_args__ = (
         UniqueConstraint("match_id", "team_id", name="unique_match_team_stat"),
+        Index("ix_match_statistics_team_id", "team_id"),
     )
 
     def __repr__(self):
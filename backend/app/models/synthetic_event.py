@@ -1,6 +1,15 @@
 # app/models/synthetic_event.py
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, func
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Index,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -29,5 +38,9 @@ class SyntheticEvent(Base):
     match = relationship("Match", backref="synthetic_events")
     team = relationship("Team", foreign_keys=[team_id])
 
+    __table_args__ = (
+        Index("ix_synthetic_events_match_type", "match_id", "event_type"),
+    )
+
     def __repr__(self):
         return f"<SyntheticEvent(id={self.id}, type='{self.event_type}', match_id={self.match_id})>"
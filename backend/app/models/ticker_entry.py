@@ -1,7 +1,7 @@
 # ----------------------------------------
 # app/models/ticker_entry.py
 # ----------------------------------------
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -34,11 +34,23 @@ class TickerEntry(Base):
     approved_by = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     published_at = Column(DateTime(timezone=True), nullable=True)
+    # Polling-Cursor (since=); in Postgres zusätzlich per Trigger gepflegt
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
 
     match = relationship("Match", backref="ticker_entries")
     event = relationship("Event", backref="ticker_entries")
     synthetic_event = relationship("SyntheticEvent", backref="ticker_entries")
 
+    __table_args__ = (
+        Index("ix_ticker_entries_match_status_minute", "match_id", "status", "minute"),
+        Index("ix_ticker_entries_match_updated", "match_id", "updated_at", "id"),
+    )
+
     def __repr__(self):
         return (
             f"<TickerEntry(id={self.id}, status='{self.status}', minute={self.minute})>"
@@ -3,10 +3,20 @@ from app.repositories.team_repository import TeamRepository
 from app.repositories.match_repository import MatchRepository
 from app.repositories.event_repository import EventRepository
 from app.repositories.ticker_entry_repository import TickerEntryRepository
+from app.repositories.async_repositories import (
+    AsyncTeamRepository,
+    AsyncMatchRepository,
+    AsyncEventRepository,
+    AsyncTickerEntryRepository,
+)
 
 __all__ = [
     "TeamRepository",
     "MatchRepository",
     "EventRepository",
     "TickerEntryRepository",
+    "AsyncTeamRepository",
+    "AsyncMatchRepository",
+    "AsyncEventRepository",
+    "AsyncTickerEntryRepository",
 ]
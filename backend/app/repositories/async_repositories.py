@@ -0,0 +1,105 @@
+# app/repositories/async_repositories.py
+"""
+Async Repositories für AsyncSession.
+
+Jede Klasse ist die async Variante des gleichnamigen sync Repositories:
+alle Methoden haben dieselbe Signatur, sind aber awaitable. Die Queries
+selbst bleiben in den sync Repositories (eine Quelle); sie laufen über
+AsyncSession.run_sync auf der asyncpg-Verbindung, blockieren also den
+Event Loop nicht.
+
+Hinweis: Zurückgegebene Objekte enthalten nur, was die Query lädt
+(joinedload). Lazy Loads außerhalb von run_sync sind in async nicht
+möglich (MissingGreenlet).
+
+Usage:
+    match = await AsyncMatchRepository(db).get_by_id(match_id)
+"""
+
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.event_repository import EventRepository
+from app.repositories.league_repository import LeagueRepository
+from app.repositories.league_season_repository import LeagueSeasonRepository
+from app.repositories.lineup_repository import LineupRepository
+from app.repositories.match_repository import MatchRepository
+from app.repositories.match_statistic_repository import MatchStatisticRepository
+from app.repositories.player_statistic_repository import PlayerStatisticRepository
+from app.repositories.season_repository import SeasonRepository
+from app.repositories.synthetic_event_repository import SyntheticEventRepository
+from app.repositories.team_repository import TeamRepository
+from app.repositories.ticker_entry_repository import TickerEntryRepository
+from app.repositories.user_favorite_repository import UserFavoriteRepository
+
+
+class AsyncRepository:
+    """Basisklasse: leitet Methodenaufrufe an repository_class weiter."""
+
+    repository_class: type
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self.repository_class, name)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            return await self.db.run_sync(
+                lambda session: method(self.repository_class(session), *args, **kwargs)
+            )
+
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+
+class AsyncEventRepository(AsyncRepository):
+    repository_class = EventRepository
+
+
+class AsyncLeagueRepository(AsyncRepository):
+    repository_class = LeagueRepository
+
+
+class AsyncLeagueSeasonRepository(AsyncRepository):
+    repository_class = LeagueSeasonRepository
+
+
+class AsyncLineupRepository(AsyncRepository):
+    repository_class = LineupRepository
+
+
+class AsyncMatchRepository(AsyncRepository):
+    repository_class = MatchRepository
+
+
+class AsyncMatchStatisticRepository(AsyncRepository):
+    repository_class = MatchStatisticRepository
+
+
+class AsyncPlayerStatisticRepository(AsyncRepository):
+    repository_class = PlayerStatisticRepository
+
+
+class AsyncSeasonRepository(AsyncRepository):
+    repository_class = SeasonRepository
+
+
+class AsyncSyntheticEventRepository(AsyncRepository):
+    repository_class = SyntheticEventRepository
+
+
+class AsyncTeamRepository(AsyncRepository):
+    repository_class = TeamRepository
+
+
+class AsyncTickerEntryRepository(AsyncRepository):
+    repository_class = TickerEntryRepository
+
+
+class AsyncUserFavoriteRepository(AsyncRepository):
+    repository_class = UserFavoriteRepository
@@ -0,0 +1,63 @@
+# app/repositories/bulk_upsert.py
+"""
+Bulk Upsert Helper.
+Schreibt viele Zeilen in einem INSERT ... ON CONFLICT Statement statt
+add/commit/refresh pro Zeile.
+"""
+
+from typing import Iterable
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Iterable[dict],
+    conflict_columns: tuple[str, ...],
+    update: bool = True,
+) -> int:
+    """
+    INSERT ... ON CONFLICT (conflict_columns) DO UPDATE bzw. DO NOTHING.
+
+    Doppelte Schlüssel innerhalb eines Batches werden vorab zusammengefasst
+    (letzte Zeile gewinnt) – Postgres erlaubt pro Statement nur ein Update
+    je Zeile. Die betroffenen Matches erhalten nach dem Commit ein
+    "resync"-Delta, da Core-Statements keine Session-Events auslösen.
+
+    Returns:
+        Anzahl eingefügter/aktualisierter Zeilen
+    """
+    unique: dict[tuple, dict] = {}
+    for row in rows:
+        unique[tuple(row.get(c) for c in conflict_columns)] = row
+    if not unique:
+        return 0
+
+    values = list(unique.values())
+    stmt = insert(model).values(values)
+    if update:
+        update_columns = {
+            c.name: stmt.excluded[c.name]
+            for c in model.__table__.columns
+            if c.name in values[0]
+            and c.name not in conflict_columns
+            and not c.primary_key
+        }
+        if "updated_at" in model.__table__.columns:
+            update_columns["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns), set_=update_columns
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+    result = db.execute(stmt)
+
+    changes = db.info.setdefault("live_changes", [])
+    for match_id in {row["match_id"] for row in values if "match_id" in row}:
+        changes.append((match_id, {"type": "resync"}))
+
+    db.commit()
+    return result.rowcount
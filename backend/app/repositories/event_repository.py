@@ -4,9 +4,12 @@ Event Repository - Data Access Layer.
 Kapselt alle DB-Operationen für Events.
 """
 
+from datetime import datetime
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 from app.models.event import Event
 from app.schemas.event import EventCreate, EventUpdate
+from app.repositories.bulk_upsert import bulk_upsert
 
 
 class EventRepository:
@@ -23,6 +26,12 @@ class EventRepository:
         """Holt Event nach ID."""
         return self.db.query(Event).filter(Event.id == event_id).first()
 
+    def get_by_ids(self, event_ids: list[int]) -> list[Event]:
+        """Holt mehrere Events mit einer Query."""
+        if not event_ids:
+            return []
+        return self.db.query(Event).filter(Event.id.in_(event_ids)).all()
+
     def get_by_match(
         self, match_id: int, skip: int = 0, limit: int = 100
     ) -> list[Event]:
@@ -36,6 +45,36 @@ class EventRepository:
             .all()
         )
 
+    def get_by_match_since(
+        self, match_id: int, since_id: int, limit: int = 100
+    ) -> list[Event]:
+        """Keyset-Pagination: nur neu angelegte Events (id > since_id)."""
+        return (
+            self.db.query(Event)
+            .filter(Event.match_id == match_id, Event.id > since_id)
+            .order_by(Event.id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_by_match_changed(
+        self, match_id: int, since: datetime, after_id: int = 0, limit: int = 100
+    ) -> list[Event]:
+        """
+        Keyset-Pagination auf (updated_at, id): neue und per Upsert
+        korrigierte Events (Minute, Spieler, Detail) nach dem Cursor.
+        """
+        return (
+            self.db.query(Event)
+            .filter(
+                Event.match_id == match_id,
+                tuple_(Event.updated_at, Event.id) > tuple_(since, after_id),
+            )
+            .order_by(Event.updated_at.asc(), Event.id.asc())
+            .limit(limit)
+            .all()
+        )
+
     def get_by_type(
         self, event_type: str, skip: int = 0, limit: int = 100
     ) -> list[Event]:
@@ -56,6 +95,13 @@ class EventRepository:
         self.db.refresh(db_event)
         return db_event
 
+    def upsert_many(self, rows: list[dict]) -> int:
+        """Bulk-Upsert auf unique_event (match_id, minute, player_id, type);
+        player_id NULL zählt dank NULLS NOT DISTINCT als gleicher Schlüssel."""
+        return bulk_upsert(
+            self.db, Event, rows, ("match_id", "minute", "player_id", "type")
+        )
+
     def update(self, event_id: int, event_update: EventUpdate) -> Event | None:
         """Aktualisiert Event."""
         db_event = self.get_by_id(event_id)
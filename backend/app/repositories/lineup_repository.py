@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from app.models.lineup import Lineup
 from app.schemas.lineup import LineupCreate, LineupUpdate
+from app.repositories.bulk_upsert import bulk_upsert
 
 
 class LineupRepository:
@@ -56,6 +57,10 @@ class LineupRepository:
         self.db.refresh(lineup)
         return lineup
 
+    def upsert_many(self, rows: list[dict]) -> int:
+        """Bulk-Upsert auf (match_id, player_id)."""
+        return bulk_upsert(self.db, Lineup, rows, ("match_id", "player_id"))
+
     def update(self, lineup_id: int, lineup_data: LineupUpdate) -> Optional[Lineup]:
         lineup = self.get_by_id(lineup_id)
         if not lineup:
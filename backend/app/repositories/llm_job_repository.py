@@ -0,0 +1,167 @@
+# app/repositories/llm_job_repository.py
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.llm_job import LLMJob
+
+
+class LLMJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_id(self, job_id: int) -> LLMJob | None:
+        return self.db.query(LLMJob).filter(LLMJob.id == job_id).first()
+
+    def get_by_ids(self, job_ids: list[int]) -> list[LLMJob]:
+        if not job_ids:
+            return []
+        return self.db.query(LLMJob).filter(LLMJob.id.in_(job_ids)).all()
+
+    def enqueue_many(self, jobs: list[dict]) -> list[LLMJob]:
+        """
+        Legt Jobs an (ein Job pro kind + target_id). Bestehende Jobs bleiben
+        unverändert, nur fehlgeschlagene werden erneut eingereiht.
+        """
+        if not jobs:
+            return []
+        stmt = insert(LLMJob).values(
+            [{"status": "queued", "attempts": 0, **job} for job in jobs]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["kind", "target_id"],
+            set_={
+                "status": "queued",
+                "attempts": 0,
+                "priority": stmt.excluded.priority,
+                "params": stmt.excluded.params,
+                "run_after": func.now(),
+                "last_error": None,
+                "finished_at": None,
+            },
+            where=LLMJob.status == "failed",
+        )
+        self.db.execute(stmt)
+        self.db.commit()
+
+        by_key = self.get_by_targets([(job["kind"], job["target_id"]) for job in jobs])
+        return [by_key[(job["kind"], job["target_id"])] for job in jobs]
+
+    def get_by_targets(
+        self, keys: list[tuple[str, int]]
+    ) -> dict[tuple[str, int], LLMJob]:
+        """Bestehende Jobs pro (kind, target_id), eine Query."""
+        if not keys:
+            return {}
+        rows = (
+            self.db.query(LLMJob)
+            .filter(LLMJob.target_id.in_({target for _, target in keys}))
+            .all()
+        )
+        wanted = set(keys)
+        return {
+            (j.kind, j.target_id): j for j in rows if (j.kind, j.target_id) in wanted
+        }
+
+    def claim(
+        self, worker_id: str, max_priority: Optional[int] = None
+    ) -> LLMJob | None:
+        """
+        Holt den nächsten fälligen Job (niedrigste Priorität zuerst) und
+        markiert ihn als running. FOR UPDATE SKIP LOCKED: parallele Worker
+        (auch in anderen Prozessen) bekommen nie denselben Job.
+        """
+        query = self.db.query(LLMJob).filter(
+            LLMJob.status == "queued", LLMJob.run_after <= func.now()
+        )
+        if max_priority is not None:
+            query = query.filter(LLMJob.priority < max_priority)
+        job = (
+            query.order_by(LLMJob.priority, LLMJob.run_after, LLMJob.id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if job is None:
+            self.db.rollback()
+            return None
+        job.status = "running"
+        job.locked_by = worker_id
+        job.locked_at = func.now()
+        job.attempts = job.attempts + 1
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def complete(self, job_id: int, ticker_entry_id: Optional[int]) -> None:
+        self.db.query(LLMJob).filter(LLMJob.id == job_id).update(
+            {
+                "status": "done",
+                "ticker_entry_id": ticker_entry_id,
+                "last_error": None,
+                "finished_at": func.now(),
+            },
+            synchronize_session=False,
+        )
+        self.db.commit()
+
+    def fail(
+        self, job_id: int, error: str, retry_in_seconds: Optional[float] = None
+    ) -> None:
+        """Fehlschlag: mit retry_in_seconds erneut einreihen, sonst endgültig."""
+        values: dict = {"last_error": error[:2000], "locked_by": None}
+        if retry_in_seconds is None:
+            values.update(status="failed", finished_at=func.now())
+        else:
+            values.update(
+                status="queued",
+                run_after=datetime.now(timezone.utc)
+                + timedelta(seconds=retry_in_seconds),
+            )
+        self.db.query(LLMJob).filter(LLMJob.id == job_id).update(
+            values, synchronize_session=False
+        )
+        self.db.commit()
+
+    def requeue_stale(self, older_than_seconds: float) -> tuple[int, int]:
+        """
+        Jobs abgestürzter Worker (running ohne Abschluss) wieder freigeben.
+        Jobs ohne verbleibende Versuche werden endgültig als failed markiert,
+        sonst würde ein Job, der den Worker jedes Mal abstürzen lässt, ewig
+        neu eingereiht. Gibt (requeued, failed) zurück.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=older_than_seconds)
+        stale = self.db.query(LLMJob).filter(
+            LLMJob.status == "running", LLMJob.locked_at < cutoff
+        )
+        failed = stale.filter(LLMJob.attempts >= LLMJob.max_attempts).update(
+            {
+                "status": "failed",
+                "locked_by": None,
+                "last_error": "Worker lost (lock timeout), no attempts left",
+                "finished_at": func.now(),
+            },
+            synchronize_session=False,
+        )
+        requeued = stale.filter(LLMJob.attempts < LLMJob.max_attempts).update(
+            {"status": "queued", "locked_by": None, "run_after": func.now()},
+            synchronize_session=False,
+        )
+        self.db.commit()
+        return requeued, failed
+
+    def queued_count(self, max_priority: Optional[int] = None) -> int:
+        query = self.db.query(func.count(LLMJob.id)).filter(LLMJob.status == "queued")
+        if max_priority is not None:
+            query = query.filter(LLMJob.priority < max_priority)
+        return query.scalar() or 0
+
+    def count_by_status(self) -> dict[str, int]:
+        return dict(
+            self.db.query(LLMJob.status, func.count(LLMJob.id))
+            .group_by(LLMJob.status)
+            .all()
+        )
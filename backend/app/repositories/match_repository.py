@@ -1,6 +1,6 @@
 from datetime import datetime
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from sqlalchemy import or_, exists
 from app.models.match import Match
 from app.models.league_season import LeagueSeason
 from app.schemas.match import MatchCreate, MatchUpdate
@@ -35,12 +35,35 @@ class MatchRepository:
             .first()
         )
 
+    def get_data_presence(self, match_id: int) -> dict[str, bool]:
+        """Welche importierten Daten existieren für ein Match (eine Query)."""
+        from app.models.lineup import Lineup
+        from app.models.match_statistic import MatchStatistic
+        from app.models.player_statistic import PlayerStatistic
+        from app.models.event import Event
+        from app.models.synthetic_event import SyntheticEvent
+
+        row = self.db.query(
+            exists().where(Lineup.match_id == match_id).label("lineups"),
+            exists().where(MatchStatistic.match_id == match_id).label("statistics"),
+            exists()
+            .where(PlayerStatistic.match_id == match_id)
+            .label("player_statistics"),
+            exists().where(Event.match_id == match_id).label("events"),
+            exists().where(SyntheticEvent.match_id == match_id).label("prematch"),
+        ).one()
+        return dict(row._mapping)
+
     def get_by_league_season(
         self, league_season_id: int, skip: int = 0, limit: int = 100
     ) -> list[Match]:
         return (
             self.db.query(Match)
-            .options(joinedload(Match.home_team), joinedload(Match.away_team))
+            .options(
+                joinedload(Match.home_team),
+                joinedload(Match.away_team),
+                joinedload(Match.league_season),
+            )
             .filter(Match.league_season_id == league_season_id)
             .order_by(Match.match_date)
             .offset(skip)
@@ -51,7 +74,11 @@ class MatchRepository:
     def get_by_round(self, league_season_id: int, round: str) -> list[Match]:
         return (
             self.db.query(Match)
-            .options(joinedload(Match.home_team), joinedload(Match.away_team))
+            .options(
+                joinedload(Match.home_team),
+                joinedload(Match.away_team),
+                joinedload(Match.league_season),
+            )
             .filter(Match.league_season_id == league_season_id, Match.round == round)
             .order_by(Match.match_date)
             .all()
@@ -60,7 +87,11 @@ class MatchRepository:
     def get_by_team(self, team_id: int, skip: int = 0, limit: int = 100) -> list[Match]:
         return (
             self.db.query(Match)
-            .options(joinedload(Match.home_team), joinedload(Match.away_team))
+            .options(
+                joinedload(Match.home_team),
+                joinedload(Match.away_team),
+                joinedload(Match.league_season),
+            )
             .filter(or_(Match.home_team_id == team_id, Match.away_team_id == team_id))
             .order_by(Match.match_date.desc())
             .offset(skip)
@@ -68,10 +99,32 @@ class MatchRepository:
             .all()
         )
 
+    def get_by_teams(self, team_ids: list[int], limit: int = 50) -> list[Match]:
+        """Neueste Matches mehrerer Teams (z.B. Favoriten), Teams und
+        LeagueSeason per joinedload – sonst ein Lazy Load pro Zeile."""
+        return (
+            self.db.query(Match)
+            .options(
+                joinedload(Match.home_team),
+                joinedload(Match.away_team),
+                joinedload(Match.league_season),
+            )
+            .filter(
+                or_(Match.home_team_id.in_(team_ids), Match.away_team_id.in_(team_ids))
+            )
+            .order_by(Match.match_date.desc())
+            .limit(limit)
+            .all()
+        )
+
     def get_live(self) -> list[Match]:
         return (
             self.db.query(Match)
-            .options(joinedload(Match.home_team), joinedload(Match.away_team))
+            .options(
+                joinedload(Match.home_team),
+                joinedload(Match.away_team),
+                joinedload(Match.league_season),
+            )
             .filter(Match.status == "live")
             .all()
         )
@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models.match_statistic import MatchStatistic
 from app.schemas.match_statistic import MatchStatisticCreate, MatchStatisticUpdate
+from app.repositories.bulk_upsert import bulk_upsert
 
 
 class MatchStatisticRepository:
@@ -39,6 +40,10 @@ class MatchStatisticRepository:
         self.db.refresh(match_stat)
         return match_stat
 
+    def upsert_many(self, rows: list[dict]) -> int:
+        """Bulk-Upsert auf unique_match_team_stat (match_id, team_id)."""
+        return bulk_upsert(self.db, MatchStatistic, rows, ("match_id", "team_id"))
+
     def update(
         self, match_stat_id: int, match_stat_data: MatchStatisticUpdate
     ) -> Optional[MatchStatistic]:
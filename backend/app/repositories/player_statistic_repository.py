@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models.player_statistic import PlayerStatistic
 from app.schemas.player_statistic import PlayerStatisticCreate, PlayerStatisticUpdate
+from app.repositories.bulk_upsert import bulk_upsert
 
 
 class PlayerStatisticRepository:
@@ -46,6 +47,10 @@ class PlayerStatisticRepository:
         self.db.refresh(player_stat)
         return player_stat
 
+    def upsert_many(self, rows: list[dict]) -> int:
+        """Bulk-Upsert auf unique_match_player (match_id, player_id)."""
+        return bulk_upsert(self.db, PlayerStatistic, rows, ("match_id", "player_id"))
+
     def update(
         self, player_stat_id: int, player_stat_data: PlayerStatisticUpdate
     ) -> Optional[PlayerStatistic]:
@@ -14,6 +14,13 @@ class SyntheticEventRepository:
             self.db.query(SyntheticEvent).filter(SyntheticEvent.id == event_id).first()
         )
 
+    def get_by_ids(self, event_ids: list[int]) -> list[SyntheticEvent]:
+        if not event_ids:
+            return []
+        return (
+            self.db.query(SyntheticEvent).filter(SyntheticEvent.id.in_(event_ids)).all()
+        )
+
     def get_by_match(self, match_id: int) -> list[SyntheticEvent]:
         return (
             self.db.query(SyntheticEvent)
@@ -1,6 +1,7 @@
 # ----------------------------------------
 # app/repositories/ticker_entry_repository.py
 # ----------------------------------------
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 from app.models.ticker_entry import TickerEntry
 from app.schemas.ticker_entry import TickerEntryCreate, TickerEntryUpdate
@@ -29,6 +30,60 @@ class TickerEntryRepository:
             .all()
         )
 
+    def get_by_match_since(
+        self, match_id: int, since_id: int, limit: int = 100
+    ) -> list[TickerEntry]:
+        """Keyset-Pagination: nur neu angelegte Einträge (id > since_id)."""
+        return (
+            self.db.query(TickerEntry)
+            .filter(TickerEntry.match_id == match_id, TickerEntry.id > since_id)
+            .order_by(TickerEntry.id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_by_match_changed(
+        self,
+        match_id: int,
+        since: datetime,
+        after_id: int = 0,
+        limit: int = 100,
+        published_only: bool = False,
+    ) -> list[TickerEntry]:
+        """
+        Keyset-Pagination auf (updated_at, id): neue, bearbeitete und
+        nachträglich veröffentlichte Einträge nach dem Cursor. Veröffentlichen
+        setzt updated_at neu, ein später freigegebener Entwurf kommt also auch
+        nach bereits gelieferten jüngeren Einträgen an.
+        """
+        query = self.db.query(TickerEntry).filter(
+            TickerEntry.match_id == match_id,
+            tuple_(TickerEntry.updated_at, TickerEntry.id) > tuple_(since, after_id),
+        )
+        if published_only:
+            query = query.filter(TickerEntry.status == "published")
+        return (
+            query.order_by(TickerEntry.updated_at.asc(), TickerEntry.id.asc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_by_synthetic_event_ids(
+        self, synthetic_event_ids: list[int]
+    ) -> list[TickerEntry]:
+        if not synthetic_event_ids:
+            return []
+        return (
+            self.db.query(TickerEntry)
+            .filter(TickerEntry.synthetic_event_id.in_(synthetic_event_ids))
+            .all()
+        )
+
+    def get_by_event(self, event_id: int) -> TickerEntry | None:
+        return (
+            self.db.query(TickerEntry).filter(TickerEntry.event_id == event_id).first()
+        )
+
     def get_by_mode(
         self, mode: str, skip: int = 0, limit: int = 100
     ) -> list[TickerEntry]:
@@ -0,0 +1,11 @@
+# app/schemas/bulk_upsert.py
+
+from pydantic import BaseModel
+
+
+class BulkUpsertResponse(BaseModel):
+    """Antwort der Bulk-PUT-Endpoints (ein Statement pro Request)."""
+
+    match_id: int
+    received: int
+    upserted: int
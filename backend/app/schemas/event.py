@@ -50,6 +50,7 @@ class Event(EventBase):
 
     id: int
     created_at: datetime
+    updated_at: datetime | None = None
 
     class Config:
         from_attributes = True
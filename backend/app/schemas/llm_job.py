@@ -0,0 +1,45 @@
+# app/schemas/llm_job.py
+
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LLMJobEnqueueRequest(BaseModel):
+    synthetic_event_ids: list[int] = Field(default_factory=list, max_length=500)
+    event_ids: list[int] = Field(default_factory=list, max_length=500)
+    style: str = "neutral"
+    language: str = "de"
+    llm_provider: str = "openai"
+    llm_model: str | None = None
+
+
+class LLMJob(BaseModel):
+    id: int
+    kind: str  # synthetic | event
+    target_id: int
+    match_id: int | None = None
+    event_type: str | None = None
+    priority: int
+    status: str  # queued | running | done | failed
+    attempts: int
+    max_attempts: int
+    run_after: datetime | None = None
+    last_error: str | None = None
+    ticker_entry_id: int | None = None
+    created_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LLMJobRejected(BaseModel):
+    kind: str
+    target_id: int
+    reason: str  # not_found | queue_full
+
+
+class LLMJobEnqueueResponse(BaseModel):
+    jobs: list[LLMJob]
+    rejected: list[LLMJobRejected] = []
+    queue_depth: int
+    backpressure: bool  # True: Pre-Match-Jobs werden derzeit abgelehnt
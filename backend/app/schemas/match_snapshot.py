@@ -0,0 +1,38 @@
+# app/schemas/match_snapshot.py
+"""
+Pydantic Schema für den aggregierten Match-Snapshot.
+Nicht angeforderte Felder (?fields=) fehlen in der Response.
+"""
+
+from pydantic import BaseModel
+from app.schemas.match import Match
+from app.schemas.event import Event
+from app.schemas.ticker_entry import TickerEntry
+from app.schemas.synthetic_event import GenerateSyntheticResponse
+from app.schemas.lineup import LineupResponse
+from app.schemas.match_statistic import MatchStatisticResponse
+from app.schemas.player_statistic import PlayerStatisticResponse
+
+
+SNAPSHOT_FIELDS = (
+    "match",
+    "events",
+    "ticker_entries",
+    "prematch",
+    "live_stats",
+    "lineups",
+    "match_statistics",
+    "player_statistics",
+)
+
+
+class MatchSnapshot(BaseModel):
+    match_id: int
+    match: Match | None = None
+    events: list[Event] | None = None
+    ticker_entries: list[TickerEntry] | None = None
+    prematch: list[GenerateSyntheticResponse] | None = None
+    live_stats: list[GenerateSyntheticResponse] | None = None
+    lineups: list[LineupResponse] | None = None
+    match_statistics: list[MatchStatisticResponse] | None = None
+    player_statistics: list[PlayerStatisticResponse] | None = None
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Any
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SyntheticEventBase(BaseModel):
@@ -49,3 +49,25 @@ class GenerateSyntheticResponse(BaseModel):
     text: str
     llm_model: str
     llm_provider: str
+
+
+class GenerateSyntheticBatchRequest(BaseModel):
+    synthetic_event_ids: list[int] = Field(min_length=1, max_length=200)
+    style: str = "neutral"
+    language: str = "de"
+    llm_provider: str = "openai"
+    llm_model: str | None = None
+
+
+class GenerateSyntheticBatchItem(BaseModel):
+    synthetic_event_id: int
+    status: str  # created | existing | not_found | error
+    ticker_entry_id: int | None = None
+    text: str | None = None
+    llm_model: str | None = None
+    llm_provider: str | None = None
+    error: str | None = None
+
+
+class GenerateSyntheticBatchResponse(BaseModel):
+    results: list[GenerateSyntheticBatchItem]
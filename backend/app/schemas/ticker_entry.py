@@ -34,5 +34,6 @@ class TickerEntry(TickerEntryBase):
     id: int
     created_at: datetime
     published_at: datetime | None = None
+    updated_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,229 @@
+"""
+API-Football Client (api-sports v3).
+
+Asynchroner HTTP-Client für die native Ingestion:
+- Token Bucket: hält API_FOOTBALL_RATE_LIMIT (Requests pro Minute) ein,
+  kurze Bursts bis zur Bucket-Größe sind erlaubt.
+- Request Coalescing: identische, gleichzeitig laufende GETs teilen sich
+  einen einzigen HTTP-Request.
+- Response Cache: Antworten werden pro Endpoint mit TTL gecacht; nach Ablauf
+  wird – sofern der Server ETag/Last-Modified liefert – bedingt nachgefragt
+  (304 → gecachte Antwort weiterverwenden).
+
+Die Base-URL ist konfigurierbar, d.h. der Client lässt sich gegen einen
+lokalen Fake-Server (tools/fake_api_football.py) oder einen httpx-Transport
+testen.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Cache-TTL pro Endpoint in Sekunden (Live-Daten kurz, Vorberichte lang)
+DEFAULT_CACHE_TTLS = {
+    "fixtures": 15,
+    "fixtures/events": 15,
+    "fixtures/statistics": 30,
+    "fixtures/players": 60,
+    "fixtures/lineups": 300,
+    "injuries": 3600,
+    "predictions": 3600,
+}
+
+
+class ApiFootballError(Exception):
+    """Fehlerhafte Antwort von API-Football (HTTP-Fehler oder errors-Feld)."""
+
+
+class TokenBucket:
+    """Token Bucket Rate Limiter für asyncio."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or max(1.0, rate_per_minute / 10.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class ApiFootballClient:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str],
+        rate_limit_per_minute: int = 100,
+        timeout: float = 10.0,
+        max_connections: int = 10,
+        cache_ttls: Optional[dict[str, float]] = None,
+        cache_max_size: int = 1000,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.cache_ttls = {**DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        self.cache_max_size = cache_max_size
+        self.limiter = TokenBucket(rate_limit_per_minute)
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        # key → (expires_at, validators, payload)
+        self._cache: OrderedDict[tuple, tuple[float, dict, Any]] = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "coalesced": 0,
+            "not_modified": 0,
+            "errors": 0,
+        }
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            headers = {"x-apisports-key": self.api_key} if self.api_key else {}
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def get(self, endpoint: str, **params) -> Any:
+        """
+        GET auf einen Endpoint, liefert das "response"-Feld der Antwort.
+
+        Args:
+            endpoint: z.B. "fixtures/events"
+            params: Query-Parameter, z.B. fixture=1388500
+        """
+        endpoint = endpoint.strip("/")
+        key = (endpoint, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._stats["cache_hits"] += 1
+            self._cache.move_to_end(key)
+            return cached[2]
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            payload = await self._fetch(key, endpoint, params, cached)
+            future.set_result(payload)
+            return payload
+        except Exception as e:
+            future.set_exception(e)
+            # Exception gilt als abgerufen, auch wenn niemand wartet
+            future.exception()
+            raise
+        finally:
+            # Leader abgebrochen (CancelledError ist keine Exception):
+            # Wartende nicht hängen lassen
+            if not future.done():
+                future.cancel()
+            del self._in_flight[key]
+
+    async def _fetch(
+        self,
+        key: tuple,
+        endpoint: str,
+        params: dict,
+        cached: Optional[tuple[float, dict, Any]],
+    ) -> Any:
+        headers = {}
+        if cached:
+            validators = cached[1]
+            if "etag" in validators:
+                headers["If-None-Match"] = validators["etag"]
+            if "last-modified" in validators:
+                headers["If-Modified-Since"] = validators["last-modified"]
+
+        await self.limiter.acquire()
+        self._stats["requests"] += 1
+        try:
+            resp = await self.client.get(f"/{endpoint}", params=params, headers=headers)
+        except httpx.HTTPError as e:
+            self._stats["errors"] += 1
+            raise ApiFootballError(f"{endpoint} failed: {e}") from e
+
+        if resp.status_code == 304 and cached:
+            self._stats["not_modified"] += 1
+            payload = cached[2]
+        elif resp.status_code != 200:
+            self._stats["errors"] += 1
+            raise ApiFootballError(f"{endpoint} returned HTTP {resp.status_code}")
+        else:
+            body = resp.json()
+            # api-sports meldet Fehler (Quota, ungültige Parameter) mit HTTP 200
+            if body.get("errors"):
+                self._stats["errors"] += 1
+                raise ApiFootballError(f"{endpoint} returned errors: {body['errors']}")
+            payload = body.get("response", [])
+
+        validators = {
+            h: resp.headers[h] for h in ("etag", "last-modified") if h in resp.headers
+        } or (cached[1] if cached else {})
+        ttl = self.cache_ttls.get(endpoint, 0)
+        if ttl > 0:
+            self._cache[key] = (time.monotonic() + ttl, validators, payload)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_size:
+                self._cache.popitem(last=False)
+        return payload
+
+    def invalidate(self, endpoint: Optional[str] = None) -> None:
+        """Cache leeren (optional nur für einen Endpoint)."""
+        if endpoint is None:
+            self._cache.clear()
+            return
+        for key in [k for k in self._cache if k[0] == endpoint.strip("/")]:
+            del self._cache[key]
+
+    def stats(self) -> dict:
+        return {**self._stats, "cache_size": len(self._cache)}
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Singleton
+from app.core.config import settings
+
+api_football_client = ApiFootballClient(
+    base_url=settings.API_FOOTBALL_BASE_URL,
+    api_key=settings.API_FOOTBALL_KEY,
+    rate_limit_per_minute=settings.API_FOOTBALL_RATE_LIMIT,
+    timeout=settings.API_FOOTBALL_TIMEOUT_SECONDS,
+    max_connections=settings.API_FOOTBALL_MAX_CONNECTIONS,
+)
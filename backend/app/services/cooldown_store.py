@@ -0,0 +1,151 @@
+"""
+Cooldown Store für Import-Trigger.
+
+- MemoryCooldownStore: prozesslokal, größenbegrenzt (abgelaufene bzw. älteste
+  Einträge werden verdrängt).
+- PostgresCooldownStore: über Tabelle import_cooldowns geteilt zwischen allen
+  uvicorn-Workern und über Neustarts hinweg. Das Setzen ist ein atomares
+  INSERT ... ON CONFLICT DO UPDATE ... WHERE expires_at <= now(), d.h. genau
+  ein Prozess gewinnt pro Cooldown-Fenster.
+
+Async-Routes nutzen try_acquire_async/is_active_async: der Postgres-Store
+führt seine DB-Roundtrips dann im Threadpool aus statt im Event-Loop.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
+
+
+class CooldownStore(ABC):
+    """Interface: try_acquire setzt den Cooldown, falls keiner aktiv ist."""
+
+    @abstractmethod
+    def try_acquire(self, key: str, cooldown_seconds: float) -> bool:
+        ...
+
+    @abstractmethod
+    def is_active(self, key: str) -> bool:
+        ...
+
+    async def try_acquire_async(self, key: str, cooldown_seconds: float) -> bool:
+        return self.try_acquire(key, cooldown_seconds)
+
+    async def is_active_async(self, key: str) -> bool:
+        return self.is_active(key)
+
+
+class MemoryCooldownStore(CooldownStore):
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._expires: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, key: str, cooldown_seconds: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._expires.get(key, 0) > now:
+                return False
+            self._expires[key] = now + cooldown_seconds
+            self._expires.move_to_end(key)
+            self._evict(now)
+            return True
+
+    def is_active(self, key: str) -> bool:
+        return self._expires.get(key, 0) > time.monotonic()
+
+    def _evict(self, now: float) -> None:
+        if len(self._expires) <= self.max_size:
+            return
+        for key in [k for k, exp in self._expires.items() if exp <= now]:
+            del self._expires[key]
+        while len(self._expires) > self.max_size:
+            self._expires.popitem(last=False)
+
+
+class PostgresCooldownStore(CooldownStore):
+    def __init__(self, max_size: int = 10000):
+        # Lokaler Vorfilter spart die DB-Query, solange dieser Prozess den
+        # Cooldown selbst gesetzt hat
+        self._local = MemoryCooldownStore(max_size=max_size)
+
+    def try_acquire(self, key: str, cooldown_seconds: float) -> bool:
+        if self._local.is_active(key):
+            return False
+
+        from sqlalchemy import text
+        from app.core.database import SessionLocal
+
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=cooldown_seconds)
+        db = SessionLocal()
+        try:
+            acquired = db.execute(
+                text(
+                    "INSERT INTO import_cooldowns (key, expires_at) "
+                    "VALUES (:key, :expires_at) "
+                    "ON CONFLICT (key) DO UPDATE SET expires_at = EXCLUDED.expires_at "
+                    "WHERE import_cooldowns.expires_at <= now() "
+                    "RETURNING key"
+                ),
+                {"key": key, "expires_at": expires_at},
+            ).first()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Cooldown store failed for {key}: {e}")
+            # Fallback: nur lokal entscheiden, Import nicht blockieren
+            return self._local.try_acquire(key, cooldown_seconds)
+        finally:
+            db.close()
+
+        if acquired:
+            self._local.try_acquire(key, cooldown_seconds)
+        return acquired is not None
+
+    def is_active(self, key: str) -> bool:
+        if self._local.is_active(key):
+            return True
+
+        from app.core.database import SessionLocal
+        from app.models.import_cooldown import ImportCooldown
+
+        db = SessionLocal()
+        try:
+            return (
+                db.query(ImportCooldown.key)
+                .filter(
+                    ImportCooldown.key == key,
+                    ImportCooldown.expires_at > datetime.now(timezone.utc),
+                )
+                .first()
+                is not None
+            )
+        except Exception as e:
+            logger.error(f"Cooldown store failed for {key}: {e}")
+            return False
+        finally:
+            db.close()
+
+    async def try_acquire_async(self, key: str, cooldown_seconds: float) -> bool:
+        if self._local.is_active(key):
+            return False
+        return await asyncio.to_thread(self.try_acquire, key, cooldown_seconds)
+
+    async def is_active_async(self, key: str) -> bool:
+        if self._local.is_active(key):
+            return True
+        return await asyncio.to_thread(self.is_active, key)
+
+
+def create_cooldown_store(backend: str, max_size: int = 10000) -> CooldownStore:
+    if backend == "postgres":
+        return PostgresCooldownStore(max_size=max_size)
+    if backend == "memory":
+        return MemoryCooldownStore(max_size=max_size)
+    raise ValueError(f"Unbekanntes Cooldown-Backend: {backend}")
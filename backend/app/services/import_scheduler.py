@@ -0,0 +1,238 @@
+"""
+Import Scheduler für n8n-Webhooks bzw. den nativen Import.
+
+Dedupliziert laufende Imports pro (Art, Schlüssel), wendet einen Cooldown an
+(CooldownStore: prozesslokal oder geteilt über Postgres; async Routes nutzen
+die *_async-Varianten) und nutzt einen gemeinsamen, gepoolten HTTP-Client.
+Zusätzlich merkt er sich pro Match, welche Daten bereits vorhanden sind – vorhandene Daten verschwinden
+nicht wieder, d.h. ist alles da, braucht ein Read gar keine Existenz-Query mehr.
+Trigger und Ausführungen werden in /metrics gezählt.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+import httpx
+from fastapi import BackgroundTasks
+
+from app.core.metrics import webhook_runs, webhook_triggers
+from app.services.cooldown_store import (
+    CooldownStore,
+    MemoryCooldownStore,
+    create_cooldown_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ImportScheduler:
+    def __init__(
+        self,
+        cooldown_seconds: int = 120,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        presence_cache_size: int = 5000,
+        cooldown_store: CooldownStore | None = None,
+    ):
+        self.cooldown_seconds = cooldown_seconds
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.presence_cache_size = presence_cache_size
+        self._client: httpx.AsyncClient | None = None
+        self._in_flight: set[tuple[str, Hashable]] = set()
+        self.cooldown_store = cooldown_store or MemoryCooldownStore()
+        self._present: OrderedDict[int, frozenset[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        return self._client
+
+    def schedule(
+        self,
+        background_tasks: BackgroundTasks,
+        kind: str,
+        key: Hashable,
+        url: str,
+        payload: dict,
+        cooldown_seconds: float | None = None,
+    ) -> bool:
+        """Plant einen Webhook-Aufruf, außer er läuft bereits oder ist im Cooldown."""
+        return self.schedule_call(
+            background_tasks,
+            kind,
+            key,
+            self._post_webhook,
+            url,
+            payload,
+            cooldown_seconds=cooldown_seconds,
+        )
+
+    async def schedule_async(
+        self,
+        background_tasks: BackgroundTasks,
+        kind: str,
+        key: Hashable,
+        url: str,
+        payload: dict,
+        cooldown_seconds: float | None = None,
+    ) -> bool:
+        """schedule für async Routes (Cooldown-Store blockiert den Loop nicht)."""
+        return await self.schedule_call_async(
+            background_tasks,
+            kind,
+            key,
+            self._post_webhook,
+            url,
+            payload,
+            cooldown_seconds=cooldown_seconds,
+        )
+
+    def schedule_call(
+        self,
+        background_tasks: BackgroundTasks,
+        kind: str,
+        key: Hashable,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        cooldown_seconds: float | None = None,
+    ) -> bool:
+        """Wie schedule, führt aber eine beliebige Coroutine aus (z.B. den
+        nativen Import) statt eines Webhooks."""
+        task_key = (kind, key)
+        if not self._claim(task_key):
+            return False
+        acquired = self.cooldown_store.try_acquire(
+            f"{kind}:{key}", self._cooldown(cooldown_seconds)
+        )
+        return self._enqueue(background_tasks, task_key, acquired, func, *args)
+
+    async def schedule_call_async(
+        self,
+        background_tasks: BackgroundTasks,
+        kind: str,
+        key: Hashable,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        cooldown_seconds: float | None = None,
+    ) -> bool:
+        """schedule_call für async Routes."""
+        task_key = (kind, key)
+        if not self._claim(task_key):
+            return False
+        try:
+            acquired = await self.cooldown_store.try_acquire_async(
+                f"{kind}:{key}", self._cooldown(cooldown_seconds)
+            )
+        except BaseException:
+            # z.B. Request abgebrochen während des DB-Roundtrips
+            with self._lock:
+                self._in_flight.discard(task_key)
+            raise
+        return self._enqueue(background_tasks, task_key, acquired, func, *args)
+
+    def is_cooling_down(self, kind: str, key: Hashable) -> bool:
+        return self.cooldown_store.is_active(f"{kind}:{key}")
+
+    async def is_cooling_down_async(self, kind: str, key: Hashable) -> bool:
+        return await self.cooldown_store.is_active_async(f"{kind}:{key}")
+
+    async def mark_async(self, kind: str, key: Hashable, seconds: float) -> None:
+        """Setzt einen Marker (z.B. "Import schreibt noch"), abfragbar per
+        is_cooling_down_async."""
+        await self.cooldown_store.try_acquire_async(f"{kind}:{key}", seconds)
+
+    def _cooldown(self, cooldown_seconds: float | None) -> float:
+        return self.cooldown_seconds if cooldown_seconds is None else cooldown_seconds
+
+    def _claim(self, task_key: tuple[str, Hashable]) -> bool:
+        with self._lock:
+            if task_key in self._in_flight:
+                webhook_triggers.inc(task_key[0], "in_flight")
+                return False
+            self._in_flight.add(task_key)
+        return True
+
+    def _enqueue(
+        self,
+        background_tasks: BackgroundTasks,
+        task_key: tuple[str, Hashable],
+        acquired: bool,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+    ) -> bool:
+        kind, key = task_key
+        if not acquired:
+            with self._lock:
+                self._in_flight.discard(task_key)
+            webhook_triggers.inc(kind, "cooldown")
+            return False
+
+        webhook_triggers.inc(kind, "scheduled")
+        background_tasks.add_task(self._run, task_key, func, *args)
+        logger.info(f"Import scheduled: {kind} for {key}")
+        return True
+
+    async def _run(self, task_key: tuple[str, Hashable], func, *args):
+        kind, key = task_key
+        try:
+            result = await func(*args)
+            logger.info(f"{kind} import for {key}: {result}")
+            webhook_runs.inc(kind, "ok")
+        except Exception as e:
+            logger.error(f"{kind} import failed for {key}: {e}")
+            webhook_runs.inc(kind, "error")
+        finally:
+            with self._lock:
+                self._in_flight.discard(task_key)
+
+    async def _post_webhook(self, url: str, payload: dict) -> int:
+        resp = await self.client.post(url, json=payload)
+        return resp.status_code
+
+    # ── Data-Present-Cache pro Match ──────────────────────
+
+    def missing_kinds(
+        self,
+        match_id: int,
+        kinds: tuple[str, ...],
+        load_presence: Callable[[], dict[str, bool]],
+    ) -> list[str]:
+        """Fehlende Datenarten eines Matches; fragt die DB nur, solange
+        noch nicht alle Arten als vorhanden bekannt sind."""
+        with self._lock:
+            known = self._present.get(match_id, frozenset())
+        if known.issuperset(kinds):
+            return []
+
+        presence = load_presence()
+        present = known | {k for k, v in presence.items() if v}
+        with self._lock:
+            self._present[match_id] = frozenset(present)
+            self._present.move_to_end(match_id)
+            while len(self._present) > self.presence_cache_size:
+                self._present.popitem(last=False)
+        return [k for k in kinds if k not in present]
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Singleton
+from app.core.config import settings
+
+import_scheduler = ImportScheduler(
+    cooldown_seconds=settings.IMPORT_COOLDOWN_SECONDS,
+    cooldown_store=create_cooldown_store(
+        settings.IMPORT_COOLDOWN_BACKEND, max_size=settings.IMPORT_COOLDOWN_MAX_KEYS
+    ),
+)
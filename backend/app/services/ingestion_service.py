@@ -0,0 +1,662 @@
+"""
+Native Ingestion Service (Ersatz für die n8n-Import-Workflows).
+
+Lädt Fixture-Daten über den ApiFootballClient (rate-limited, coalesced,
+gecacht) parallel und schreibt sie per Bulk-Upsert – ein Statement pro
+Datenart statt ein Insert-Node pro Zeile. Die Mappings entsprechen den
+Code-Nodes der Workflows in N8N/*.json.
+
+Die HTTP-Abrufe laufen async, die DB-Schreibzugriffe in einem Thread mit
+eigener Session (sync Engine).
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.match import Match
+from app.models.synthetic_event import SyntheticEvent
+from app.models.team import Team
+from app.repositories.event_repository import EventRepository
+from app.repositories.lineup_repository import LineupRepository
+from app.repositories.match_statistic_repository import MatchStatisticRepository
+from app.repositories.player_statistic_repository import PlayerStatisticRepository
+from app.services.api_football_client import ApiFootballClient
+from app.services.match_context_cache import match_context_cache
+from app.services.live_stats_detector import (
+    LiveStatsDetector,
+    StatsObservation,
+    live_stats_detector,
+)
+
+logger = logging.getLogger(__name__)
+
+# Datenart → (Endpoint, Query-Parameter für die Fixture-ID)
+ENDPOINTS = {
+    "fixture": ("fixtures", "id"),
+    "events": ("fixtures/events", "fixture"),
+    "statistics": ("fixtures/statistics", "fixture"),
+    "lineups": ("fixtures/lineups", "fixture"),
+    "player_statistics": ("fixtures/players", "fixture"),
+    "injuries": ("injuries", "fixture"),
+    "predictions": ("predictions", "fixture"),
+}
+# Statistiken laufen bei Live-Imports gesammelt über import_live_stats
+LIVE_KINDS = ("fixture", "events")
+
+FINISHED_STATUSES = {"FT", "AET", "PEN"}
+LIVE_STATUSES = {"1H", "HT", "2H", "ET", "BT", "P", "LIVE", "INT"}
+
+STAT_FIELDS = {
+    "Shots on Goal": "shots_on_goal",
+    "Shots off Goal": "shots_off_goal",
+    "Total Shots": "total_shots",
+    "Blocked Shots": "blocked_shots",
+    "Shots insidebox": "shots_insidebox",
+    "Shots outsidebox": "shots_outsidebox",
+    "Fouls": "fouls",
+    "Corner Kicks": "corner_kicks",
+    "Offsides": "offsides",
+    "Ball Possession": "ball_possession",
+    "Yellow Cards": "yellow_cards",
+    "Red Cards": "red_cards",
+    "Goalkeeper Saves": "goalkeeper_saves",
+    "Total passes": "total_passes",
+    "Passes accurate": "passes_accurate",
+    "Passes %": "passes_percentage",
+}
+
+
+# ── Mapping API-Football → Spalten ───────────────────────
+
+
+def map_status(short: Optional[str]) -> str:
+    if short in FINISHED_STATUSES:
+        return "finished"
+    if short in LIVE_STATUSES:
+        return "live"
+    return "scheduled"
+
+
+def _stat_value(value: Any) -> int:
+    """'55%' → 55, '1.45' → 1, None → 0 (wie im n8n-Workflow)."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        value = value.replace("%", "").strip()
+        try:
+            return round(float(value))
+        except ValueError:
+            return 0
+    return int(value)
+
+
+def parse_events(response: list, match_id: int, team_ids: dict) -> list[dict]:
+    return [
+        {
+            "match_id": match_id,
+            "minute": e["time"]["elapsed"],
+            "extra_time": e["time"].get("extra"),
+            "team_id": team_ids.get((e.get("team") or {}).get("id")),
+            "player_id": (e.get("player") or {}).get("id"),
+            "player_name": (e.get("player") or {}).get("name"),
+            "assist_id": (e.get("assist") or {}).get("id"),
+            "assist_name": (e.get("assist") or {}).get("name"),
+            "type": e["type"],
+            "detail": e.get("detail"),
+            "comments": e.get("comments"),
+        }
+        for e in response
+        if e.get("time", {}).get("elapsed") is not None
+    ]
+
+
+def parse_statistics(response: list, match_id: int, team_ids: dict) -> list[dict]:
+    rows = []
+    for team_data in response:
+        team_id = team_ids.get(team_data["team"]["id"])
+        if team_id is None:
+            continue
+        row = {"match_id": match_id, "team_id": team_id}
+        row.update({column: 0 for column in STAT_FIELDS.values()})
+        for stat in team_data.get("statistics", []):
+            column = STAT_FIELDS.get(stat["type"])
+            if column:
+                row[column] = _stat_value(stat.get("value"))
+        rows.append(row)
+    return rows
+
+
+def parse_lineups(response: list, match_id: int, team_ids: dict) -> list[dict]:
+    rows = []
+    for team_data in response:
+        team_id = team_ids.get(team_data["team"]["id"])
+        if team_id is None:
+            continue
+        coach = team_data.get("coach") or {}
+        players = [(p["player"], False) for p in team_data.get("startXI") or []] + [
+            (p["player"], True) for p in team_data.get("substitutes") or []
+        ]
+        for player, is_substitute in players:
+            rows.append(
+                {
+                    "match_id": match_id,
+                    "team_id": team_id,
+                    "formation": team_data.get("formation"),
+                    "coach_id": coach.get("id"),
+                    "coach_name": coach.get("name"),
+                    "player_id": player["id"],
+                    "player_name": player.get("name"),
+                    "number": player.get("number"),
+                    "position": player.get("pos"),
+                    "grid": player.get("grid"),
+                    "is_substitute": is_substitute,
+                }
+            )
+    return rows
+
+
+def parse_player_statistics(
+    response: list, match_id: int, team_ids: dict
+) -> list[dict]:
+    rows = []
+    for team_data in response:
+        team_id = team_ids.get(team_data["team"]["id"])
+        if team_id is None:
+            continue
+        for player_data in team_data.get("players", []):
+            if not player_data.get("statistics"):
+                continue
+            p = player_data["player"]
+            s = player_data["statistics"][0]
+            g = s.get("games") or {}
+            goals = s.get("goals") or {}
+            passes = s.get("passes") or {}
+            shots = s.get("shots") or {}
+            tackles = s.get("tackles") or {}
+            duels = s.get("duels") or {}
+            dribbles = s.get("dribbles") or {}
+            fouls = s.get("fouls") or {}
+            cards = s.get("cards") or {}
+            penalty = s.get("penalty") or {}
+            rows.append(
+                {
+                    "match_id": match_id,
+                    "team_id": team_id,
+                    "player_id": p["id"],
+                    "player_name": p.get("name"),
+                    "player_photo": p.get("photo"),
+                    "minutes_played": g.get("minutes") or 0,
+                    "number": g.get("number"),
+                    "position": g.get("position"),
+                    "rating": float(g["rating"]) if g.get("rating") else None,
+                    "captain": bool(g.get("captain")),
+                    "substitute": bool(g.get("substitute")),
+                    "offsides": s.get("offsides"),
+                    "shots_total": shots.get("total"),
+                    "shots_on": shots.get("on"),
+                    "goals_total": goals.get("total") or 0,
+                    "goals_conceded": goals.get("conceded"),
+                    "goals_assists": goals.get("assists") or 0,
+                    "goals_saves": goals.get("saves"),
+                    "passes_total": passes.get("total"),
+                    "passes_key": passes.get("key"),
+                    "passes_accuracy": (
+                        int(passes["accuracy"]) if passes.get("accuracy") else None
+                    ),
+                    "tackles_total": tackles.get("total"),
+                    "tackles_blocks": tackles.get("blocks"),
+                    "tackles_interceptions": tackles.get("interceptions"),
+                    "duels_total": duels.get("total"),
+                    "duels_won": duels.get("won"),
+                    "dribbles_attempts": dribbles.get("attempts"),
+                    "dribbles_success": dribbles.get("success"),
+                    "dribbles_past": dribbles.get("past"),
+                    "fouls_drawn": fouls.get("drawn"),
+                    "fouls_committed": fouls.get("committed"),
+                    "cards_yellow": cards.get("yellow") or 0,
+                    "cards_red": cards.get("red") or 0,
+                    "penalty_won": penalty.get("won"),
+                    # Tippfehler "commited" stammt aus der API
+                    "penalty_committed": penalty.get("commited"),
+                    "penalty_scored": penalty.get("scored") or 0,
+                    "penalty_missed": penalty.get("missed") or 0,
+                    "penalty_saved": penalty.get("saved"),
+                }
+            )
+    return rows
+
+
+def parse_injuries(response: list, fixture_id: int) -> list[dict]:
+    """Verletzungen gruppiert pro Team (context_data für pre_match_injuries)."""
+    grouped: dict[int, dict] = {}
+    for entry in response:
+        team = entry["team"]
+        group = grouped.setdefault(
+            team["id"],
+            {
+                "fixture_id": fixture_id,
+                "team_id": team["id"],
+                "team_name": team.get("name"),
+                "players": [],
+            },
+        )
+        player = entry["player"]
+        group["players"].append(
+            {
+                "player_id": player.get("id"),
+                "player_name": player.get("name"),
+                "type": player.get("type"),
+                "reason": player.get("reason"),
+            }
+        )
+    return list(grouped.values())
+
+
+def parse_prediction(response: list, fixture_id: int) -> Optional[dict]:
+    """context_data für pre_match_prediction."""
+    if not response:
+        return None
+    data = response[0]
+    pred = data.get("predictions") or {}
+    comp = data.get("comparison") or {}
+
+    def extract_team(team: dict) -> dict:
+        last_5 = team.get("last_5") or {}
+        league = team.get("league") or {}
+        fixtures = league.get("fixtures") or {}
+        goals = last_5.get("goals") or {}
+        return {
+            "name": team.get("name"),
+            "form": last_5.get("form"),
+            "att": last_5.get("att"),
+            "def": last_5.get("def"),
+            "goals_for_avg": (goals.get("for") or {}).get("average"),
+            "goals_against_avg": (goals.get("against") or {}).get("average"),
+            "wins_total": (fixtures.get("wins") or {}).get("total"),
+            "draws_total": (fixtures.get("draws") or {}).get("total"),
+            "loses_total": (fixtures.get("loses") or {}).get("total"),
+            "clean_sheets": (league.get("clean_sheet") or {}).get("total"),
+            "failed_to_score": (league.get("failed_to_score") or {}).get("total"),
+        }
+
+    percent = pred.get("percent") or {}
+    teams = data.get("teams") or {}
+    return {
+        "fixture_id": fixture_id,
+        "winner_name": (pred.get("winner") or {}).get("name"),
+        "winner_comment": (pred.get("winner") or {}).get("comment"),
+        "advice": pred.get("advice"),
+        "percent_home": percent.get("home"),
+        "percent_draw": percent.get("draw"),
+        "percent_away": percent.get("away"),
+        "home": extract_team(teams.get("home") or {}),
+        "away": extract_team(teams.get("away") or {}),
+        "comparison": {
+            k: comp.get(k) for k in ("form", "att", "def", "h2h", "goals", "total")
+        },
+    }
+
+
+def _team_external_ids(kind: str, response: list) -> set[int]:
+    if kind == "events":
+        return {(e.get("team") or {}).get("id") for e in response} - {None}
+    if kind in ("statistics", "lineups", "player_statistics", "injuries"):
+        return {d["team"]["id"] for d in response}
+    return set()
+
+
+class IngestionService:
+    def __init__(
+        self,
+        client: ApiFootballClient,
+        session_factory: Optional[Callable[[], Session]] = None,
+        detector: Optional[LiveStatsDetector] = None,
+    ):
+        self.client = client
+        self._session_factory = session_factory
+        self.detector = detector or live_stats_detector
+
+    @property
+    def session_factory(self) -> Callable[[], Session]:
+        if self._session_factory is None:
+            from app.core.database import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory
+
+    async def import_fixture(
+        self, fixture_id: int, kinds: Optional[tuple[str, ...]] = None
+    ) -> dict[str, Any]:
+        """
+        Importiert die angegebenen Datenarten einer Fixture (API-Football ID).
+
+        Returns:
+            Pro Datenart die Anzahl geschriebener Zeilen bzw. eine Fehlermeldung
+        """
+        kinds = tuple(kinds or ENDPOINTS)
+        unknown = set(kinds) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unbekannte Datenarten: {sorted(unknown)}")
+
+        results = await asyncio.gather(
+            *(
+                self.client.get(ENDPOINTS[kind][0], **{ENDPOINTS[kind][1]: fixture_id})
+                for kind in kinds
+            ),
+            return_exceptions=True,
+        )
+
+        summary: dict[str, Any] = {}
+        payloads: dict[str, list] = {}
+        for kind, result in zip(kinds, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Ingestion {kind} for fixture {fixture_id} failed: {result}"
+                )
+                summary[kind] = f"error: {result}"
+            else:
+                payloads[kind] = result
+
+        if payloads:
+            summary.update(await asyncio.to_thread(self._write, fixture_id, payloads))
+        return summary
+
+    async def import_live(self) -> dict[int, dict[str, Any]]:
+        """Importiert Spielstand, Events und Statistiken aller laufenden Matches."""
+        live = await self.client.get("fixtures", live="all")
+        known = await asyncio.to_thread(
+            self._known_fixtures, [f["fixture"]["id"] for f in live]
+        )
+        results = dict(
+            zip(
+                known,
+                await asyncio.gather(
+                    *(
+                        self.import_fixture(fixture_id, LIVE_KINDS)
+                        for fixture_id in known
+                    )
+                ),
+            )
+        )
+        if known:
+            stats = await self.import_live_stats(known)
+            for fixture_id, summary in stats.items():
+                results.setdefault(fixture_id, {}).update(summary)
+        return results
+
+    async def import_live_stats(
+        self, fixture_ids: Optional[list[int]] = None
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Statistiken aller Live-Matches in einem Durchlauf: ein Upsert für alle
+        Matches und Schwellwert-Erkennung (live_stats_update) gegen den
+        Snapshot im Speicher statt einer DB-Abfrage pro Match.
+
+        Args:
+            fixture_ids: API-Football IDs; Standard: alle Matches mit Status live
+
+        Returns:
+            Pro Fixture die Anzahl Statistik-Zeilen und die IDs neuer
+            live_stats_update Events
+        """
+        matches = await asyncio.to_thread(self._live_matches, fixture_ids)
+        results = await asyncio.gather(
+            *(
+                self.client.get("fixtures/statistics", fixture=m["fixture_id"])
+                for m in matches
+            ),
+            return_exceptions=True,
+        )
+
+        summary: dict[int, dict[str, Any]] = {}
+        payloads: list[tuple[dict, list]] = []
+        for match, result in zip(matches, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Ingestion statistics for fixture {match['fixture_id']} "
+                    f"failed: {result}"
+                )
+                summary[match["fixture_id"]] = {"statistics": f"error: {result}"}
+            else:
+                payloads.append((match, result))
+
+        if payloads:
+            summary.update(await asyncio.to_thread(self._write_live_stats, payloads))
+        return summary
+
+    # ── DB-Seite (läuft im Thread) ───────────────────────
+
+    def _known_fixtures(self, fixture_ids: list[int]) -> list[int]:
+        if not fixture_ids:
+            return []
+        db = self.session_factory()
+        try:
+            return [
+                external_id
+                for (external_id,) in db.query(Match.external_id).filter(
+                    Match.external_id.in_(fixture_ids)
+                )
+            ]
+        finally:
+            db.close()
+
+    def _live_matches(self, fixture_ids: Optional[list[int]]) -> list[dict]:
+        db = self.session_factory()
+        try:
+            query = db.query(Match).options(
+                joinedload(Match.home_team), joinedload(Match.away_team)
+            )
+            if fixture_ids is None:
+                query = query.filter(Match.status == "live")
+            else:
+                query = query.filter(Match.external_id.in_(fixture_ids))
+            return [
+                {
+                    "match_id": m.id,
+                    "fixture_id": m.external_id,
+                    "minute": m.minute,
+                    "teams": {
+                        t.external_id: (t.id, t.name)
+                        for t in (m.home_team, m.away_team)
+                    },
+                    "home_team": m.home_team.name,
+                    "away_team": m.away_team.name,
+                }
+                for m in query.all()
+                if m.external_id is not None
+            ]
+        finally:
+            db.close()
+
+    def _write_live_stats(
+        self, payloads: list[tuple[dict, list]]
+    ) -> dict[int, dict[str, Any]]:
+        rows: list[dict] = []
+        observations: list[StatsObservation] = []
+        counts: dict[int, int] = {}
+        for match, response in payloads:
+            team_ids = {ext: ids[0] for ext, ids in match["teams"].items()}
+            match_rows = parse_statistics(response, match["match_id"], team_ids)
+            counts[match["fixture_id"]] = len(match_rows)
+            rows.extend(match_rows)
+            names = {ids[0]: (ext, ids[1]) for ext, ids in match["teams"].items()}
+            for row in match_rows:
+                external_id, team_name = names[row["team_id"]]
+                observations.append(
+                    StatsObservation(
+                        match_id=row["match_id"],
+                        team_id=row["team_id"],
+                        stats=row,
+                        context={
+                            "fixture_id": match["fixture_id"],
+                            "team_id": external_id,
+                            "team_name": team_name,
+                            "home_team": match["home_team"],
+                            "away_team": match["away_team"],
+                            "minute": match["minute"],
+                        },
+                    )
+                )
+
+        db = self.session_factory()
+        try:
+            # Erkennung vor dem Upsert: ein Kaltstart liest den alten Stand
+            events = self.detector.process(db, observations)
+            db.flush()
+            event_ids: dict[int, list[int]] = {}
+            for event in events:
+                fixture_id = event.context_data["fixture_id"]
+                event_ids.setdefault(fixture_id, []).append(event.id)
+            MatchStatisticRepository(db).upsert_many(rows)
+            # Snapshots erst nach dem Commit vorrücken: schlägt der Upsert
+            # fehl, vergleicht der nächste Durchlauf wieder mit dem alten Stand
+            self.detector.advance(observations)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Ingestion live statistics failed: {e}")
+            return {f: {"statistics": f"error: {e}"} for f in counts}
+        finally:
+            db.close()
+
+        return {
+            fixture_id: {
+                "statistics": count,
+                "live_stats_events": event_ids.get(fixture_id, []),
+            }
+            for fixture_id, count in counts.items()
+        }
+
+    def _write(self, fixture_id: int, payloads: dict[str, list]) -> dict[str, Any]:
+        db = self.session_factory()
+        try:
+            match = db.query(Match).filter(Match.external_id == fixture_id).first()
+            if not match:
+                return {kind: "match_not_found" for kind in payloads}
+
+            external_team_ids = set()
+            for kind, response in payloads.items():
+                external_team_ids |= _team_external_ids(kind, response)
+            team_ids = dict(
+                db.query(Team.external_id, Team.id)
+                .filter(Team.external_id.in_(external_team_ids))
+                .all()
+            )
+
+            summary: dict[str, Any] = {}
+            for kind, response in payloads.items():
+                try:
+                    summary[kind] = self._write_kind(
+                        db, kind, response, match, fixture_id, team_ids
+                    )
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Ingestion {kind} for fixture {fixture_id}: {e}")
+                    summary[kind] = f"error: {e}"
+            return summary
+        finally:
+            db.close()
+
+    def _write_kind(
+        self,
+        db: Session,
+        kind: str,
+        response: list,
+        match: Match,
+        fixture_id: int,
+        team_ids: dict,
+    ) -> int:
+        if kind == "fixture":
+            return self._update_match(db, match, response)
+        if kind == "events":
+            return EventRepository(db).upsert_many(
+                parse_events(response, match.id, team_ids)
+            )
+        if kind == "statistics":
+            return MatchStatisticRepository(db).upsert_many(
+                parse_statistics(response, match.id, team_ids)
+            )
+        if kind == "lineups":
+            return LineupRepository(db).upsert_many(
+                parse_lineups(response, match.id, team_ids)
+            )
+        if kind == "player_statistics":
+            return PlayerStatisticRepository(db).upsert_many(
+                parse_player_statistics(response, match.id, team_ids)
+            )
+        if kind == "injuries":
+            groups = parse_injuries(response, fixture_id)
+            for group in groups:
+                self._upsert_synthetic(
+                    db,
+                    match.id,
+                    "pre_match_injuries",
+                    group,
+                    team_id=team_ids.get(group["team_id"]),
+                )
+            db.commit()
+            return len(groups)
+        if kind == "predictions":
+            context = parse_prediction(response, fixture_id)
+            if context is None:
+                return 0
+            self._upsert_synthetic(db, match.id, "pre_match_prediction", context)
+            db.commit()
+            return 1
+        raise ValueError(f"Unbekannte Datenart: {kind}")
+
+    def _update_match(self, db: Session, match: Match, response: list) -> int:
+        if not response:
+            return 0
+        data = response[0]
+        status = data["fixture"]["status"]
+        match.status = map_status(status.get("short"))
+        match.minute = status.get("elapsed")
+        match.score_home = data["goals"].get("home") or 0
+        match.score_away = data["goals"].get("away") or 0
+        db.commit()
+        # erst nach dem Commit: schlägt er fehl, behält der Cache den alten Stand
+        match_context_cache.update_match(match)
+        if match.status == "finished":
+            self.detector.forget(match.id)
+        return 1
+
+    @staticmethod
+    def _upsert_synthetic(
+        db: Session,
+        match_id: int,
+        event_type: str,
+        context: dict,
+        team_id: Optional[int] = None,
+    ) -> None:
+        """Ein Vorbericht-Event pro (Match, Typ, Team) – erneute Imports
+        aktualisieren context_data statt Duplikate anzulegen."""
+        existing = (
+            db.query(SyntheticEvent)
+            .filter(
+                SyntheticEvent.match_id == match_id,
+                SyntheticEvent.event_type == event_type,
+                SyntheticEvent.team_id == team_id,
+            )
+            .first()
+        )
+        if existing:
+            existing.context_data = context
+        else:
+            db.add(
+                SyntheticEvent(
+                    match_id=match_id,
+                    team_id=team_id,
+                    event_type=event_type,
+                    severity="medium",
+                    context_data=context,
+                )
+            )
+
+
+# Singleton
+from app.services.api_football_client import api_football_client
+
+ingestion_service = IngestionService(client=api_football_client)
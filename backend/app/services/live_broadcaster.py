@@ -0,0 +1,160 @@
+"""
+Live Broadcaster für Push-Updates pro Match.
+
+Hält pro Match eine Liste von Subscriber-Queues (WebSocket / SSE) und verteilt
+Deltas (neue/geänderte TickerEntries, Events, MatchStatistics, Spielstand).
+Die Deltas werden über SQLAlchemy-Session-Events nach jedem Commit erzeugt,
+d.h. jeder Schreibzugriff über die API wird automatisch gepusht.
+
+Hinweis: In-Process – bei mehreren uvicorn-Workern erreicht ein Delta nur die
+Subscriber des Workers, der den Commit ausgeführt hat.
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.event import Event
+from app.models.match import Match
+from app.models.match_statistic import MatchStatistic
+from app.models.ticker_entry import TickerEntry
+
+logger = logging.getLogger(__name__)
+
+# Model → Delta-Typ
+_TRACKED_MODELS = {
+    TickerEntry: "ticker_entry",
+    Event: "event",
+    MatchStatistic: "match_statistic",
+}
+_SCORE_FIELDS = ("score_home", "score_away", "status", "minute")
+
+
+class LiveBroadcaster:
+    """Fan-out von Deltas an alle Subscriber eines Matches."""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def subscribe(self, match_id: int) -> AsyncIterator[asyncio.Queue]:
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(match_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                subs = self._subscribers.get(match_id)
+                if subs:
+                    subs.discard(queue)
+                    if not subs:
+                        del self._subscribers[match_id]
+
+    def subscriber_count(self, match_id: int) -> int:
+        return len(self._subscribers.get(match_id, ()))
+
+    def has_subscribers(self, match_id: int) -> bool:
+        return match_id in self._subscribers
+
+    def publish(self, match_id: int, message: dict) -> None:
+        """Thread-safe: darf aus sync Routen (Threadpool) aufgerufen werden."""
+        if not self.has_subscribers(match_id) or self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is self._loop:
+            self._deliver(match_id, message)
+        else:
+            self._loop.call_soon_threadsafe(self._deliver, match_id, message)
+
+    def _deliver(self, match_id: int, message: dict) -> None:
+        with self._lock:
+            queues = list(self._subscribers.get(match_id, ()))
+        for queue in queues:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Langsamer Client: Puffer verwerfen, Client lädt neu
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync", "match_id": match_id})
+
+
+live_broadcaster = LiveBroadcaster()
+
+
+# ── Delta-Erzeugung über Session-Events ──────────────────
+
+
+def _json_safe(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _loaded_columns(obj) -> dict:
+    """Bereits geladene Spaltenwerte (ohne zusätzliche Queries)."""
+    state = inspect(obj)
+    loaded = state.dict
+    return {
+        attr.key: _json_safe(loaded[attr.key])
+        for attr in state.mapper.column_attrs
+        if attr.key in loaded
+    }
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_live_changes(session: Session, flush_context) -> None:
+    changes = session.info.setdefault("live_changes", [])
+
+    for obj in list(session.new) + list(session.dirty):
+        op = "created" if obj in session.new else "updated"
+        kind = _TRACKED_MODELS.get(type(obj))
+        if kind:
+            if op == "updated" and not session.is_modified(obj):
+                continue
+            data = _loaded_columns(obj)
+            changes.append((obj.match_id, {"type": kind, "op": op, "data": data}))
+        elif isinstance(obj, Match) and op == "updated":
+            state = inspect(obj)
+            if any(state.attrs[f].history.has_changes() for f in _SCORE_FIELDS):
+                data = _loaded_columns(obj)
+                changes.append(
+                    (
+                        obj.id,
+                        {
+                            "type": "score",
+                            "op": op,
+                            "data": {k: data.get(k) for k in ("id",) + _SCORE_FIELDS},
+                        },
+                    )
+                )
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _publish_live_changes(session: Session) -> None:
+    for match_id, message in session.info.pop("live_changes", []):
+        live_broadcaster.publish(match_id, {**message, "match_id": match_id})
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_live_changes(session: Session) -> None:
+    session.info.pop("live_changes", None)
@@ -0,0 +1,212 @@
+"""
+Live-Stats Schwellwert-Erkennung (ersetzt den Code-Node "Stats vergleichen &
+Schwellwerte prüfen" aus N8N/Live_stats_worklow_LLM.json).
+
+Hält den letzten Statistik-Stand pro (Match, Team) im Speicher und wertet
+die Regeln in einem Durchlauf über alle Live-Matches aus: jede Regel läuft
+einmal spaltenweise über alle Zeilen, statt pro Match die vorherigen
+Statistiken aus der DB zu laden. Nur bei einem Kaltstart (Key noch nicht im
+Speicher) wird der Vorstand mit einer einzigen Query für alle fehlenden
+Matches aus match_statistics geladen.
+
+Treffer werden als SyntheticEvent (event_type live_stats_update) mit
+triggers/delta/curr_stats im context_data gespeichert – im selben Format wie
+bisher vom n8n-Workflow.
+"""
+
+import threading
+from typing import NamedTuple
+
+from sqlalchemy.orm import Session
+
+from app.models.match_statistic import MatchStatistic
+from app.models.synthetic_event import SyntheticEvent
+
+LIVE_STATS_EVENT_TYPE = "live_stats_update"
+
+# Verglichene Spalten (Reihenfolge = Index in den Vektoren)
+STAT_COLUMNS = (
+    "shots_on_goal",
+    "total_shots",
+    "ball_possession",
+    "corner_kicks",
+    "fouls",
+    "passes_percentage",
+)
+_COLUMN_INDEX = {c: i for i, c in enumerate(STAT_COLUMNS)}
+
+
+class ThresholdRule(NamedTuple):
+    column: str
+    threshold: float
+    label: str  # Format mit {delta} bzw. {sign}
+    absolute: bool = False
+
+    def format(self, delta: float) -> str:
+        sign = "+" if delta > 0 else ""
+        return self.label.format(delta=_fmt(delta), sign=sign)
+
+
+# Schwellwerte wie im n8n-Workflow
+DEFAULT_RULES = (
+    ThresholdRule("shots_on_goal", 1, "+{delta} Schuss aufs Tor"),
+    ThresholdRule("total_shots", 2, "+{delta} Schüsse gesamt"),
+    ThresholdRule(
+        "ball_possession", 5, "Ballbesitz-Shift: {sign}{delta}%", absolute=True
+    ),
+    ThresholdRule("corner_kicks", 1, "+{delta} Eckball"),
+    ThresholdRule("fouls", 1, "+{delta} Foul"),
+)
+
+
+class StatsObservation(NamedTuple):
+    """Aktueller Stand eines Teams in einem Live-Match."""
+
+    match_id: int
+    team_id: int
+    stats: dict
+    context: dict  # fixture_id, team_name, home_team, away_team, minute, ...
+
+
+class Detection(NamedTuple):
+    observation: StatsObservation
+    triggers: list[str]
+    curr_stats: dict
+    delta: dict
+
+
+def _fmt(value: float) -> float | int:
+    return int(value) if float(value).is_integer() else value
+
+
+def _vector(stats: dict) -> tuple[float, ...]:
+    return tuple(float(stats.get(c) or 0) for c in STAT_COLUMNS)
+
+
+class LiveStatsDetector:
+    def __init__(self, rules: tuple[ThresholdRule, ...] = DEFAULT_RULES):
+        self.rules = rules
+        self._snapshots: dict[tuple[int, int], tuple[float, ...]] = {}
+        self._lock = threading.Lock()
+
+    # ── Snapshot-Verwaltung ──────────────────────────────
+
+    def missing_match_ids(self, observations: list[StatsObservation]) -> set[int]:
+        with self._lock:
+            return {
+                o.match_id
+                for o in observations
+                if (o.match_id, o.team_id) not in self._snapshots
+            }
+
+    def warm_up(self, db: Session, match_ids: set[int]) -> None:
+        """Lädt den letzten gespeicherten Stand fehlender Matches (eine Query)."""
+        if not match_ids:
+            return
+        rows = (
+            db.query(MatchStatistic)
+            .filter(MatchStatistic.match_id.in_(match_ids))
+            .all()
+        )
+        with self._lock:
+            for row in rows:
+                key = (row.match_id, row.team_id)
+                self._snapshots.setdefault(
+                    key, _vector({c: getattr(row, c) for c in STAT_COLUMNS})
+                )
+
+    def forget(self, match_id: int) -> None:
+        """Match beendet – Snapshots freigeben."""
+        with self._lock:
+            for key in [k for k in self._snapshots if k[0] == match_id]:
+                del self._snapshots[key]
+
+    def advance(self, observations: list[StatsObservation]) -> None:
+        """Übernimmt die Beobachtungen als neuen Stand – erst nach dem Commit,
+        sonst gingen die Deltas eines fehlgeschlagenen Durchlaufs verloren."""
+        with self._lock:
+            for o in observations:
+                self._snapshots[(o.match_id, o.team_id)] = _vector(o.stats)
+
+    def snapshot_count(self) -> int:
+        return len(self._snapshots)
+
+    # ── Erkennung ────────────────────────────────────────
+
+    def detect(self, observations: list[StatsObservation]) -> list[Detection]:
+        """
+        Vergleicht alle Beobachtungen mit dem letzten Stand. Keys ohne
+        Vorstand liefern keine Trigger. Die Snapshots bleiben unverändert
+        (siehe advance).
+        """
+        if not observations:
+            return []
+
+        current = [_vector(o.stats) for o in observations]
+        with self._lock:
+            previous = [
+                self._snapshots.get((o.match_id, o.team_id)) for o in observations
+            ]
+
+        deltas = [
+            tuple(c - p for c, p in zip(curr, prev)) if prev else None
+            for curr, prev in zip(current, previous)
+        ]
+
+        # Spaltenweise: jede Regel einmal über alle Zeilen
+        triggers: list[list[str]] = [[] for _ in observations]
+        for rule in self.rules:
+            index = _COLUMN_INDEX[rule.column]
+            for row, delta in enumerate(deltas):
+                if delta is None:
+                    continue
+                value = delta[index]
+                if (abs(value) if rule.absolute else value) >= rule.threshold:
+                    triggers[row].append(rule.format(value))
+
+        return [
+            Detection(
+                observation=o,
+                triggers=row_triggers,
+                curr_stats={c: _fmt(v) for c, v in zip(STAT_COLUMNS, curr)},
+                delta={c: _fmt(v) for c, v in zip(STAT_COLUMNS, delta)},
+            )
+            for o, row_triggers, curr, delta in zip(
+                observations, triggers, current, deltas
+            )
+            if row_triggers
+        ]
+
+    def process(
+        self, db: Session, observations: list[StatsObservation]
+    ) -> list[SyntheticEvent]:
+        """
+        Warm-up (nur fehlende Keys), Erkennung und Speichern der
+        live_stats_update Events. Commit übernimmt der Aufrufer, danach
+        advance(observations).
+        """
+        self.warm_up(db, self.missing_match_ids(observations))
+        events = [
+            SyntheticEvent(
+                match_id=d.observation.match_id,
+                team_id=d.observation.team_id,
+                event_type=LIVE_STATS_EVENT_TYPE,
+                severity="medium",
+                minute=d.observation.context.get("minute"),
+                context_data={
+                    "match_id": d.observation.match_id,
+                    **d.observation.context,
+                    "triggers": d.triggers,
+                    "curr_stats": d.curr_stats,
+                    "delta": d.delta,
+                    "description": ", ".join(d.triggers),
+                },
+            )
+            for d in self.detect(observations)
+        ]
+        db.add_all(events)
+        return events
+
+
+# Singleton
+live_stats_detector = LiveStatsDetector()
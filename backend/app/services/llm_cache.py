@@ -0,0 +1,192 @@
+"""
+LLM Cache für generierte Ticker-Texte.
+
+Content-addressed: Schlüssel ist der SHA-256 aus normalisiertem Prompt + Modell.
+Im Speicher als LRU mit TTL; optional zusätzlich in Postgres (Tabelle llm_cache),
+damit Generierungen einen Neustart überleben. Ein DB-Treffer übernimmt die
+Rest-Laufzeit der Zeile; abgelaufene Zeilen löscht ein Hintergrund-Task beim
+Start und danach alle purge_interval_seconds.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(prompt: str, model: str) -> str:
+    """Normalisiert Whitespace und hasht Prompt + Modell."""
+    normalized = " ".join(prompt.split())
+    return hashlib.sha256(f"{model}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """LRU-Cache mit TTL, Hit/Miss-Zählern und optionalem Postgres-Backend."""
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: int = 3600,
+        persistent: bool = False,
+        purge_interval_seconds: float = 3600,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self.purge_interval_seconds = purge_interval_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._purge_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.purged = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, text = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return text
+            del self._entries[key]
+
+        if self.persistent:
+            row = await asyncio.to_thread(self._db_get, key)
+            if row is not None:
+                text, expires_at = row
+                remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+                self._store(key, text, min(remaining, self.ttl_seconds))
+                self.hits += 1
+                return text
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, text: str, model: str) -> None:
+        self._store(key, text)
+        if self.persistent:
+            await asyncio.to_thread(self._db_set, key, text, model)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def start(self) -> None:
+        """Startet das periodische Löschen abgelaufener DB-Zeilen."""
+        if self.persistent and self._purge_task is None:
+            self._purge_task = asyncio.create_task(self._purger())
+
+    async def stop(self) -> None:
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            await asyncio.gather(self._purge_task, return_exceptions=True)
+            self._purge_task = None
+
+    async def _purger(self) -> None:
+        while True:
+            try:
+                deleted = await asyncio.to_thread(self._db_purge)
+                self.purged += deleted
+                if deleted:
+                    logger.info(f"LLM cache: {deleted} expired rows deleted")
+            except Exception as e:
+                logger.error(f"LLM cache purge failed: {e}")
+            await asyncio.sleep(self.purge_interval_seconds)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "persistent": self.persistent,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "purged": self.purged,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def _store(self, key: str, text: str, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # ── Postgres-Backend (läuft in Thread, blockiert den Event-Loop nicht) ──
+
+    def _db_get(self, key: str) -> Optional[tuple[str, datetime]]:
+        """(Text, expires_at) der noch gültigen Zeile."""
+        from app.core.database import SessionLocal
+        from app.models.llm_cache_entry import LLMCacheEntry
+
+        db = SessionLocal()
+        try:
+            row = (
+                db.query(LLMCacheEntry)
+                .filter(
+                    LLMCacheEntry.key == key,
+                    LLMCacheEntry.expires_at > datetime.now(timezone.utc),
+                )
+                .first()
+            )
+            if row is None:
+                return None
+            expires_at = row.expires_at
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            return row.text, expires_at
+        except Exception as e:
+            logger.error(f"LLM cache read failed: {e}")
+            return None
+        finally:
+            db.close()
+
+    def _db_set(self, key: str, text: str, model: str) -> None:
+        from sqlalchemy.dialects.postgresql import insert
+        from app.core.database import SessionLocal
+        from app.models.llm_cache_entry import LLMCacheEntry
+
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+        stmt = insert(LLMCacheEntry).values(
+            key=key, model=model, text=text, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.key],
+            set_={"text": text, "model": model, "expires_at": expires_at},
+        )
+        db = SessionLocal()
+        try:
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"LLM cache write failed: {e}")
+        finally:
+            db.close()
+
+    def _db_purge(self) -> int:
+        from app.core.database import SessionLocal
+        from app.models.llm_cache_entry import LLMCacheEntry
+
+        db = SessionLocal()
+        try:
+            deleted = (
+                db.query(LLMCacheEntry)
+                .filter(LLMCacheEntry.expires_at < datetime.now(timezone.utc))
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return deleted
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
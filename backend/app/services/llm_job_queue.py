@@ -0,0 +1,469 @@
+"""
+LLM Job Queue für die Ticker-Text-Generierung.
+
+Statt den LLM-Aufruf im HTTP-Request abzuwarten, legen n8n / Frontend Jobs
+in der Tabelle llm_jobs an und fragen den Status ab. Ein Worker-Pool pro
+Prozess holt Jobs per SELECT ... FOR UPDATE SKIP LOCKED, d.h. mehrere
+uvicorn-Worker teilen sich die Queue ohne Doppelverarbeitung.
+
+- Prioritäten: Tore und Platzverweise vor übrigen Live-Events und
+  Live-Stats, danach Vorberichte, pre_match_team_stats zuletzt.
+- Reservierte Live-Worker nehmen nur Live-Jobs – ein großer Batch
+  Vorberichte blockiert Live-Events also nie.
+- Retry mit exponentiellem Backoff; Jobs abgestürzter Worker werden nach
+  LLM_JOB_LOCK_TIMEOUT_SECONDS wieder freigegeben.
+- Backpressure: ab LLM_JOB_MAX_QUEUED wartenden Jobs werden neue
+  Vorbericht-Jobs abgelehnt (Live-Jobs immer angenommen).
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.ticker_entry import TickerEntry
+from app.repositories.event_repository import EventRepository
+from app.repositories.llm_job_repository import LLMJobRepository
+from app.repositories.synthetic_event_repository import SyntheticEventRepository
+from app.repositories.ticker_entry_repository import TickerEntryRepository
+from app.services.llm_service import generate_ticker_text
+from app.services.match_context_cache import match_context_cache
+
+logger = logging.getLogger(__name__)
+
+# Prioritäten (kleiner = früher)
+PRIORITY_CRITICAL = 0  # Tore, Platzverweise
+PRIORITY_LIVE = 10  # übrige Live-Events, live_stats_update
+PRIORITY_PREMATCH = 50  # Vorberichte
+PRIORITY_BULK = 90  # pre_match_team_stats
+LIVE_PRIORITY_LIMIT = PRIORITY_PREMATCH  # priority < Limit = Live-Job
+
+RED_CARD_DETAILS = {"Red Card", "Second Yellow card"}
+
+
+class PermanentJobError(Exception):
+    """Fehler, bei dem ein Retry nichts ändert (z.B. Event gelöscht)."""
+
+
+def job_priority(event_type: Optional[str], detail: Optional[str] = None) -> int:
+    if event_type in ("Goal", "goal"):
+        return PRIORITY_CRITICAL
+    if event_type == "Card" and detail in RED_CARD_DETAILS:
+        return PRIORITY_CRITICAL
+    if event_type == "pre_match_team_stats":
+        return PRIORITY_BULK
+    if event_type and event_type.startswith("pre_match_"):
+        return PRIORITY_PREMATCH
+    return PRIORITY_LIVE
+
+
+class LLMJobQueue:
+    def __init__(
+        self,
+        workers: int = 4,
+        live_workers: int = 1,
+        poll_interval: float = 1.0,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 2.0,
+        retry_max_seconds: float = 60.0,
+        lock_timeout_seconds: float = 120.0,
+        max_queued: int = 500,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        self.workers = workers
+        self.live_workers = min(live_workers, workers)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.max_queued = max_queued
+        self._session_factory = session_factory
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stats = {"processed": 0, "failed": 0, "retried": 0}
+
+    @property
+    def session_factory(self) -> Callable[[], Session]:
+        if self._session_factory is None:
+            from app.core.database import SessionLocal
+
+            self._session_factory = SessionLocal
+        return self._session_factory
+
+    # ── Enqueue ──────────────────────────────────────────
+
+    async def enqueue(
+        self,
+        synthetic_event_ids: list[int],
+        event_ids: list[int],
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Legt Jobs an bzw. liefert bestehende Jobs derselben Ziele zurück.
+
+        Returns:
+            {"jobs": [...], "rejected": [...], "queue_depth": n, "backpressure": bool}
+        """
+        result = await asyncio.to_thread(
+            self._enqueue,
+            list(dict.fromkeys(synthetic_event_ids)),
+            list(dict.fromkeys(event_ids)),
+            params,
+        )
+        if result["jobs"] and self._wakeup is not None:
+            self._wakeup.set()
+        return result
+
+    def _enqueue(
+        self, synthetic_event_ids: list[int], event_ids: list[int], params: dict
+    ) -> dict[str, Any]:
+        db = self.session_factory()
+        try:
+            repo = LLMJobRepository(db)
+            queue_depth = repo.queued_count()
+            backpressure = queue_depth >= self.max_queued
+
+            candidates: list[dict] = []
+            rejected: list[dict] = []
+            syn_events = {
+                e.id: e
+                for e in SyntheticEventRepository(db).get_by_ids(synthetic_event_ids)
+            }
+            for syn_id in synthetic_event_ids:
+                e = syn_events.get(syn_id)
+                if e is None:
+                    rejected.append(
+                        {
+                            "kind": "synthetic",
+                            "target_id": syn_id,
+                            "reason": "not_found",
+                        }
+                    )
+                    continue
+                candidates.append(
+                    {
+                        "kind": "synthetic",
+                        "target_id": e.id,
+                        "match_id": e.match_id,
+                        "event_type": e.event_type,
+                        "priority": job_priority(e.event_type),
+                    }
+                )
+            events = {e.id: e for e in EventRepository(db).get_by_ids(event_ids)}
+            for event_id in event_ids:
+                e = events.get(event_id)
+                if e is None:
+                    rejected.append(
+                        {"kind": "event", "target_id": event_id, "reason": "not_found"}
+                    )
+                    continue
+                candidates.append(
+                    {
+                        "kind": "event",
+                        "target_id": e.id,
+                        "match_id": e.match_id,
+                        "event_type": e.type,
+                        "priority": job_priority(e.type, e.detail),
+                    }
+                )
+
+            # Bestehende Jobs werden nur zurückgegeben (fehlgeschlagene neu
+            # eingereiht), Backpressure gilt nur für neue Jobs
+            existing = repo.get_by_targets(
+                [(job["kind"], job["target_id"]) for job in candidates]
+            )
+            accepted = []
+            jobs = []
+            for job in candidates:
+                current = existing.get((job["kind"], job["target_id"]))
+                if current is not None and current.status != "failed":
+                    jobs.append(current)
+                elif backpressure and job["priority"] >= LIVE_PRIORITY_LIMIT:
+                    rejected.append(
+                        {
+                            "kind": job["kind"],
+                            "target_id": job["target_id"],
+                            "reason": "queue_full",
+                        }
+                    )
+                else:
+                    accepted.append(
+                        {**job, "params": params, "max_attempts": self.max_attempts}
+                    )
+
+            keys = [(j.kind, j.target_id) for j in jobs] + [
+                (job["kind"], job["target_id"]) for job in accepted
+            ]
+            repo.enqueue_many(accepted)
+            # nach dem Commit neu laden (auch die bereits bestehenden Jobs)
+            by_key = repo.get_by_targets(keys)
+            return {
+                "jobs": [by_key[key] for key in keys],
+                "rejected": rejected,
+                "queue_depth": queue_depth + len(accepted),
+                "backpressure": backpressure,
+            }
+        finally:
+            db.close()
+
+    def get_jobs(self, job_ids: list[int]) -> list:
+        db = self.session_factory()
+        try:
+            return LLMJobRepository(db).get_by_ids(job_ids)
+        finally:
+            db.close()
+
+    def stats(self) -> dict[str, Any]:
+        db = self.session_factory()
+        try:
+            repo = LLMJobRepository(db)
+            by_status = repo.count_by_status()
+            queued_live = repo.queued_count(LIVE_PRIORITY_LIMIT)
+        finally:
+            db.close()
+        queued = by_status.get("queued", 0)
+        running = bool(self._tasks)
+        return {
+            "workers": self.workers if running else 0,
+            "live_workers": self.live_workers if running else 0,
+            "by_status": by_status,
+            "queued_live": queued_live,
+            "queued_prematch": queued - queued_live,
+            "max_queued": self.max_queued,
+            "backpressure": queued >= self.max_queued,
+            **self._stats,
+        }
+
+    # ── Worker-Pool ──────────────────────────────────────
+
+    def start(self) -> None:
+        if self._tasks or self.workers <= 0:
+            return
+        self._wakeup = asyncio.Event()
+        prefix = f"{os.getpid()}"
+        for i in range(self.workers):
+            # Die ersten live_workers nehmen nur Live-Jobs
+            max_priority = LIVE_PRIORITY_LIMIT if i < self.live_workers else None
+            self._tasks.append(
+                asyncio.create_task(self._worker(f"{prefix}-{i}", max_priority))
+            )
+        self._tasks.append(asyncio.create_task(self._janitor()))
+        logger.info(
+            f"LLM job queue started: {self.workers} workers "
+            f"({self.live_workers} live only)"
+        )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._wakeup = None
+
+    async def _worker(self, worker_id: str, max_priority: Optional[int]) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self._claim, worker_id, max_priority)
+            except Exception as e:
+                logger.error(f"LLM job claim failed ({worker_id}): {e}")
+                job = None
+            if job is None:
+                await self._wait()
+                continue
+            try:
+                await self._execute(job)
+            except Exception as e:
+                # z.B. DB nicht erreichbar – Job wird vom Janitor freigegeben
+                logger.error(f"LLM job {job.id} could not be finalized: {e}")
+
+    async def _wait(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+    async def _janitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.lock_timeout_seconds / 2)
+            try:
+                requeued, failed = await asyncio.to_thread(self._requeue_stale)
+                if requeued:
+                    logger.warning(f"Requeued {requeued} stale LLM jobs")
+                if failed:
+                    self._stats["failed"] += failed
+                    logger.error(f"{failed} stale LLM jobs failed permanently")
+            except Exception as e:
+                logger.error(f"LLM job janitor failed: {e}")
+
+    def _claim(self, worker_id: str, max_priority: Optional[int]):
+        db = self.session_factory()
+        try:
+            return LLMJobRepository(db).claim(worker_id, max_priority)
+        finally:
+            db.close()
+
+    def _requeue_stale(self) -> tuple[int, int]:
+        db = self.session_factory()
+        try:
+            return LLMJobRepository(db).requeue_stale(self.lock_timeout_seconds)
+        finally:
+            db.close()
+
+    def _finish(self, job_id: int, method: str, *args) -> None:
+        db = self.session_factory()
+        try:
+            getattr(LLMJobRepository(db), method)(job_id, *args)
+        finally:
+            db.close()
+
+    async def _execute(self, job) -> None:
+        try:
+            ticker_entry_id = await self.process(job)
+        except PermanentJobError as e:
+            self._stats["failed"] += 1
+            await asyncio.to_thread(self._finish, job.id, "fail", str(e))
+        except Exception as e:
+            if job.attempts < job.max_attempts:
+                self._stats["retried"] += 1
+                delay = min(
+                    self.retry_max_seconds,
+                    self.retry_base_seconds * 2 ** (job.attempts - 1),
+                )
+                logger.warning(f"LLM job {job.id} failed, retry in {delay}s: {e}")
+                await asyncio.to_thread(self._finish, job.id, "fail", str(e), delay)
+            else:
+                self._stats["failed"] += 1
+                logger.error(f"LLM job {job.id} failed permanently: {e}")
+                await asyncio.to_thread(self._finish, job.id, "fail", str(e))
+        else:
+            self._stats["processed"] += 1
+            await asyncio.to_thread(self._finish, job.id, "complete", ticker_entry_id)
+
+    # ── Verarbeitung ─────────────────────────────────────
+
+    async def process(self, job) -> int:
+        """Generiert den Text eines Jobs und speichert den TickerEntry."""
+        loaded = await asyncio.to_thread(self._load, job)
+        if isinstance(loaded, int):
+            return loaded  # TickerEntry existiert bereits
+        text, model_used = await generate_ticker_text(**loaded)
+        return await asyncio.to_thread(self._store, job, text, model_used)
+
+    def _load(self, job) -> int | dict:
+        params = job.params or {}
+        db = self.session_factory()
+        try:
+            if job.kind == "synthetic":
+                syn_event = SyntheticEventRepository(db).get_by_id(job.target_id)
+                if not syn_event:
+                    raise PermanentJobError("SyntheticEvent not found")
+                existing = TickerEntryRepository(db).get_by_synthetic_event_ids(
+                    [job.target_id]
+                )
+                if existing:
+                    return existing[0].id
+                match_context = match_context_cache.get(
+                    db, syn_event.match_id, syn_event.minute
+                )
+                if match_context is None:
+                    raise PermanentJobError("Match not found")
+                return {
+                    "event_type": syn_event.event_type,
+                    "context_data": syn_event.context_data or {},
+                    "match_context": match_context,
+                    "style": params.get("style", "neutral"),
+                    "language": params.get("language", "de"),
+                    "provider": params.get("llm_provider"),
+                    "model": params.get("llm_model"),
+                }
+
+            event = EventRepository(db).get_by_id(job.target_id)
+            if not event:
+                raise PermanentJobError("Event not found")
+            existing = TickerEntryRepository(db).get_by_event(job.target_id)
+            if existing:
+                return existing.id
+            match_context = match_context_cache.get(db, event.match_id, event.minute)
+            if match_context is None:
+                raise PermanentJobError("Match not found")
+            return {
+                "event_type": event.type,
+                "event_detail": event.detail or "",
+                "minute": event.minute or 0,
+                "player_name": event.player_name,
+                "assist_name": event.assist_name,
+                "match_context": match_context,
+                "style": params.get("style", "neutral"),
+                "language": params.get("language", "de"),
+                "provider": params.get("llm_provider"),
+                "model": params.get("llm_model"),
+            }
+        finally:
+            db.close()
+
+    def _store(self, job, text: str, model_used: str) -> int:
+        params = job.params or {}
+        style = params.get("style", "neutral")
+        db = self.session_factory()
+        try:
+            # Erneut prüfen: während der Generierung kann ein anderer Pfad
+            # (Route, Batch, zweiter Worker nach Lock-Timeout) den Eintrag
+            # angelegt haben
+            entries = TickerEntryRepository(db)
+            if job.kind == "synthetic":
+                existing = entries.get_by_synthetic_event_ids([job.target_id])
+                if existing:
+                    return existing[0].id
+            else:
+                existing_entry = entries.get_by_event(job.target_id)
+                if existing_entry:
+                    return existing_entry.id
+
+            entry = TickerEntry(
+                match_id=job.match_id,
+                minute=0,
+                text=text,
+                mode="auto",
+                style=style,
+                language=params.get("language", "de"),
+                llm_model=model_used,
+            )
+            if job.kind == "synthetic":
+                syn_event = SyntheticEventRepository(db).get_by_id(job.target_id)
+                if not syn_event:
+                    raise PermanentJobError("SyntheticEvent not found")
+                entry.synthetic_event_id = syn_event.id
+                entry.minute = syn_event.minute or 0
+                syn_event.ticker_text = text
+                syn_event.ticker_style = style
+                syn_event.auto_generated = True
+            else:
+                event = EventRepository(db).get_by_id(job.target_id)
+                if not event:
+                    raise PermanentJobError("Event not found")
+                entry.event_id = event.id
+                entry.minute = event.minute or 0
+            db.add(entry)
+            db.commit()
+            return entry.id
+        finally:
+            db.close()
+
+
+# Singleton
+from app.core.config import settings
+
+llm_job_queue = LLMJobQueue(
+    workers=settings.LLM_JOB_WORKERS,
+    live_workers=settings.LLM_JOB_LIVE_WORKERS,
+    poll_interval=settings.LLM_JOB_POLL_INTERVAL_SECONDS,
+    max_attempts=settings.LLM_JOB_MAX_ATTEMPTS,
+    retry_base_seconds=settings.LLM_JOB_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.LLM_JOB_RETRY_MAX_SECONDS,
+    lock_timeout_seconds=settings.LLM_JOB_LOCK_TIMEOUT_SECONDS,
+    max_queued=settings.LLM_JOB_MAX_QUEUED,
+)
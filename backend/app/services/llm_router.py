@@ -0,0 +1,479 @@
+"""
+LLM Router: Hedging und Racing über mehrere LLM-Provider.
+
+Statt genau eines beim Import gewählten Providers hält der Router mehrere
+LLMService-Backends (LLM_PROVIDERS, z.B. "openrouter,gemini") und misst pro
+Backend die Latenz (gleitendes Fenster, Perzentile).
+
+- Routing: das Backend mit der niedrigsten p50-Latenz (Fehlerquote als
+  Aufschlag) startet zuerst; ohne ausreichend Messwerte gilt die
+  konfigurierte Reihenfolge.
+- Hedging: liegt nach der Hedge-Schwelle noch keine Antwort vor, startet
+  zusätzlich das nächste Backend. Die Schwelle ist das LLM_HEDGE_PERCENTILE
+  der bisherigen Latenzen des ersten Backends (Startwert LLM_HEDGE_AFTER_MS).
+- Die erste erfolgreiche Antwort gewinnt, laufende Verlierer werden
+  abgebrochen. Schlägt ein Backend fehl, startet sofort das nächste.
+- Circuit Breaker pro Backend: überschreiten Fehler- oder Langsam-Quote der
+  letzten Aufrufe das Budget, wird das Backend für LLM_BREAKER_OPEN_SECONDS
+  übersprungen; danach entscheidet ein einzelner Probe-Aufruf (half-open).
+- Adaptive Timeouts: p95 × LLM_ADAPTIVE_TIMEOUT_FACTOR statt pauschal
+  LLM_TIMEOUT_SECONDS (das bleibt die Obergrenze).
+- Degraded Mode: sind alle Backends offen oder fehlgeschlagen, liefert der
+  Template-Generator (_generate_mock_text) den Text (llm_model "template").
+- Routine-Events laut TICKER_TEMPLATE_EVENTS gehen ohne LLM-Aufruf direkt an
+  die Template-Engine (siehe ticker_templates).
+
+Für Tests lassen sich Mock-Backends mit fester Latenz konfigurieren:
+LLM_PROVIDERS="mock:1500,mock:200".
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Optional
+
+from app.services.llm_service import LLMService, _single_chunk
+from app.services.ticker_templates import TickerTemplateEngine
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """Latenzen (ms) und Fehler der letzten window Aufrufe eines Backends."""
+
+    def __init__(self, window: int = 200):
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._outcomes: deque[bool] = deque(maxlen=window)
+
+    def record(self, latency_ms: float) -> None:
+        self._latencies.append(latency_ms)
+        self._outcomes.append(True)
+
+    def record_error(self) -> None:
+        self._outcomes.append(False)
+
+    @property
+    def samples(self) -> int:
+        return len(self._latencies)
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Perzentil (nearest rank), None ohne Messwerte."""
+        if not self._latencies:
+            return None
+        values = sorted(self._latencies)
+        index = max(0, min(len(values) - 1, math.ceil(p / 100 * len(values)) - 1))
+        return values[index]
+
+    def snapshot(self) -> dict:
+        return {
+            "samples": self.samples,
+            "error_rate": round(self.error_rate, 3),
+            **{
+                f"p{p}": round(v, 1) if (v := self.percentile(p)) is not None else None
+                for p in (50, 95, 99)
+            },
+        }
+
+
+class CircuitBreaker:
+    """
+    closed → open, sobald Fehler- oder Langsam-Quote der letzten window
+    Aufrufe das Budget überschreiten. Nach open_seconds half_open: genau ein
+    Probe-Aufruf, Erfolg schließt den Breaker, Fehler öffnet ihn erneut.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_calls: int = 5,
+        error_rate: float = 0.5,
+        slow_call_ms: float = 5000,
+        slow_rate: float = 0.8,
+        open_seconds: float = 30.0,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_ms = slow_call_ms
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+        self.state = "closed"  # closed | open | half_open
+        self.opened_count = 0
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window)  # ok, slow
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """True, wenn ein Aufruf starten darf (reserviert ggf. den Probe)."""
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                return False
+            self.state = "half_open"
+        if self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record_success(self, latency_ms: float) -> None:
+        slow = latency_ms >= self.slow_call_ms
+        if self.state == "half_open":
+            self._probe_in_flight = False
+            if slow:
+                self._open()
+                return
+            self.state = "closed"
+        self._outcomes.append((True, slow))
+        self._evaluate()
+
+    def record_failure(self) -> None:
+        if self.state == "half_open":
+            self._probe_in_flight = False
+            self._open()
+            return
+        self._outcomes.append((False, False))
+        self._evaluate()
+
+    def release(self) -> None:
+        """Abgebrochener Aufruf (Hedge-Verlierer): zählt weder als Erfolg
+        noch als Fehler, gibt aber den Probe frei."""
+        if self.state == "half_open":
+            self._probe_in_flight = False
+
+    def _evaluate(self) -> None:
+        if (
+            not self.enabled
+            or self.state != "closed"
+            or len(self._outcomes) < self.min_calls
+        ):
+            return
+        total = len(self._outcomes)
+        errors = sum(1 for ok, _ in self._outcomes if not ok)
+        slow = sum(1 for _, is_slow in self._outcomes if is_slow)
+        if errors / total >= self.error_rate or slow / total >= self.slow_rate:
+            self._open()
+
+    def _open(self) -> None:
+        self.state = "open"
+        self.opened_count += 1
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "opened": self.opened_count}
+
+
+class NoBackendAvailable(Exception):
+    """Alle Circuit Breaker offen."""
+
+
+class LLMRouter:
+    def __init__(
+        self,
+        backends: list[LLMService],
+        hedge_enabled: bool = True,
+        hedge_after_ms: float = 1500,
+        hedge_percentile: float = 95.0,
+        hedge_min_ms: float = 150,
+        min_samples: int = 20,
+        window: int = 200,
+        breaker_factory: Optional[Callable[[], CircuitBreaker]] = None,
+        timeout_factor: float = 2.0,
+        timeout_min_ms: float = 1000,
+        fallback_enabled: bool = True,
+        templates: Optional[TickerTemplateEngine] = None,
+    ):
+        if not backends:
+            raise ValueError("Mindestens ein LLM-Backend erforderlich")
+        self.backends = backends
+        self.hedge_enabled = hedge_enabled
+        self.hedge_after_ms = hedge_after_ms
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_ms = hedge_min_ms
+        self.min_samples = min_samples
+        self.timeout_factor = timeout_factor
+        self.timeout_min_ms = timeout_min_ms
+        self.fallback_enabled = fallback_enabled
+        self.templates = templates
+        self.trackers = {b.name: LatencyTracker(window) for b in backends}
+        self.breakers = {
+            b.name: (breaker_factory or CircuitBreaker)() for b in backends
+        }
+        self._counters = {
+            b.name: {"calls": 0, "wins": 0, "errors": 0, "cancelled": 0}
+            for b in backends
+        }
+        self._hedges = 0
+        self._fallbacks = 0
+        self._templated = 0
+        self._fallback: Optional[LLMService] = None
+
+    @property
+    def fallback(self) -> LLMService:
+        """Template-Generator für den Degraded Mode (ohne Latenz, ohne Cache)."""
+        if self._fallback is None:
+            self._fallback = LLMService(
+                provider="mock",
+                model="template",
+                name="template",
+                mock_stream_chunk_ms=0,
+            )
+        return self._fallback
+
+    @property
+    def primary(self) -> LLMService:
+        """Backend für Streaming: schnellstes mit geschlossenem Breaker,
+        sonst der Template-Generator."""
+        for backend in self.ranked():
+            if self.breakers[backend.name].state == "closed":
+                return backend
+        return self.fallback if self.fallback_enabled else self.ranked()[0]
+
+    def ranked(self) -> list[LLMService]:
+        """Backends nach erwarteter Latenz; ohne Messwerte Konfig-Reihenfolge."""
+        if any(self.trackers[b.name].samples < self.min_samples for b in self.backends):
+            # Backends ohne Messwerte bleiben in Konfig-Reihenfolge vorne, damit
+            # sie durch Hedging ebenfalls Messwerte sammeln
+            return list(self.backends)
+
+        def expected(backend: LLMService) -> float:
+            tracker = self.trackers[backend.name]
+            return tracker.percentile(50) * (1 + 4 * tracker.error_rate)
+
+        return sorted(self.backends, key=expected)
+
+    def hedge_delay(self, backend: LLMService) -> float:
+        """Sekunden bis zum Start des nächsten Backends."""
+        tracker = self.trackers[backend.name]
+        if tracker.samples < self.min_samples:
+            delay_ms = self.hedge_after_ms
+        else:
+            delay_ms = max(self.hedge_min_ms, tracker.percentile(self.hedge_percentile))
+        return delay_ms / 1000
+
+    def timeout_for(self, backend: LLMService) -> float:
+        """Adaptiver Timeout (Sekunden): p95 × Faktor, max. backend.timeout."""
+        tracker = self.trackers[backend.name]
+        if tracker.samples < self.min_samples:
+            return backend.timeout
+        timeout_ms = max(
+            self.timeout_min_ms, tracker.percentile(95) * self.timeout_factor
+        )
+        return min(backend.timeout, timeout_ms / 1000)
+
+    async def generate(self, **kwargs) -> tuple[str, LLMService]:
+        """
+        Generiert Ticker-Text (Argumente wie LLMService.generate_ticker_text).
+
+        Returns:
+            (Text, Backend der gewinnenden Antwort bzw. Template-Generator)
+        """
+        if self.templates is not None:
+            text = self.templates.render_routine(**kwargs)
+            if text is not None:
+                self._templated += 1
+                return text, self.fallback
+        try:
+            return await self._route(kwargs)
+        except Exception as e:
+            if not self.fallback_enabled:
+                raise
+            self._fallbacks += 1
+            logger.warning(
+                f"LLM degraded mode, template fallback: {type(e).__name__} {e}"
+            )
+            return await self.fallback.generate_ticker_text(**kwargs), self.fallback
+
+    def stream(self, **kwargs) -> tuple[AsyncIterator[str], LLMService]:
+        """
+        Streaming-Variante von generate: kein Hedging, der Stream läuft über
+        primary. Routine-Events kommen wie bei generate aus den Templates.
+
+        Returns:
+            (Text-Stream, Backend bzw. Template-Generator)
+        """
+        if self.templates is not None:
+            text = self.templates.render_routine(**kwargs)
+            if text is not None:
+                self._templated += 1
+                return _single_chunk(text), self.fallback
+        backend = self.primary
+        return backend.stream_ticker_text(**kwargs), backend
+
+    async def _route(self, kwargs: dict) -> tuple[str, LLMService]:
+        order = self.ranked()
+        remaining = list(order)
+        pending: dict[asyncio.Task, LLMService] = {}
+        last_error: Optional[BaseException] = None
+
+        def launch() -> bool:
+            # Backends mit offenem Breaker überspringen
+            while remaining:
+                backend = remaining.pop(0)
+                if self.breakers[backend.name].allow_request():
+                    task = asyncio.create_task(self._call(backend, kwargs))
+                    pending[task] = backend
+                    return True
+            return False
+
+        if not launch():
+            raise NoBackendAvailable("all circuit breakers open")
+        hedging = self.hedge_enabled and len(order) > 1
+        try:
+            while pending:
+                timeout = self.hedge_delay(order[0]) if hedging and remaining else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Hedge: zu langsam, nächstes Backend parallel starten
+                    if launch():
+                        self._hedges += 1
+                    continue
+                for task in done:
+                    backend = pending.pop(task)
+                    if task.exception() is None:
+                        self._counters[backend.name]["wins"] += 1
+                        return task.result(), backend
+                    last_error = task.exception()
+                # Fehler: Failover ohne auf die Hedge-Schwelle zu warten
+                if not pending:
+                    launch()
+        finally:
+            for task, backend in pending.items():
+                task.cancel()
+                self._counters[backend.name]["cancelled"] += 1
+        raise last_error or NoBackendAvailable("all circuit breakers open")
+
+    async def _call(self, backend: LLMService, kwargs: dict) -> str:
+        counters = self._counters[backend.name]
+        tracker = self.trackers[backend.name]
+        breaker = self.breakers[backend.name]
+        counters["calls"] += 1
+        started = time.monotonic()
+        try:
+            text = await asyncio.wait_for(
+                backend.generate_ticker_text(**kwargs),
+                timeout=self.timeout_for(backend),
+            )
+        except asyncio.CancelledError:
+            # Verlierer eines Hedges: mindestens so langsam – als Messwert
+            # zählen, sonst sammelt ein dauerhaft langsames Backend nie Werte
+            tracker.record((time.monotonic() - started) * 1000)
+            breaker.release()
+            raise
+        except Exception as e:
+            counters["errors"] += 1
+            tracker.record_error()
+            breaker.record_failure()
+            logger.warning(f"LLM backend {backend.name} failed: {type(e).__name__} {e}")
+            raise
+        latency_ms = (time.monotonic() - started) * 1000
+        tracker.record(latency_ms)
+        breaker.record_success(latency_ms)
+        return text
+
+    async def generate_ticker_text(self, **kwargs) -> str:
+        """Gleiche Schnittstelle wie LLMService.generate_ticker_text."""
+        text, _ = await self.generate(**kwargs)
+        return text
+
+    def stats(self) -> dict:
+        return {
+            "hedge_enabled": self.hedge_enabled,
+            "hedges": self._hedges,
+            "fallbacks": self._fallbacks,
+            "templated": self._templated,
+            "templates": self.templates.stats() if self.templates else None,
+            "order": [b.name for b in self.ranked()],
+            "backends": {
+                b.name: {
+                    "provider": b.provider,
+                    "model": b.model_label,
+                    "hedge_after_ms": round(self.hedge_delay(b) * 1000, 1),
+                    "timeout_ms": round(self.timeout_for(b) * 1000, 1),
+                    "breaker": self.breakers[b.name].snapshot(),
+                    **self._counters[b.name],
+                    **self.trackers[b.name].snapshot(),
+                }
+                for b in self.backends
+            },
+        }
+
+    async def aclose(self) -> None:
+        for backend in self.backends:
+            await backend.aclose()
+
+
+# Singleton
+from app.core.config import settings
+from app.services.llm_service import llm_service
+from app.services.ticker_templates import ticker_templates
+
+
+def _build_backend(spec: str) -> LLMService:
+    """'openrouter', 'gemini', 'mock' oder 'mock:<latenz_ms>'."""
+    provider, _, latency = spec.strip().partition(":")
+    if provider == llm_service.provider and not latency:
+        return llm_service
+    api_keys = {
+        "openrouter": settings.OPENROUTER_API_KEY,
+        "gemini": settings.GEMINI_API_KEY,
+        "openai": settings.OPENAI_API_KEY,
+        "anthropic": settings.ANTHROPIC_API_KEY,
+    }
+    return LLMService(
+        provider=provider,
+        api_key=api_keys.get(provider),
+        model=settings.OPENROUTER_MODEL if provider == "openrouter" else None,
+        name=spec.strip(),
+        max_concurrency=settings.LLM_MAX_CONCURRENCY,
+        timeout=settings.LLM_TIMEOUT_SECONDS,
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+        mock_latency_ms=int(latency) if latency else settings.LLM_MOCK_LATENCY_MS,
+        mock_stream_chunk_ms=settings.LLM_MOCK_STREAM_CHUNK_MS,
+        cache=llm_service.cache,
+    )
+
+
+llm_router = LLMRouter(
+    backends=(
+        [
+            _build_backend(spec)
+            for spec in dict.fromkeys(
+                s.strip() for s in settings.LLM_PROVIDERS.split(",")
+            )
+            if spec
+        ]
+        if settings.LLM_PROVIDERS
+        else [llm_service]
+    ),
+    hedge_enabled=settings.LLM_HEDGE_ENABLED,
+    hedge_after_ms=settings.LLM_HEDGE_AFTER_MS,
+    hedge_percentile=settings.LLM_HEDGE_PERCENTILE,
+    hedge_min_ms=settings.LLM_HEDGE_MIN_MS,
+    breaker_factory=lambda: CircuitBreaker(
+        window=settings.LLM_BREAKER_WINDOW,
+        min_calls=settings.LLM_BREAKER_MIN_CALLS,
+        error_rate=settings.LLM_BREAKER_ERROR_RATE,
+        slow_call_ms=settings.LLM_BREAKER_SLOW_CALL_MS,
+        slow_rate=settings.LLM_BREAKER_SLOW_RATE,
+        open_seconds=settings.LLM_BREAKER_OPEN_SECONDS,
+        enabled=settings.LLM_BREAKER_ENABLED,
+    ),
+    timeout_factor=settings.LLM_ADAPTIVE_TIMEOUT_FACTOR,
+    timeout_min_ms=settings.LLM_ADAPTIVE_TIMEOUT_MIN_MS,
+    fallback_enabled=settings.LLM_FALLBACK_ENABLED,
+    templates=ticker_templates,
+)
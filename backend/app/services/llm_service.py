@@ -1,10 +1,27 @@
 """
 LLM Service für Ticker-Text-Generierung.
 Provider: Mock, OpenAI, Anthropic, Gemini
+
+Alle Provider laufen über async Clients mit gepooltem HTTP-Client,
+begrenzter Parallelität (Semaphore) und Timeout pro Request, damit
+LLM-Aufrufe den Event-Loop nicht blockieren.
+
+stream_ticker_text liefert den Text stückweise, sobald der Provider Tokens
+sendet (OpenRouter, Gemini; Mock simuliert einen Stream).
+
+Latenz (ok / timeout / error) und Token-Verbrauch gehen pro Provider und
+Modell nach /metrics (app.core.metrics).
 """
 
-from typing import Optional, Literal
-import random
+import asyncio
+import time
+from typing import AsyncIterator, Optional, Literal
+
+import httpx
+
+from app.core import metrics
+from app.services.llm_cache import LLMCache, make_cache_key
+from app.services.ticker_templates import ticker_templates
 
 
 class LLMService:
@@ -15,10 +32,27 @@ class LLMService:
             "openai", "anthropic", "gemini", "openrouter", "mock"
         ] = "mock",
         model: Optional[str] = None,
+        max_concurrency: int = 20,
+        timeout: float = 15.0,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        mock_latency_ms: int = 0,
+        mock_stream_chunk_ms: int = 30,
+        cache: Optional[LLMCache] = None,
+        name: Optional[str] = None,
     ):
         self.provider = provider
+        self.name = name or provider
         self.api_key = api_key
         self.model = model
+        self.timeout = timeout
+        self.mock_latency_ms = mock_latency_ms
+        self.mock_stream_chunk_ms = mock_stream_chunk_ms
+        self.cache = cache
+
+        # Begrenzt gleichzeitige Provider-Aufrufe (auch im Mock-Modus)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http_client: Optional[httpx.AsyncClient] = None
 
         if provider == "mock":
             print("⚠️  LLM Service läuft im MOCK-Modus")
@@ -26,15 +60,32 @@ class LLMService:
             if not api_key:
                 raise ValueError("Gemini API Key erforderlich")
             from google import genai
+            from google.genai import types
 
-            self.gemini_client = genai.Client(api_key=api_key)
+            self.gemini_model = "gemini-2.0-flash-lite-001"
+            self.gemini_client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(timeout=int(timeout * 1000)),
+            )
         elif provider == "openrouter":
             if not api_key:
                 raise ValueError("OpenRouter API Key erforderlich")
-            from openai import OpenAI
-
-            self.openrouter_client = OpenAI(
-                api_key=api_key, base_url="https://openrouter.ai/api/v1"
+            from openai import AsyncOpenAI
+
+            # Ein gepoolter HTTP-Client für alle Requests (Keep-Alive)
+            self._http_client = httpx.AsyncClient(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+            )
+            self.openrouter_client = AsyncOpenAI(
+                api_key=api_key,
+                base_url="https://openrouter.ai/api/v1",
+                timeout=timeout,
+                max_retries=0,
+                http_client=self._http_client,
             )
             self.openrouter_model = model or "google/gemini-2.0-flash-lite-001"
         elif provider == "openai" and not api_key:
@@ -42,7 +93,21 @@ class LLMService:
         elif provider == "anthropic" and not api_key:
             raise ValueError("Anthropic API Key erforderlich")
 
-    def generate_ticker_text(
+    @property
+    def model_name(self) -> str:
+        """Konkretes Modell des Providers (Teil des Cache-Schlüssels)."""
+        if self.provider == "openrouter":
+            return self.openrouter_model
+        if self.provider == "gemini":
+            return self.gemini_model
+        return self.model or self.provider
+
+    @property
+    def model_label(self) -> str:
+        """Wert für TickerEntry.llm_model."""
+        return self.model or self.provider
+
+    async def generate_ticker_text(
         self,
         event_type: str,
         event_detail: str,
@@ -54,7 +119,236 @@ class LLMService:
         language: str = "de",
         context_data: Optional[dict] = None,
     ) -> str:
+        """Generiert Ticker-Text mit begrenzter Parallelität und Timeout.
+        Identische Prompts werden aus dem Cache bedient (nicht im Mock-Modus)."""
+        cache_key = None
+        if self.cache is not None and self.provider != "mock":
+            prompt = self._build_prompt(
+                event_type,
+                event_detail,
+                minute,
+                player_name,
+                assist_name,
+                team_name,
+                style,
+                language,
+                context_data=context_data,
+            )
+            cache_key = make_cache_key(prompt, self.model_name)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async with self._semaphore:
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                text = await asyncio.wait_for(
+                    self._dispatch(
+                        event_type,
+                        event_detail,
+                        minute,
+                        player_name,
+                        assist_name,
+                        team_name,
+                        style,
+                        language,
+                        context_data,
+                    ),
+                    timeout=self.timeout,
+                )
+                outcome = "ok"
+            except asyncio.TimeoutError:
+                outcome = "timeout"
+                raise
+            finally:
+                self._observe(started, outcome)
+
+        if cache_key is not None:
+            await self.cache.set(cache_key, text, self.model_name)
+        return text
+
+    async def stream_ticker_text(
+        self,
+        event_type: str,
+        event_detail: str,
+        minute: int,
+        player_name: Optional[str] = None,
+        assist_name: Optional[str] = None,
+        team_name: Optional[str] = None,
+        style: Literal["neutral", "euphorisch", "kritisch"] = "neutral",
+        language: str = "de",
+        context_data: Optional[dict] = None,
+    ) -> AsyncIterator[str]:
+        """Wie generate_ticker_text, liefert den Text aber in Teilstücken,
+        sobald der Provider sie sendet. Timeout gilt für den gesamten Stream;
+        der vollständige Text wird am Ende gecacht."""
+        args = (
+            event_type,
+            event_detail,
+            minute,
+            player_name,
+            assist_name,
+            team_name,
+            style,
+            language,
+        )
+        cache_key = None
+        if self.cache is not None and self.provider != "mock":
+            prompt = self._build_prompt(*args, context_data=context_data)
+            cache_key = make_cache_key(prompt, self.model_name)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        chunks: list[str] = []
+        async with self._semaphore:
+            stream = self._dispatch_stream(*args, context_data=context_data)
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                while True:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    try:
+                        chunk = await asyncio.wait_for(
+                            stream.__anext__(), timeout=remaining
+                        )
+                    except StopAsyncIteration:
+                        break
+                    if chunk:
+                        chunks.append(chunk)
+                        yield chunk
+                outcome = "ok"
+            except asyncio.TimeoutError:
+                outcome = "timeout"
+                raise
+            finally:
+                # abgebrochene Streams (Client weg) zählen als error
+                self._observe(started, outcome)
+                await stream.aclose()
+
+        text = "".join(chunks).strip()
+        if cache_key is not None and text:
+            await self.cache.set(cache_key, text, self.model_name)
+
+    def _observe(self, started: float, outcome: str) -> None:
+        metrics.llm_request_duration.observe(
+            time.perf_counter() - started, self.provider, self.model_name, outcome
+        )
+
+    def _record_tokens(
+        self, prompt_tokens: Optional[int], completion_tokens: Optional[int]
+    ) -> None:
+        if prompt_tokens:
+            metrics.llm_tokens.inc(
+                self.provider, self.model_name, "prompt", amount=prompt_tokens
+            )
+        if completion_tokens:
+            metrics.llm_tokens.inc(
+                self.provider, self.model_name, "completion", amount=completion_tokens
+            )
+
+    async def _dispatch_stream(
+        self,
+        event_type,
+        event_detail,
+        minute,
+        player_name,
+        assist_name,
+        team_name,
+        style,
+        language,
+        context_data=None,
+    ) -> AsyncIterator[str]:
         if self.provider == "mock":
+            text = self._generate_mock_text(
+                event_type,
+                event_detail,
+                minute,
+                player_name,
+                assist_name,
+                team_name,
+                style,
+                context_data=context_data,
+                language=language,
+            )
+            # Simulierter Token-Stream: Wort für Wort, Gesamtlatenz wie
+            # LLM_MOCK_LATENCY_MS (falls gesetzt)
+            words = text.split()
+            delay = (
+                self.mock_latency_ms / len(words)
+                if self.mock_latency_ms
+                else self.mock_stream_chunk_ms
+            ) / 1000
+            for i, word in enumerate(words):
+                await asyncio.sleep(delay)
+                yield word if i == 0 else f" {word}"
+            return
+
+        prompt = self._build_prompt(
+            event_type,
+            event_detail,
+            minute,
+            player_name,
+            assist_name,
+            team_name,
+            style,
+            language,
+            context_data=context_data,
+        )
+        if self.provider == "gemini":
+            stream = await self.gemini_client.aio.models.generate_content_stream(
+                model=self.gemini_model,
+                contents=prompt,
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+        elif self.provider == "openrouter":
+            stream = await self.openrouter_client.chat.completions.create(
+                model=self.openrouter_model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=150,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        else:
+            # Provider ohne Streaming: ganzer Text als ein Stück
+            yield await self._dispatch(
+                event_type,
+                event_detail,
+                minute,
+                player_name,
+                assist_name,
+                team_name,
+                style,
+                language,
+                context_data,
+            )
+
+    async def _dispatch(
+        self,
+        event_type,
+        event_detail,
+        minute,
+        player_name,
+        assist_name,
+        team_name,
+        style,
+        language,
+        context_data=None,
+    ) -> str:
+        if self.provider == "mock":
+            if self.mock_latency_ms:
+                # Simulierte Provider-Latenz für Lasttests
+                await asyncio.sleep(self.mock_latency_ms / 1000)
             return self._generate_mock_text(
                 event_type,
                 event_detail,
@@ -64,9 +358,10 @@ class LLMService:
                 team_name,
                 style,
                 context_data=context_data,
+                language=language,
             )
         elif self.provider == "gemini":
-            return self._generate_gemini_text(
+            return await self._generate_gemini_text(
                 event_type,
                 event_detail,
                 minute,
@@ -78,7 +373,7 @@ class LLMService:
                 context_data=context_data,
             )
         elif self.provider == "openrouter":
-            return self._generate_openrouter_text(
+            return await self._generate_openrouter_text(
                 event_type,
                 event_detail,
                 minute,
@@ -90,7 +385,7 @@ class LLMService:
                 context_data=context_data,
             )
         elif self.provider == "openai":
-            return self._generate_openai_text(
+            return await self._generate_openai_text(
                 event_type,
                 event_detail,
                 minute,
@@ -102,7 +397,7 @@ class LLMService:
                 context_data=context_data,
             )
         elif self.provider == "anthropic":
-            return self._generate_claude_text(
+            return await self._generate_claude_text(
                 event_type,
                 event_detail,
                 minute,
@@ -232,7 +527,7 @@ Schreibe nur den Ticker-Text, keine Erklärungen."""
             f"Kontextdaten:\n{json.dumps(context_data, ensure_ascii=False, indent=2)}"
         )
 
-    def _generate_gemini_text(
+    async def _generate_gemini_text(
         self,
         event_type,
         event_detail,
@@ -255,13 +550,16 @@ Schreibe nur den Ticker-Text, keine Erklärungen."""
             language,
             context_data=context_data,
         )
-        response = self.gemini_client.models.generate_content(
-            model="gemini-2.0-flash-lite-001",
+        response = await self.gemini_client.aio.models.generate_content(
+            model=self.gemini_model,
             contents=prompt,
         )
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            self._record_tokens(usage.prompt_token_count, usage.candidates_token_count)
         return response.text.strip()
 
-    def _generate_openrouter_text(
+    async def _generate_openrouter_text(
         self,
         event_type,
         event_detail,
@@ -284,11 +582,15 @@ Schreibe nur den Ticker-Text, keine Erklärungen."""
             language,
             context_data=context_data,
         )
-        response = self.openrouter_client.chat.completions.create(
+        response = await self.openrouter_client.chat.completions.create(
             model=self.openrouter_model,
             messages=[{"role": "user", "content": prompt}],
             max_tokens=150,
         )
+        if response.usage is not None:
+            self._record_tokens(
+                response.usage.prompt_tokens, response.usage.completion_tokens
+            )
         return response.choices[0].message.content.strip()
 
     def _generate_mock_text(
@@ -301,59 +603,32 @@ Schreibe nur den Ticker-Text, keine Erklärungen."""
         team_name,
         style,
         context_data=None,
+        language="de",
     ) -> str:
-        if event_type == "Goal":
-            if style == "neutral":
-                templates = [
-                    f"Tor für {team_name}! {player_name} trifft in der {minute}. Minute.",
-                    f"{minute}. Minute: {player_name} erzielt das Tor für {team_name}.",
-                ]
-            elif style == "euphorisch":
-                templates = [
-                    f"TOOOOOOR! {player_name} mit einem Traumtor in der {minute}. Minute!",
-                    f"WAHNSINN! {player_name} macht das Ding! {minute}. Minute - {team_name} jubelt!",
-                ]
-            else:
-                templates = [
-                    f"{minute}. Minute: {player_name} trifft. Die Abwehr hatte geschlafen.",
-                    f"Tor durch {player_name} - das hätte verhindert werden müssen.",
-                ]
-            text = random.choice(templates)
-            if assist_name:
-                text += f" Vorlage: {assist_name}."
-            return text
-
-        elif event_type == "Card":
-            if event_detail == "Yellow Card":
-                if style == "neutral":
-                    return f"{minute}. Minute: Gelbe Karte für {player_name}."
-                elif style == "euphorisch":
-                    return (
-                        f"{minute}. Minute: {player_name} sieht Gelb - das war unnötig!"
-                    )
-                else:
-                    return (
-                        f"Gelb für {player_name} ({minute}') - vollkommen berechtigt."
-                    )
-            else:
-                return f"🔴 ROTE KARTE! {player_name} muss vom Platz! {minute}. Minute."
-
-        elif event_type == "subst":
-            if style == "neutral":
-                return f"{minute}. Minute: Wechsel bei {team_name}. {player_name} kommt für {assist_name}."
-            elif style == "euphorisch":
-                return f"Frische Kräfte! {player_name} kommt für {assist_name}."
-            else:
-                return f"Wechsel ({minute}'): {player_name} für {assist_name} - fragwürdig."
-
-        return f"{minute}. Minute: {event_type} - {event_detail}"
-
-    def _generate_openai_text(self, *args, context_data=None, **kwargs) -> str:
+        text = ticker_templates.render(
+            event_type,
+            event_detail,
+            minute,
+            player_name,
+            assist_name,
+            team_name,
+            style,
+            language,
+            context_data=context_data,
+        )
+        return text or f"{minute}. Minute: {event_type} - {event_detail}"
+
+    async def _generate_openai_text(self, *args, context_data=None, **kwargs) -> str:
         raise NotImplementedError("OpenAI Integration noch nicht implementiert")
 
-    def _generate_claude_text(self, *args, context_data=None, **kwargs) -> str:
+    async def _generate_claude_text(self, *args, context_data=None, **kwargs) -> str:
         raise NotImplementedError("Anthropic Integration noch nicht implementiert")
 
+    async def aclose(self) -> None:
+        """Schließt gepoolte HTTP-Verbindungen (beim Shutdown)."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
 
 # Singleton – Provider aus ENV
 from app.core.config import settings
@@ -373,7 +648,37 @@ elif settings.OPENAI_API_KEY:
     _provider = "openai"
     _api_key = settings.OPENAI_API_KEY
 
-llm_service = LLMService(provider=_provider, api_key=_api_key, model=_model)
+llm_service = LLMService(
+    provider=_provider,
+    api_key=_api_key,
+    model=_model,
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    timeout=settings.LLM_TIMEOUT_SECONDS,
+    max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+    mock_latency_ms=settings.LLM_MOCK_LATENCY_MS,
+    mock_stream_chunk_ms=settings.LLM_MOCK_STREAM_CHUNK_MS,
+    cache=(
+        LLMCache(
+            max_size=settings.LLM_CACHE_MAX_SIZE,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            persistent=settings.LLM_CACHE_PERSISTENT,
+            purge_interval_seconds=settings.LLM_CACHE_PURGE_INTERVAL_SECONDS,
+        )
+        if settings.LLM_CACHE_ENABLED
+        else None
+    ),
+)
+
+
+def _model_label(backend, model: Optional[str]) -> str:
+    """Angefragtes Modell – außer die Vorlagen sind eingesprungen, dann
+    soll das gespeicherte llm_model das auch sagen."""
+    from app.services.llm_router import llm_router
+
+    if backend is llm_router.fallback:
+        return backend.model_label
+    return model or backend.model_label
 
 
 async def generate_ticker_text(
@@ -390,9 +695,11 @@ async def generate_ticker_text(
     provider: str = None,
     model: str = None,
 ) -> tuple[str, str]:
+    from app.services.llm_router import llm_router
+
     resolved_minute = (match_context.get("minute") if match_context else None) or minute
 
-    text = llm_service.generate_ticker_text(
+    text, backend = await llm_router.generate(
         event_type=event_type,
         event_detail=event_detail,
         minute=resolved_minute,
@@ -404,5 +711,42 @@ async def generate_ticker_text(
         language=language,
         context_data=context_data,
     )
-    model_used = model or _model or _provider
-    return text, model_used
+    return text, _model_label(backend, model)
+
+
+def stream_ticker_text(
+    event_type: str,
+    event_detail: str = "",
+    minute: int = 0,
+    player_name=None,
+    assist_name=None,
+    team_name=None,
+    style="neutral",
+    language="de",
+    context_data: dict = None,
+    match_context: dict = None,
+    provider: str = None,
+    model: str = None,
+) -> tuple[AsyncIterator[str], str]:
+    """Streaming-Variante von generate_ticker_text: (Text-Stream, Modell).
+    Kein Hedging – der Stream läuft über das aktuell schnellste Backend."""
+    from app.services.llm_router import llm_router
+
+    kwargs = dict(
+        event_type=event_type,
+        event_detail=event_detail,
+        minute=(match_context.get("minute") if match_context else None) or minute,
+        player_name=player_name,
+        assist_name=assist_name,
+        team_name=team_name
+        or (match_context.get("home_team") if match_context else None),
+        style=style,
+        language=language,
+        context_data=context_data,
+    )
+    stream, backend = llm_router.stream(**kwargs)
+    return stream, _model_label(backend, model)
+
+
+async def _single_chunk(text: str) -> AsyncIterator[str]:
+    yield text
@@ -0,0 +1,167 @@
+"""
+Match-Kontext-Cache für die Ticker-Generierung.
+
+Alle Generierungspfade (/ticker/generate*, Batch, Streaming, Job-Queue)
+brauchen pro Aufruf denselben match_context: Teamnamen, Spielstand und
+Status. Statt bei jeder Generierung Match samt home_team / away_team neu zu
+laden, hält der Cache diesen Kontext pro Match im Speicher.
+
+- Befüllt beim ersten Zugriff (Match + Teams; Batch mit einer Query für
+  alle fehlenden Matches).
+- Schreibende Endpoints und der Ingestion-Service melden Änderungen:
+  update_match() übernimmt Stand/Status direkt.
+- Events sind bewusst nicht Teil des Kontexts: sie ändern sich während
+  eines Live-Spiels ständig, der Cache müsste fast bei jeder Generierung
+  neu laden.
+- Beendete Matches werden entfernt und nicht gecacht.
+- TTL als Sicherheitsnetz für Schreibzugriffe anderer Prozesse (mehrere
+  Worker, n8n direkt auf der DB).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.match import Match
+
+
+class _Entry:
+    __slots__ = ("base", "loaded_at")
+
+    def __init__(self, base: dict):
+        self.base = base
+        self.loaded_at = time.monotonic()
+
+
+def _base_context(match: Match) -> dict:
+    return {
+        "home_team": match.home_team.name,
+        "away_team": match.away_team.name,
+        "score_home": match.score_home,
+        "score_away": match.score_away,
+        "status": match.status,
+    }
+
+
+class MatchContextCache:
+    def __init__(self, max_size: int = 500, ttl_seconds: float = 30.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    # ── Lesen ────────────────────────────────────────────
+
+    def get(self, db: Session, match_id: int, minute: int | None) -> dict | None:
+        """match_context für ein Match; None, wenn es nicht existiert."""
+        base = self.get_many(db, [match_id]).get(match_id)
+        return None if base is None else {**base, "minute": minute}
+
+    def get_many(self, db: Session, match_ids: list[int]) -> dict[int, dict]:
+        """Kontext ohne minute pro existierendem Match; fehlende Matches
+        werden mit einer Query geladen."""
+        found, missing = self._lookup(match_ids)
+        if missing:
+            matches = (
+                db.query(Match)
+                .options(joinedload(Match.home_team), joinedload(Match.away_team))
+                .filter(Match.id.in_(missing))
+                .all()
+            )
+            loaded = {m.id: _base_context(m) for m in matches}
+            found.update(loaded)
+            with self._lock:
+                for match_id, base in loaded.items():
+                    self._store(match_id, base)
+        return found
+
+    async def get_async(
+        self, db: AsyncSession, match_id: int, minute: int | None
+    ) -> dict | None:
+        """Wie get; bei einem Treffer ohne DB-Zugriff."""
+        context = self._context(match_id, minute)
+        if context is not None:
+            return context
+        return await db.run_sync(lambda session: self.get(session, match_id, minute))
+
+    async def get_many_async(
+        self, db: AsyncSession, match_ids: list[int]
+    ) -> dict[int, dict]:
+        return await db.run_sync(lambda session: self.get_many(session, match_ids))
+
+    def _lookup(self, match_ids: list[int]) -> tuple[dict[int, dict], list]:
+        found: dict[int, dict] = {}
+        missing: list[int] = []
+        now = time.monotonic()
+        with self._lock:
+            for match_id in dict.fromkeys(match_ids):
+                entry = self._entries.get(match_id)
+                if entry is None or now - entry.loaded_at > self.ttl_seconds:
+                    self._stats["misses"] += 1
+                    missing.append(match_id)
+                    continue
+                self._stats["hits"] += 1
+                self._entries.move_to_end(match_id)
+                found[match_id] = entry.base
+        return found, missing
+
+    def _context(self, match_id: int, minute: int | None) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(match_id)
+            if entry is None or time.monotonic() - entry.loaded_at > self.ttl_seconds:
+                return None
+            self._stats["hits"] += 1
+            self._entries.move_to_end(match_id)
+            return {**entry.base, "minute": minute}
+
+    def _store(self, match_id: int, base: dict) -> None:
+        if base["status"] == "finished":
+            # Beendete Matches bekommen keine Live-Ticker mehr
+            self._entries.pop(match_id, None)
+            return
+        self._entries[match_id] = _Entry(base)
+        self._entries.move_to_end(match_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    # ── Schreiben ────────────────────────────────────────
+
+    def update_match(self, match: Match) -> None:
+        """Nach Schreibzugriff auf ein Match: Stand/Status übernehmen bzw.
+        beendete Matches entfernen."""
+        with self._lock:
+            entry = self._entries.get(match.id)
+            if match.status == "finished":
+                self._entries.pop(match.id, None)
+            elif entry is not None:
+                entry.base = {
+                    **entry.base,
+                    "score_home": match.score_home,
+                    "score_away": match.score_away,
+                    "status": match.status,
+                }
+
+    def forget(self, match_id: int) -> None:
+        with self._lock:
+            self._entries.pop(match_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "max_size": self.max_size, **self._stats}
+
+
+# Singleton
+from app.core.config import settings
+
+match_context_cache = MatchContextCache(
+    max_size=settings.MATCH_CONTEXT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.MATCH_CONTEXT_CACHE_TTL_SECONDS,
+)
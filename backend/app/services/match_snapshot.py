@@ -0,0 +1,111 @@
+"""
+Match Snapshot Service.
+
+Baut alle Daten einer Match-Ansicht (Match, Events, Ticker, Pre-Match,
+Live-Stats, Lineups, Team- und Spieler-Statistiken) in einer DB-Session
+mit je einer Query pro Ressource. Ersetzt die acht Einzel-Requests des
+Frontends.
+"""
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.event import Event
+from app.models.lineup import Lineup
+from app.models.match_statistic import MatchStatistic
+from app.models.player_statistic import PlayerStatistic
+from app.models.synthetic_event import SyntheticEvent
+from app.models.ticker_entry import TickerEntry
+from app.repositories.match_repository import MatchRepository
+from app.schemas.match_snapshot import MatchSnapshot, SNAPSHOT_FIELDS
+from app.schemas.synthetic_event import GenerateSyntheticResponse
+
+PREMATCH_EVENT_TYPES = (
+    "pre_match_prediction",
+    "pre_match_injuries",
+    "pre_match_h2h",
+    "pre_match_team_stats",
+    "pre_match_standings",
+)
+LIVE_STATS_EVENT_TYPE = "live_stats_update"
+
+
+def _to_synthetic_response(entry: TickerEntry) -> GenerateSyntheticResponse:
+    return GenerateSyntheticResponse(
+        ticker_entry_id=entry.id,
+        synthetic_event_id=entry.synthetic_event_id,
+        text=entry.text,
+        llm_model=entry.llm_model,
+        llm_provider=entry.mode,
+    )
+
+
+def build_match_snapshot(
+    db: Session, match_id: int, fields: set[str] | None = None
+) -> MatchSnapshot | None:
+    """Gibt None zurück, wenn das Match nicht existiert."""
+    fields = set(fields or SNAPSHOT_FIELDS)
+
+    match = MatchRepository(db).get_by_id(match_id)
+    if not match:
+        return None
+
+    data: dict = {"match_id": match_id}
+    if "match" in fields:
+        data["match"] = match
+
+    if "events" in fields:
+        data["events"] = (
+            db.query(Event)
+            .filter(Event.match_id == match_id)
+            .order_by(Event.minute.asc())
+            .all()
+        )
+
+    # Ticker, Pre-Match und Live-Stats aus einer einzigen Query
+    if fields & {"ticker_entries", "prematch", "live_stats"}:
+        rows = (
+            db.query(TickerEntry, SyntheticEvent.event_type)
+            .outerjoin(
+                SyntheticEvent, TickerEntry.synthetic_event_id == SyntheticEvent.id
+            )
+            .filter(TickerEntry.match_id == match_id)
+            .order_by(TickerEntry.minute.desc())
+            .all()
+        )
+        if "ticker_entries" in fields:
+            data["ticker_entries"] = [entry for entry, _ in rows]
+        if "prematch" in fields:
+            data["prematch"] = [
+                _to_synthetic_response(entry)
+                for entry, event_type in rows
+                if event_type in PREMATCH_EVENT_TYPES
+            ]
+        if "live_stats" in fields:
+            live = [
+                entry
+                for entry, event_type in rows
+                if event_type == LIVE_STATS_EVENT_TYPE
+            ]
+            live.sort(key=lambda e: e.created_at, reverse=True)
+            data["live_stats"] = [_to_synthetic_response(e) for e in live]
+
+    if "lineups" in fields:
+        data["lineups"] = (
+            db.query(Lineup)
+            .options(joinedload(Lineup.team))
+            .filter(Lineup.match_id == match_id)
+            .order_by(Lineup.team_id, Lineup.is_substitute, Lineup.grid)
+            .all()
+        )
+
+    if "match_statistics" in fields:
+        data["match_statistics"] = (
+            db.query(MatchStatistic).filter(MatchStatistic.match_id == match_id).all()
+        )
+
+    if "player_statistics" in fields:
+        data["player_statistics"] = (
+            db.query(PlayerStatistic).filter(PlayerStatistic.match_id == match_id).all()
+        )
+
+    return MatchSnapshot.model_validate(data, from_attributes=True)
@@ -0,0 +1,192 @@
+"""
+Read-Through-Cache für Stammdaten (Teams, Ligen, Seasons, LeagueSeasons).
+
+Die Navigation lädt Länder, Partner-Teams, Ligen und Spieltage bei jedem
+Seitenaufruf, die Daten ändern sich aber nur wenige Male pro Saison. Der
+Cache hält die fertig serialisierte JSON-Antwort samt ETag pro Key:
+
+- Treffer: kein DB-Zugriff, keine Serialisierung.
+- Jeder Eintrag trägt Tags (z.B. "teams", "leagues"); die schreibenden
+  Routes invalidieren per Tag. Die TTL deckt Schreibzugriffe ab, die nicht
+  über die API laufen (n8n-Importe direkt in die DB).
+- Leere Listen werden nicht gecacht – dort läuft meist gerade ein Import.
+  Routes, die selbst einen Import anstoßen, übergeben store=False, solange
+  er noch schreibt (sonst hielte der Cache eine halbe Liste für die TTL).
+- Antworten tragen ETag und Cache-Control, Modelle mit updated_at (Ligen)
+  zusätzlich Last-Modified; bei passendem If-None-Match bzw.
+  If-Modified-Since kommt 304 ohne Body.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from fastapi import HTTPException, Request, Response
+from pydantic import TypeAdapter
+
+from app.core.http_cache import http_date, last_modified_of, not_modified_since
+
+
+class CachedBody(NamedTuple):
+    body: bytes
+    etag: str
+    tags: frozenset[str]
+    expires_at: float
+    last_modified: Optional[datetime] = None
+
+
+class ReferenceCache:
+    def __init__(
+        self,
+        ttl_seconds: float = 300.0,
+        max_age_seconds: int = 60,
+        max_size: int = 1000,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, CachedBody] = OrderedDict()
+        self._adapters: dict[Any, TypeAdapter] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, key: tuple) -> Optional[CachedBody]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None or cached.expires_at < time.monotonic():
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            self._entries.move_to_end(key)
+            return cached
+
+    def put(
+        self,
+        key: tuple,
+        data: Any,
+        response_type: Any,
+        tags: tuple[str, ...] = (),
+        store: bool = True,
+    ) -> CachedBody:
+        adapter = self._adapters.get(response_type)
+        if adapter is None:
+            adapter = self._adapters[response_type] = TypeAdapter(response_type)
+        body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+        cached = CachedBody(
+            body=body,
+            etag=f'W/"{hashlib.sha1(body).hexdigest()}"',
+            tags=frozenset((key[0], *tags)),
+            expires_at=time.monotonic() + self.ttl_seconds,
+            last_modified=last_modified_of(data if isinstance(data, list) else [data]),
+        )
+        if data == [] or not store:
+            return cached
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return cached
+
+    def invalidate(self, *tags: str) -> None:
+        """Entfernt alle Einträge mit einem der Tags."""
+        wanted = set(tags)
+        with self._lock:
+            for key in [k for k, c in self._entries.items() if c.tags & wanted]:
+                del self._entries[key]
+            self._stats["invalidations"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self._entries), **self._stats}
+
+    # ── HTTP ─────────────────────────────────────────────
+
+    def respond(
+        self,
+        request: Request,
+        key: tuple,
+        loader: Callable[[], Any],
+        response_type: Any,
+        tags: tuple[str, ...] = (),
+        not_found: Optional[str] = None,
+        store: bool = True,
+    ) -> Response:
+        """
+        Antwort aus dem Cache bzw. über loader (sync). Key-Präfix = Tag.
+        loader gibt None zurück → 404 mit not_found. store=False: frisch
+        laden und nicht cachen.
+        """
+        cached = self.get(key) if store else None
+        if cached is None:
+            data = loader()
+            cached = self._load(key, data, response_type, tags, not_found, store)
+        return self._response(request, cached, store)
+
+    async def respond_async(
+        self,
+        request: Request,
+        key: tuple,
+        loader: Callable[[], Awaitable[Any]],
+        response_type: Any,
+        tags: tuple[str, ...] = (),
+        not_found: Optional[str] = None,
+        store: bool = True,
+    ) -> Response:
+        cached = self.get(key) if store else None
+        if cached is None:
+            data = await loader()
+            cached = self._load(key, data, response_type, tags, not_found, store)
+        return self._response(request, cached, store)
+
+    def _load(self, key, data, response_type, tags, not_found, store) -> CachedBody:
+        if data is None:
+            raise HTTPException(status_code=404, detail=not_found or "Not found")
+        return self.put(key, data, response_type, tags, store)
+
+    def _response(
+        self, request: Request, cached: CachedBody, store: bool = True
+    ) -> Response:
+        headers = {
+            "ETag": cached.etag,
+            # leere Liste bzw. laufender Import: nicht im Browser cachen
+            "Cache-Control": (
+                "no-cache"
+                if cached.body == b"[]" or not store
+                else f"public, max-age={self.max_age_seconds}"
+            ),
+        }
+        if cached.last_modified is not None:
+            headers["Last-Modified"] = http_date(cached.last_modified)
+
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_none_match is not None:
+            not_modified = cached.etag in if_none_match
+        else:
+            not_modified = bool(
+                if_modified_since
+                and "Last-Modified" in headers
+                and not_modified_since(headers["Last-Modified"], if_modified_since)
+            )
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=cached.body, media_type="application/json", headers=headers
+        )
+
+
+# Singleton
+from app.core.config import settings
+
+reference_cache = ReferenceCache(
+    ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS,
+    max_age_seconds=settings.REFERENCE_CACHE_MAX_AGE_SECONDS,
+    max_size=settings.REFERENCE_CACHE_MAX_SIZE,
+)
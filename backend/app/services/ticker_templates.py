@@ -0,0 +1,288 @@
+"""
+Template-Engine für Routine-Events (Fast Path ohne LLM-Aufruf).
+
+Gelbe Karten, Wechsel, VAR-Entscheidungen und Live-Stats-Updates machen den
+Großteil der Events eines Spiels aus, brauchen aber keinen LLM-Aufruf von
+mehreren hundert Millisekunden. Die Templates sind pro Sprache, Event-Typ,
+Detail und Stil hinterlegt und werden beim Start einmal in Literal- und
+Slot-Teile zerlegt; das Rendern ist nur noch ein join.
+
+- Slots: minute, player, assist, team, detail, home_team, away_team, triggers
+  (aus den Argumenten bzw. context_data). Templates, deren Slots nicht
+  befüllt werden können, werden übersprungen.
+- Abwechslung: pro (Sprache, Typ, Detail, Stil) rotieren die Varianten.
+- Policy (TICKER_TEMPLATE_EVENTS): welche Events per Template statt per LLM
+  entstehen, als "Typ" oder "Typ:Detail", z.B. "Card:Yellow Card,subst".
+
+render() ignoriert die Policy und dient auch als Mock-/Fallback-Generator.
+"""
+
+import itertools
+import string
+from typing import Iterable, Optional
+
+# (Sprache, Event-Typ, Detail oder "*") → Stil → Varianten
+DEFAULT_TEMPLATES: dict[tuple[str, str, str], dict[str, tuple[str, ...]]] = {
+    ("de", "Goal", "*"): {
+        "neutral": (
+            "Tor für {team}! {player} trifft in der {minute}. Minute. Vorlage: {assist}.",
+            "{minute}. Minute: {player} erzielt das Tor für {team}. Vorlage: {assist}.",
+            "Tor für {team}! {player} trifft in der {minute}. Minute.",
+            "{minute}. Minute: {player} erzielt das Tor für {team}.",
+        ),
+        "euphorisch": (
+            "TOOOOOOR! {player} mit einem Traumtor in der {minute}. Minute! Vorlage: {assist}.",
+            "TOOOOOOR! {player} mit einem Traumtor in der {minute}. Minute!",
+            "WAHNSINN! {player} macht das Ding! {minute}. Minute - {team} jubelt!",
+        ),
+        "kritisch": (
+            "{minute}. Minute: {player} trifft. Die Abwehr hatte geschlafen.",
+            "Tor durch {player} - das hätte verhindert werden müssen.",
+        ),
+    },
+    ("de", "Card", "Yellow Card"): {
+        "neutral": (
+            "{minute}. Minute: Gelbe Karte für {player}.",
+            "Gelb für {player} ({team}) in der {minute}. Minute.",
+            "{player} sieht in der {minute}. Minute die Gelbe Karte.",
+        ),
+        "euphorisch": (
+            "{minute}. Minute: {player} sieht Gelb - das war unnötig!",
+            "Gelb! {player} holt sich in der {minute}. Minute die Verwarnung ab!",
+        ),
+        "kritisch": (
+            "Gelb für {player} ({minute}') - vollkommen berechtigt.",
+            "{minute}. Minute: {player} sieht Gelb. Das musste nicht sein.",
+        ),
+    },
+    ("de", "Card", "*"): {
+        "neutral": (
+            "🔴 ROTE KARTE! {player} muss vom Platz! {minute}. Minute.",
+            "{minute}. Minute: Platzverweis für {player}, {team} in Unterzahl.",
+        ),
+    },
+    ("de", "subst", "*"): {
+        "neutral": (
+            "{minute}. Minute: Wechsel bei {team}. {player} kommt für {assist}.",
+            "Wechsel bei {team} ({minute}'): {player} ersetzt {assist}.",
+            "{minute}. Minute: {player} kommt für {assist} ins Spiel.",
+        ),
+        "euphorisch": (
+            "Frische Kräfte! {player} kommt für {assist}.",
+            "{team} legt nach: {player} ist jetzt für {assist} drin!",
+        ),
+        "kritisch": (
+            "Wechsel ({minute}'): {player} für {assist} - fragwürdig.",
+            "{minute}. Minute: {assist} geht, {player} kommt. Ob das hilft?",
+        ),
+    },
+    ("de", "Var", "Goal cancelled"): {
+        "neutral": (
+            "{minute}. Minute: Nach VAR-Überprüfung wird das Tor von {team} aberkannt.",
+            "VAR-Entscheidung in der {minute}. Minute: Kein Tor für {team}.",
+        ),
+        "euphorisch": ("Drama! Der VAR nimmt {team} das Tor wieder weg ({minute}')!",),
+        "kritisch": ("{minute}. Minute: Tor aberkannt - der VAR greift ein.",),
+    },
+    ("de", "Var", "Penalty confirmed"): {
+        "neutral": (
+            "{minute}. Minute: Der VAR bestätigt den Elfmeter für {team}.",
+            "Nach Ansicht der Bilder bleibt es beim Strafstoß für {team} ({minute}').",
+        ),
+    },
+    ("de", "Var", "*"): {
+        "neutral": (
+            "{minute}. Minute: VAR-Überprüfung - {detail}.",
+            "Der Videoschiedsrichter meldet sich ({minute}'): {detail}.",
+        ),
+    },
+    ("de", "live_stats_update", "*"): {
+        "neutral": (
+            "{minute}. Minute: {team} legt statistisch zu - {triggers}.",
+            "Statistik-Update ({minute}') für {team}: {triggers}.",
+            "{team} in der Statistik: {triggers}.",
+        ),
+        "euphorisch": ("{team} drückt! {triggers}.",),
+        "kritisch": ("{team} mit Zahlen, aber ohne Ertrag: {triggers}.",),
+    },
+    ("en", "Goal", "*"): {
+        "neutral": (
+            "Goal for {team}! {player} scores in minute {minute}. Assist: {assist}.",
+            "Goal for {team}! {player} scores in minute {minute}.",
+            "{minute}': {player} puts {team} on the scoresheet.",
+        ),
+    },
+    ("en", "Card", "Yellow Card"): {
+        "neutral": (
+            "{minute}': Yellow card for {player}.",
+            "{player} ({team}) is booked in minute {minute}.",
+        ),
+    },
+    ("en", "Card", "*"): {
+        "neutral": ("🔴 RED CARD! {player} is sent off in minute {minute}.",),
+    },
+    ("en", "subst", "*"): {
+        "neutral": (
+            "{minute}': Substitution for {team}. {player} replaces {assist}.",
+            "{player} comes on for {assist} ({minute}').",
+        ),
+    },
+    ("en", "Var", "*"): {
+        "neutral": ("{minute}': VAR check - {detail}.",),
+    },
+    ("en", "live_stats_update", "*"): {
+        "neutral": (
+            "{minute}': {team} stepping up - {triggers}.",
+            "Stats update for {team}: {triggers}.",
+        ),
+    },
+}
+
+_FORMATTER = string.Formatter()
+
+
+class CompiledTemplate:
+    """Format-String, vorab in (Literal, Slot)-Teile zerlegt."""
+
+    __slots__ = ("source", "parts", "slots")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.parts = tuple(
+            (literal, field) for literal, field, _, _ in _FORMATTER.parse(source)
+        )
+        self.slots = frozenset(field for _, field in self.parts if field)
+
+    def render(self, values: dict) -> str:
+        return "".join(
+            literal + (str(values[field]) if field else "")
+            for literal, field in self.parts
+        )
+
+
+class TemplatePolicy:
+    """Entscheidet pro Event, ob Template (True) oder LLM (False)."""
+
+    def __init__(self, rules: Iterable[str] = ()):
+        self.event_types: set[str] = set()
+        self.event_details: set[tuple[str, str]] = set()
+        for rule in rules:
+            event_type, _, detail = rule.strip().partition(":")
+            if not event_type:
+                continue
+            if detail:
+                self.event_details.add((event_type, detail.strip()))
+            else:
+                self.event_types.add(event_type)
+
+    @classmethod
+    def from_string(cls, rules: Optional[str]) -> "TemplatePolicy":
+        return cls((rules or "").split(","))
+
+    def use_template(self, event_type: str, event_detail: Optional[str]) -> bool:
+        return (
+            event_type in self.event_types
+            or (event_type, event_detail or "") in self.event_details
+        )
+
+
+class TickerTemplateEngine:
+    def __init__(
+        self,
+        templates: dict = DEFAULT_TEMPLATES,
+        policy: Optional[TemplatePolicy] = None,
+        enabled: bool = True,
+    ):
+        self.policy = policy or TemplatePolicy()
+        self.enabled = enabled
+        self._templates = {
+            key: {
+                style: tuple(CompiledTemplate(source) for source in variants)
+                for style, variants in styles.items()
+            }
+            for key, styles in templates.items()
+        }
+        self._rotation: dict[tuple, itertools.count] = {}
+        self._stats = {"rendered": 0, "routine": 0}
+
+    def _variants(
+        self, language: str, event_type: str, event_detail: Optional[str], style: str
+    ) -> tuple[tuple, tuple[CompiledTemplate, ...]]:
+        for detail in (event_detail or "*", "*"):
+            styles = self._templates.get((language, event_type, detail))
+            if styles:
+                chosen = style if style in styles else "neutral"
+                variants = styles.get(chosen) or next(iter(styles.values()))
+                return (language, event_type, detail, chosen), variants
+        return (), ()
+
+    @staticmethod
+    def _slots(
+        event_detail, minute, player_name, assist_name, team_name, context_data
+    ) -> dict:
+        context = context_data or {}
+        values = {
+            "minute": minute or context.get("minute"),
+            "player": player_name or context.get("player_name"),
+            "assist": assist_name or context.get("assist"),
+            "team": team_name or context.get("team_name"),
+            "detail": event_detail or context.get("description"),
+            "home_team": context.get("home_team"),
+            "away_team": context.get("away_team"),
+            "triggers": ", ".join(context.get("triggers") or []),
+        }
+        return {k: v for k, v in values.items() if v not in (None, "")}
+
+    def render(
+        self,
+        event_type: str,
+        event_detail: Optional[str] = None,
+        minute: Optional[int] = None,
+        player_name: Optional[str] = None,
+        assist_name: Optional[str] = None,
+        team_name: Optional[str] = None,
+        style: str = "neutral",
+        language: str = "de",
+        context_data: Optional[dict] = None,
+    ) -> Optional[str]:
+        """Text aus der nächsten passenden Variante, None ohne Template."""
+        key, variants = self._variants(language, event_type, event_detail, style)
+        if not variants:
+            return None
+        values = self._slots(
+            event_detail, minute, player_name, assist_name, team_name, context_data
+        )
+        usable = [t for t in variants if t.slots <= values.keys()]
+        if not usable:
+            return None
+        counter = self._rotation.setdefault(key, itertools.count())
+        self._stats["rendered"] += 1
+        return usable[next(counter) % len(usable)].render(values)
+
+    def render_routine(self, **kwargs) -> Optional[str]:
+        """Wie render, aber nur für Events, die laut Policy kein LLM brauchen."""
+        if not self.enabled or not self.policy.use_template(
+            kwargs.get("event_type"), kwargs.get("event_detail")
+        ):
+            return None
+        text = self.render(**kwargs)
+        if text is not None:
+            self._stats["routine"] += 1
+        return text
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "event_types": sorted(self.policy.event_types),
+            "event_details": sorted(":".join(d) for d in self.policy.event_details),
+            **self._stats,
+        }
+
+
+# Singleton
+from app.core.config import settings
+
+ticker_templates = TickerTemplateEngine(
+    policy=TemplatePolicy.from_string(settings.TICKER_TEMPLATE_EVENTS),
+    enabled=settings.TICKER_TEMPLATES_ENABLED,
+)
@@ -0,0 +1,60 @@
+"""
+Vergleicht zwei Benchmark-Läufe (JSON aus benchmarks.run).
+
+    python -m benchmarks.compare base.json head.json --threshold 10
+
+Gibt pro Szenario p50/p95/Durchsatz beider Läufe mit Abweichung aus.
+Exit-Code 1, wenn ein p95 um mehr als --threshold Prozent schlechter ist.
+"""
+
+import argparse
+import json
+import sys
+
+
+def _delta(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def compare(base: dict, head: dict, threshold: float) -> list[str]:
+    """Tabelle auf stdout, Rückgabe: Szenarien mit p95-Regression."""
+    base_results = {r["name"]: r for r in base["results"]}
+    regressions = []
+    print(f"{base.get('commit')} → {head.get('commit')}")
+    print(f"{'Szenario':45} {'p50 ms':>18} {'p95 ms':>18} {'rps':>16} {'Δp95':>8}")
+    for new in head["results"]:
+        old = base_results.get(new["name"])
+        if old is None:
+            print(f"{new['name']:45} (neu)")
+            continue
+        delta = _delta(old["p95_ms"], new["p95_ms"])
+        flag = ""
+        if delta > threshold:
+            flag = "  ← Regression"
+            regressions.append(new["name"])
+        print(
+            f"{new['name']:45} "
+            f"{old['p50_ms']:>8.2f} → {new['p50_ms']:<7.2f} "
+            f"{old['p95_ms']:>8.2f} → {new['p95_ms']:<7.2f} "
+            f"{old['throughput_rps']:>7.0f} → {new['throughput_rps']:<6.0f} "
+            f"{delta:>+7.1f}%{flag}"
+        )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark-Läufe vergleichen")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Prozent")
+    args = parser.parse_args(argv)
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+    return 1 if compare(base, head, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
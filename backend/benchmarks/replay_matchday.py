@@ -0,0 +1,525 @@
+"""
+Matchday-Replay: ein kompletter Spieltag als Last gegen die Schreib-Endpoints.
+
+Simuliert einen Samstagnachmittag – neun parallele Spiele – mit realistischem
+Timing und treibt dieselben Endpoints wie n8n bzw. die Redaktion:
+
+- Anstoß / Tore / Abpfiff: PATCH /matches/{id}
+- Events: POST /events/ → POST /ticker/generate/{id} → publish
+- Statistiken: POST /match-statistics/ (erster Stand pro Team), danach
+  PUT /match-statistics/match/{id} (Bulk-Upsert)
+- Synthetische Events (Vorbericht, live_stats_update): POST /ticker/synthetic
+  → POST /ticker/generate-synthetic → publish
+
+Gemessen wird pro Endpoint und Ende-zu-Ende vom Einfügen des Events bis zum
+veröffentlichten TickerEntry – einmal als Request-Kette, einmal so, wie ein
+Live-Subscriber (Broadcaster bzw. SSE) den Eintrag sieht. Die Last ist
+open-loop: fällige Einträge starten unabhängig davon, ob ältere noch laufen;
+die Verspätung gegenüber dem Plan steht als schedule_lag im Report.
+
+Die Timeline ist JSON (aufgezeichnet oder per --dump-timeline erzeugt) und
+läuft in Echtzeit (--speed 1) oder beschleunigt (--speed 10 / 100). Ziel sind
+die Matches des nächsten angesetzten Spieltags der Benchmark-Saison
+(benchmarks.seed); sie werden vorher und nachher zurückgesetzt (--keep lässt
+die Daten stehen). Läuft komplett offline mit dem Mock-Provider.
+
+Start (im backend/-Verzeichnis):
+    python -m benchmarks.replay_matchday --speed 100 -o replay.json
+    python -m benchmarks.replay_matchday --dump-timeline matchday.json
+    python -m benchmarks.replay_matchday --timeline matchday.json --speed 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+
+from benchmarks.run import git_commit, summarize, use_mock_llm
+
+FIXTURES = 9
+PREMATCH_MINUTE = -30  # Vorbericht vor dem Anpfiff
+HALFTIME_MINUTES = 15
+STATS_EVERY_MINUTES = 5
+LIVE_STATS_EVERY_MINUTES = 15
+
+EVENT_KINDS = [
+    ("Goal", "Normal Goal"),
+    ("Card", "Yellow Card"),
+    ("Card", "Yellow Card"),
+    ("subst", "Substitution 1"),
+    ("subst", "Substitution 2"),
+    ("Var", "Goal cancelled"),
+]
+
+
+# ── Timeline ─────────────────────────────────────────────
+
+
+def generate_timeline(fixtures: int = FIXTURES, seed: int = 42) -> dict:
+    """
+    Timeline pro Spiel, Einträge mit minute und kind:
+    kickoff, event, stats, synthetic, final_whistle. Teams als side
+    ("home"/"away"), damit die Timeline auf beliebige Matches passt.
+    """
+    rng = random.Random(seed)
+    result = []
+    for fixture in range(fixtures):
+        timeline = [
+            {
+                "minute": PREMATCH_MINUTE,
+                "kind": "synthetic",
+                "event_type": "pre_match_prediction",
+                "context_data": {
+                    "advice": "Double chance : home or draw",
+                    "percent_home": f"{rng.randint(30, 60)}%",
+                },
+            },
+            {"minute": 0, "kind": "kickoff"},
+            {"minute": 90, "kind": "final_whistle"},
+        ]
+        for minute in sorted(rng.sample(range(1, 91), rng.randint(8, 16))):
+            event_type, detail = rng.choice(EVENT_KINDS)
+            number = rng.randint(1, 18)
+            timeline.append(
+                {
+                    "minute": minute,
+                    "kind": "event",
+                    "side": rng.choice(("home", "away")),
+                    "type": event_type,
+                    "detail": detail,
+                    "player_number": number,
+                    "player_name": f"Spieler {number}",
+                    "assist_name": f"Spieler {rng.randint(1, 18)}",
+                }
+            )
+        possession = 50
+        for minute in range(STATS_EVERY_MINUTES, 91, STATS_EVERY_MINUTES):
+            possession = max(30, min(70, possession + rng.randint(-4, 4)))
+            timeline.append(
+                {
+                    "minute": minute,
+                    "kind": "stats",
+                    "home": _stats(rng, minute, possession),
+                    "away": _stats(rng, minute, 100 - possession),
+                }
+            )
+        for minute in range(LIVE_STATS_EVERY_MINUTES, 90, LIVE_STATS_EVERY_MINUTES):
+            timeline.append(
+                {
+                    "minute": minute,
+                    "kind": "synthetic",
+                    "event_type": "live_stats_update",
+                    "side": rng.choice(("home", "away")),
+                    "context_data": {"triggers": ["Schüsse aufs Tor +3"]},
+                }
+            )
+        # bei gleicher Minute: Anstoß vor Events, Abpfiff zuletzt
+        order = {"kickoff": 0, "final_whistle": 2}
+        timeline.sort(key=lambda item: (item["minute"], order.get(item["kind"], 1)))
+        result.append({"timeline": timeline})
+    return {"seed": seed, "fixtures": result}
+
+
+def _stats(rng: random.Random, minute: int, possession: int) -> dict:
+    shots = rng.randint(0, 2 + minute // 6)
+    passes = minute * rng.randint(4, 7)
+    return {
+        "shots_on_goal": shots // 2,
+        "total_shots": shots,
+        "fouls": rng.randint(0, minute // 6),
+        "corner_kicks": rng.randint(0, minute // 10),
+        "ball_possession": possession,
+        "yellow_cards": rng.randint(0, minute // 30),
+        "total_passes": passes,
+        "passes_accurate": int(passes * 0.8),
+    }
+
+
+def wall_offset(minute: int, speed: float) -> float:
+    """Sekunden ab Replay-Start bis zu einer Spielminute (inkl. Halbzeit)."""
+    elapsed = minute - PREMATCH_MINUTE
+    if minute > 45:
+        elapsed += HALFTIME_MINUTES
+    return elapsed * 60 / speed
+
+
+# ── Replay ───────────────────────────────────────────────
+
+
+class MatchdayReplay:
+    def __init__(self, client, speed: float):
+        self.client = client
+        self.speed = speed
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.schedule_lag: list[float] = []
+        self.scores: dict[int, list[int]] = {}
+        self.stats_created: set[int] = set()
+        # TickerEntry-ID → (Schritt, Startzeit) für die Push-Messung
+        self.pending_push: dict[int, tuple[str, float]] = {}
+        self.started = 0.0
+
+    async def request(self, name: str, method: str, path: str, body=None) -> dict:
+        started = time.perf_counter()
+        response = await self.client.request(method, path, json=body)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+            raise RuntimeError(f"{name}: HTTP {response.status_code}")
+        self.latencies[name].append((time.perf_counter() - started) * 1000)
+        return response.json()
+
+    async def run(self, matches: list[dict], timeline: dict) -> float:
+        fixtures = timeline["fixtures"]
+        if len(fixtures) > len(matches):
+            raise SystemExit(
+                f"Timeline hat {len(fixtures)} Spiele, Spieltag nur {len(matches)}"
+            )
+        self.started = time.perf_counter()
+        tasks = [
+            asyncio.create_task(self._fixture(match, fixture["timeline"]))
+            for match, fixture in zip(matches, fixtures)
+        ]
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - self.started
+
+    async def _fixture(self, match: dict, timeline: list[dict]) -> None:
+        self.scores[match["id"]] = [0, 0]
+        steps = []
+        for item in timeline:
+            due = self.started + wall_offset(item["minute"], self.speed)
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            self.schedule_lag.append((time.perf_counter() - due) * 1000)
+            steps.append(asyncio.create_task(self._step(match, item)))
+        await asyncio.gather(*steps)
+
+    async def _step(self, match: dict, item: dict) -> None:
+        handler = getattr(self, f"_on_{item['kind']}")
+        try:
+            await handler(match, item)
+        except Exception as e:
+            self.errors[f"{item['kind']}: {type(e).__name__}"] += 1
+
+    # ── Schritte ─────────────────────────────────────────
+
+    async def _on_kickoff(self, match: dict, item: dict) -> None:
+        await self.request(
+            "PATCH /matches/{id}",
+            "PATCH",
+            f"/api/v1/matches/{match['id']}",
+            {"status": "live"},
+        )
+
+    async def _on_final_whistle(self, match: dict, item: dict) -> None:
+        await self.request(
+            "PATCH /matches/{id}",
+            "PATCH",
+            f"/api/v1/matches/{match['id']}",
+            {"status": "finished"},
+        )
+
+    async def _on_event(self, match: dict, item: dict) -> None:
+        team_id = match[f"{item['side']}_team_id"]
+        started = time.perf_counter()
+        event = await self.request(
+            "POST /events/",
+            "POST",
+            "/api/v1/events/",
+            {
+                "match_id": match["id"],
+                "minute": item["minute"],
+                "team_id": team_id,
+                "player_id": team_id * 100 + item["player_number"],
+                "player_name": item["player_name"],
+                "assist_name": item.get("assist_name"),
+                "type": item["type"],
+                "detail": item["detail"],
+            },
+        )
+        if item["type"] == "Goal":
+            score = self.scores[match["id"]]
+            score[0 if item["side"] == "home" else 1] += 1
+            await self.request(
+                "PATCH /matches/{id}",
+                "PATCH",
+                f"/api/v1/matches/{match['id']}",
+                {"score_home": score[0], "score_away": score[1]},
+            )
+        entry = await self.request(
+            "POST /ticker/generate/{id}",
+            "POST",
+            f"/api/v1/ticker/generate/{event['id']}",
+        )
+        await self._publish("event → published", entry["id"], started)
+
+    async def _on_stats(self, match: dict, item: dict) -> None:
+        rows = [
+            {"match_id": match["id"], "team_id": match[f"{side}_team_id"], **item[side]}
+            for side in ("home", "away")
+        ]
+        if match["id"] not in self.stats_created:
+            self.stats_created.add(match["id"])
+            for row in rows:
+                await self.request(
+                    "POST /match-statistics/", "POST", "/api/v1/match-statistics/", row
+                )
+            return
+        await self.request(
+            "PUT /match-statistics/match/{id}",
+            "PUT",
+            f"/api/v1/match-statistics/match/{match['id']}",
+            rows,
+        )
+
+    async def _on_synthetic(self, match: dict, item: dict) -> None:
+        side = item.get("side")
+        started = time.perf_counter()
+        synthetic = await self.request(
+            "POST /ticker/synthetic",
+            "POST",
+            "/api/v1/ticker/synthetic",
+            {
+                "match_id": match["id"],
+                "team_id": match[f"{side}_team_id"] if side else None,
+                "event_type": item["event_type"],
+                "minute": max(0, item["minute"]),
+                "context_data": {
+                    **item.get("context_data", {}),
+                    "team_name": match[f"{side}_team_name"] if side else None,
+                },
+            },
+        )
+        generated = await self.request(
+            "POST /ticker/generate-synthetic",
+            "POST",
+            "/api/v1/ticker/generate-synthetic",
+            {"synthetic_event_id": synthetic["id"], "llm_provider": "mock"},
+        )
+        await self._publish(
+            "synthetic → published", generated["ticker_entry_id"], started
+        )
+
+    async def _publish(self, name: str, entry_id: int, started: float) -> None:
+        self.pending_push[entry_id] = (name, started)
+        await self.request(
+            "POST /ticker/{id}/publish",
+            "POST",
+            f"/api/v1/ticker/{entry_id}/publish",
+        )
+        self.latencies[name].append((time.perf_counter() - started) * 1000)
+
+    # ── Push ─────────────────────────────────────────────
+
+    def on_live_message(self, message: dict) -> None:
+        """Delta eines Live-Subscribers: veröffentlichter TickerEntry?"""
+        data = message.get("data") or {}
+        if message.get("type") != "ticker_entry" or data.get("status") != "published":
+            return
+        pending = self.pending_push.pop(data.get("id"), None)
+        if pending is not None:
+            name, started = pending
+            self.latencies[f"push: {name}"].append(
+                (time.perf_counter() - started) * 1000
+            )
+
+
+async def _watch_in_process(replay: MatchdayReplay, match_id: int) -> None:
+    from app.services.live_broadcaster import live_broadcaster
+
+    async with live_broadcaster.subscribe(match_id) as queue:
+        while True:
+            replay.on_live_message(await queue.get())
+
+
+async def _watch_sse(replay: MatchdayReplay, client, match_id: int) -> None:
+    path = f"/api/v1/live/matches/{match_id}/stream"
+    async with client.stream("GET", path, timeout=None) as response:
+        async for line in response.aiter_lines():
+            if line.startswith("data: "):
+                replay.on_live_message(json.loads(line[6:]))
+
+
+# ── DB ───────────────────────────────────────────────────
+
+
+def load_matchday(ids: dict) -> list[dict]:
+    """Matches des ersten angesetzten Spieltags der Benchmark-Saison."""
+    from sqlalchemy.orm import joinedload
+
+    from app.core.database import SessionLocal
+    from app.models.match import Match
+    from benchmarks.seed import CURRENT_ROUND
+
+    db = SessionLocal()
+    try:
+        matches = (
+            db.query(Match)
+            .options(joinedload(Match.home_team), joinedload(Match.away_team))
+            .filter(
+                Match.league_season_id == ids["league_season_id"],
+                Match.round == f"Regular Season - {CURRENT_ROUND + 1}",
+            )
+            .order_by(Match.id)
+            .all()
+        )
+        return [
+            {
+                "id": m.id,
+                "home_team_id": m.home_team_id,
+                "away_team_id": m.away_team_id,
+                "home_team_name": m.home_team.name,
+                "away_team_name": m.away_team.name,
+            }
+            for m in matches
+        ]
+    finally:
+        db.close()
+
+
+def reset_matchday(match_ids: list[int]) -> None:
+    """Daten eines Replays entfernen, Matches wieder auf scheduled."""
+    from app.core.database import SessionLocal
+    from app.models.event import Event
+    from app.models.match import Match
+    from app.models.match_statistic import MatchStatistic
+    from app.models.synthetic_event import SyntheticEvent
+    from app.models.ticker_entry import TickerEntry
+
+    db = SessionLocal()
+    try:
+        for model in (TickerEntry, Event, MatchStatistic, SyntheticEvent):
+            db.query(model).filter(model.match_id.in_(match_ids)).delete(
+                synchronize_session=False
+            )
+        db.query(Match).filter(Match.id.in_(match_ids)).update(
+            {"status": "scheduled", "score_home": 0, "score_away": 0, "minute": None},
+            synchronize_session=False,
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+# ── Main ─────────────────────────────────────────────────
+
+
+async def replay_matchday(args, matches: list[dict], timeline: dict) -> dict:
+    import httpx
+
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        from app.main import app
+
+        transport, base_url = httpx.ASGITransport(app=app), "http://replay"
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=60.0
+    ) as client:
+        replay = MatchdayReplay(client, args.speed)
+        match_ids = [m["id"] for m in matches[: len(timeline["fixtures"])]]
+        if args.base_url:
+            # ASGITransport puffert Antworten komplett – SSE nur gegen Server
+            watchers = [
+                asyncio.create_task(_watch_sse(replay, client, match_id))
+                for match_id in match_ids
+            ]
+        else:
+            watchers = [
+                asyncio.create_task(_watch_in_process(replay, match_id))
+                for match_id in match_ids
+            ]
+        await asyncio.sleep(0.1)  # Subscriber registriert, bevor es losgeht
+        try:
+            wall_seconds = await replay.run(matches, timeline)
+            await asyncio.sleep(0.1)  # letzte Pushes abwarten
+        finally:
+            for watcher in watchers:
+                watcher.cancel()
+            await asyncio.gather(*watchers, return_exceptions=True)
+
+    results = [
+        summarize(name, "replay", values, replay.errors.get(name, 0), wall_seconds)
+        for name, values in sorted(replay.latencies.items())
+    ]
+    results.append(
+        summarize("schedule_lag", "replay", replay.schedule_lag, 0, wall_seconds)
+    )
+    return {
+        "wall_seconds": round(wall_seconds, 2),
+        "steps": sum(len(f["timeline"]) for f in timeline["fixtures"]),
+        "errors": dict(replay.errors),
+        "push_missing": len(replay.pending_push),
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--timeline", help="Timeline-JSON statt generierter")
+    parser.add_argument("--dump-timeline", help="generierte Timeline schreiben")
+    parser.add_argument("--fixtures", type=int, default=FIXTURES)
+    parser.add_argument("--speed", type=float, default=100.0, help="1 = Echtzeit")
+    parser.add_argument("--base-url", help="laufender Server statt in-process")
+    parser.add_argument("--mock-latency-ms", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="Daten nicht löschen")
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.timeline:
+        with open(args.timeline) as f:
+            timeline = json.load(f)
+    else:
+        timeline = generate_timeline(args.fixtures, args.seed)
+    if args.dump_timeline:
+        with open(args.dump_timeline, "w") as f:
+            json.dump(timeline, f, indent=2, ensure_ascii=False)
+        return 0
+
+    use_mock_llm(args.mock_latency_ms)
+    from app.core.database import SessionLocal
+    from benchmarks.seed import seed_season
+
+    db = SessionLocal()
+    try:
+        ids = seed_season(db, seed=args.seed)
+    finally:
+        db.close()
+    matches = load_matchday(ids)
+    match_ids = [m["id"] for m in matches]
+
+    reset_matchday(match_ids)
+    try:
+        outcome = asyncio.run(replay_matchday(args, matches, timeline))
+    finally:
+        if not args.keep:
+            reset_matchday(match_ids)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "speed": args.speed,
+            "fixtures": len(timeline["fixtures"]),
+            "timeline": args.timeline,
+            "base_url": args.base_url,
+            "mock_latency_ms": args.mock_latency_ms,
+            "seed": args.seed,
+        },
+        **outcome,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 1 if outcome["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
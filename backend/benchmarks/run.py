@@ -0,0 +1,341 @@
+"""
+Benchmark-Harness: API-Routes, Repositories und LLM-Generierung.
+
+Seedet die synthetische Saison (benchmarks.seed) und misst pro Szenario
+Latenz-Perzentile (p50/p90/p95/p99) und Durchsatz. Das Ergebnis geht als
+JSON auf stdout bzw. in --output, inkl. Commit-Hash; zwei Läufe vergleicht
+benchmarks.compare.
+
+- api: HTTP-Last mit httpx und --concurrency parallelen Clients, entweder
+  in-process (ASGITransport, ohne Lifespan – keine Ingestion-/Job-Worker)
+  oder gegen einen laufenden Server (--base-url).
+- Nur gespielte Matches: dort sind alle Daten vorhanden, GET /matches/{id}
+  stößt also keine Imports (n8n/API-Football) an.
+- repo: Repository-Methoden direkt gegen die DB, sequentiell.
+- generate-synthetic läuft gegen den Mock-Provider (LLM_PROVIDERS=mock bzw.
+  mock:<ms> mit --mock-latency-ms); pro Request wird ein frisches
+  SyntheticEvent angelegt und danach samt Ticker-Eintrag wieder gelöscht.
+  Mit --base-url muss der Server selbst mit LLM_PROVIDERS=mock laufen.
+
+Start (im backend/-Verzeichnis, gegen eine Entwicklungs-DB):
+    python -m benchmarks.run --requests 500 --concurrency 20 -o bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-Rank-Perzentil einer sortierten Liste."""
+    if not sorted_values:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+def summarize(
+    name: str, kind: str, latencies_ms: list[float], errors: int, wall_seconds: float
+) -> dict:
+    values = sorted(latencies_ms)
+    return {
+        "name": name,
+        "kind": kind,
+        "requests": len(values) + errors,
+        "errors": errors,
+        "throughput_rps": round(len(values) / wall_seconds, 1) if wall_seconds else 0.0,
+        "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+        "p50_ms": round(percentile(values, 50), 3),
+        "p90_ms": round(percentile(values, 90), 3),
+        "p95_ms": round(percentile(values, 95), 3),
+        "p99_ms": round(percentile(values, 99), 3),
+        "max_ms": round(values[-1], 3) if values else 0.0,
+    }
+
+
+# ── API ──────────────────────────────────────────────────
+
+
+def api_scenarios(ids: dict, rng: random.Random) -> dict[str, Callable[[], tuple]]:
+    """Szenario → Factory für (Methode, Pfad, JSON-Body)."""
+    played = ids["finished_match_ids"] + ids["live_match_ids"]
+    return {
+        "GET /matches/{id}": lambda: (
+            "GET",
+            f"/api/v1/matches/{rng.choice(played)}",
+            None,
+        ),
+        "GET /ticker/match/{id}": lambda: (
+            "GET",
+            f"/api/v1/ticker/match/{rng.choice(played)}",
+            None,
+        ),
+        "GET /events/?match_id=": lambda: (
+            "GET",
+            f"/api/v1/events/?match_id={rng.choice(played)}",
+            None,
+        ),
+        "GET /favorites/matches": lambda: (
+            "GET",
+            f"/api/v1/favorites/matches?user_id={ids['user_id']}",
+            None,
+        ),
+    }
+
+
+async def _drive(
+    client,
+    name: str,
+    make_request: Callable[[], tuple],
+    requests: int,
+    concurrency: int,
+) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    queue = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in queue:
+            method, path, body = make_request()
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                ok = response.status_code < 400
+            except Exception:
+                ok = False
+            if ok:
+                latencies.append((time.perf_counter() - started) * 1000)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(name, "api", latencies, errors, time.perf_counter() - started)
+
+
+async def run_api(args, ids: dict) -> list[dict]:
+    import httpx
+
+    rng = random.Random(args.seed)
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        from app.main import app
+
+        transport, base_url = httpx.ASGITransport(app=app), "http://benchmark"
+
+    results = []
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=30.0
+    ) as client:
+        for name, make_request in api_scenarios(ids, rng).items():
+            if not args.only or name in args.only:
+                await _drive(client, name, make_request, args.warmup, args.concurrency)
+                results.append(
+                    await _drive(
+                        client, name, make_request, args.requests, args.concurrency
+                    )
+                )
+        name = "POST /ticker/generate-synthetic"
+        if not args.only or name in args.only:
+            results.append(await _generate_synthetic(client, name, args, ids))
+    return results
+
+
+async def _generate_synthetic(client, name: str, args, ids: dict) -> dict:
+    from app.core.database import SessionLocal
+    from app.models.synthetic_event import SyntheticEvent
+    from app.models.ticker_entry import TickerEntry
+
+    db = SessionLocal()
+    events: list = []
+    try:
+        events = [
+            SyntheticEvent(
+                match_id=ids["live_match_ids"][n % len(ids["live_match_ids"])],
+                event_type="pre_match_prediction",
+                minute=0,
+                context_data={"advice": "Benchmark", "percent_home": "45%"},
+            )
+            for n in range(args.requests)
+        ]
+        db.add_all(events)
+        db.commit()
+        event_ids = iter([e.id for e in events])
+
+        def make_request():
+            return (
+                "POST",
+                "/api/v1/ticker/generate-synthetic",
+                {"synthetic_event_id": next(event_ids), "llm_provider": "mock"},
+            )
+
+        return await _drive(client, name, make_request, args.requests, args.concurrency)
+    finally:
+        # auch nach fehlgeschlagenem Insert aufräumen können
+        db.rollback()
+        created = [e.id for e in events if e.id is not None]
+        db.query(TickerEntry).filter(
+            TickerEntry.synthetic_event_id.in_(created)
+        ).delete(synchronize_session=False)
+        db.query(SyntheticEvent).filter(SyntheticEvent.id.in_(created)).delete(
+            synchronize_session=False
+        )
+        db.commit()
+        db.close()
+
+
+# ── Repositories ─────────────────────────────────────────
+
+
+def repo_scenarios(ids: dict, rng: random.Random) -> dict[str, Callable]:
+    from app.repositories.event_repository import EventRepository
+    from app.repositories.lineup_repository import LineupRepository
+    from app.repositories.match_repository import MatchRepository
+    from app.repositories.ticker_entry_repository import TickerEntryRepository
+
+    played = ids["finished_match_ids"] + ids["live_match_ids"]
+    return {
+        "MatchRepository.get_by_id": lambda db: MatchRepository(db).get_by_id(
+            rng.choice(ids["match_ids"])
+        ),
+        "MatchRepository.get_by_round": lambda db: MatchRepository(db).get_by_round(
+            ids["league_season_id"], f"Regular Season - {rng.randint(1, 34)}"
+        ),
+        "MatchRepository.get_by_team": lambda db: MatchRepository(db).get_by_team(
+            rng.choice(ids["team_ids"])
+        ),
+        "MatchRepository.get_live": lambda db: MatchRepository(db).get_live(),
+        "EventRepository.get_by_match": lambda db: EventRepository(db).get_by_match(
+            rng.choice(played)
+        ),
+        "TickerEntryRepository.get_published": lambda db: TickerEntryRepository(
+            db
+        ).get_published(rng.choice(played)),
+        "LineupRepository.get_by_match": lambda db: LineupRepository(db).get_by_match(
+            rng.choice(played)
+        ),
+    }
+
+
+def run_repositories(args, ids: dict) -> list[dict]:
+    from app.core.database import SessionLocal
+
+    rng = random.Random(args.seed)
+    results = []
+    db = SessionLocal()
+    try:
+        for name, call in repo_scenarios(ids, rng).items():
+            if args.only and name not in args.only:
+                continue
+            for _ in range(args.warmup):
+                call(db)
+                db.rollback()
+            latencies = []
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                call_started = time.perf_counter()
+                call(db)
+                latencies.append((time.perf_counter() - call_started) * 1000)
+                # leere Identity Map: jeder Aufruf lädt wie im Request neu
+                db.rollback()
+            results.append(
+                summarize(name, "repo", latencies, 0, time.perf_counter() - started)
+            )
+    finally:
+        db.close()
+    return results
+
+
+# ── Main ─────────────────────────────────────────────────
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def use_mock_llm(latency_ms: int = 0) -> None:
+    """Mock-Provider erzwingen – vor dem ersten App-Import aufrufen, da
+    Settings und LLM-Router die Umgebung beim Import lesen."""
+    os.environ["LLM_PROVIDERS"] = f"mock:{latency_ms}" if latency_ms else "mock"
+    os.environ.setdefault("LLM_HEDGE_ENABLED", "false")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200, help="pro Szenario")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--suite", choices=["all", "api", "repo"], default="all")
+    parser.add_argument("--only", nargs="*", help="nur diese Szenarien (Namen)")
+    parser.add_argument("--base-url", help="laufender Server statt in-process")
+    parser.add_argument("--mock-latency-ms", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: stdout)")
+    args = parser.parse_args(argv)
+
+    use_mock_llm(args.mock_latency_ms)
+    from app.core.database import SessionLocal
+    from benchmarks.seed import seed_season
+
+    db = SessionLocal()
+    try:
+        seed_started = time.perf_counter()
+        ids = seed_season(db, seed=args.seed)
+        seed_seconds = time.perf_counter() - seed_started
+    finally:
+        db.close()
+
+    results = []
+    if args.suite in ("all", "repo"):
+        results += run_repositories(args, ids)
+    if args.suite in ("all", "api"):
+        results += asyncio.run(run_api(args, ids))
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "base_url": args.base_url,
+            "mock_latency_ms": args.mock_latency_ms,
+            "seed": args.seed,
+        },
+        "dataset": {
+            "teams": len(ids["team_ids"]),
+            "matches": len(ids["match_ids"]),
+            "seed_seconds": round(seed_seconds, 2),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 1 if any(r["errors"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+Synthetische Saison für Benchmarks.
+
+18 Teams, Doppelrunde (34 Spieltage × 9 = 306 Matches) mit Events,
+Aufstellungen, Team- und Spielerstatistiken sowie veröffentlichten
+Ticker-Einträgen. Spieltage vor CURRENT_ROUND sind beendet, CURRENT_ROUND
+läuft heute (live), der Rest ist angesetzt.
+
+Alle Datensätze hängen an eigenen external_ids (BENCH_EXTERNAL_ID + n) und
+einer Dummy-Saison, stören also keine echten Daten. seed_season() ist
+idempotent: existiert die Benchmark-Liga schon, werden nur die IDs geladen.
+Deterministisch über den Seed (gleiche Daten → vergleichbare Läufe).
+"""
+
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.models.league import League
+from app.models.league_season import LeagueSeason
+from app.models.lineup import Lineup
+from app.models.match import Match
+from app.models.match_statistic import MatchStatistic
+from app.models.player_statistic import PlayerStatistic
+from app.models.season import Season
+from app.models.synthetic_event import SyntheticEvent
+from app.models.team import Team
+from app.models.ticker_entry import TickerEntry
+from app.models.user_favorite import UserFavorite
+
+BENCH_EXTERNAL_ID = 990_000
+BENCH_SEASON_YEAR = 2099
+BENCH_USER_ID = 990_001
+TEAMS = 18
+CURRENT_ROUND = 17
+SQUAD_SIZE = 18  # 11 Starter + 7 Ersatz
+EVENTS_PER_MATCH = 12
+TICKER_ENTRIES_PER_MATCH = 20
+FAVORITE_TEAMS = 3
+
+EVENT_TYPES = [
+    ("Goal", "Normal Goal"),
+    ("Card", "Yellow Card"),
+    ("subst", "Substitution 1"),
+    ("Var", "Goal cancelled"),
+]
+POSITIONS = ["G"] + ["D"] * 4 + ["M"] * 4 + ["F"] * 2
+
+
+def _round_robin(team_ids: list[int]) -> list[list[tuple[int, int]]]:
+    """Spielplan nach der Kreismethode: Hin- und Rückrunde."""
+    teams = list(team_ids)
+    rounds = []
+    for r in range(len(teams) - 1):
+        pairs = []
+        for i in range(len(teams) // 2):
+            home, away = teams[i], teams[-1 - i]
+            pairs.append((home, away) if (r + i) % 2 == 0 else (away, home))
+        rounds.append(pairs)
+        teams.insert(1, teams.pop())
+    return rounds + [[(away, home) for home, away in pairs] for pairs in rounds]
+
+
+def _load(db: Session, league: League) -> dict:
+    league_season = (
+        db.query(LeagueSeason).filter(LeagueSeason.league_id == league.id).one()
+    )
+    matches = (
+        db.query(Match.id, Match.status)
+        .filter(Match.league_season_id == league_season.id)
+        .order_by(Match.id)
+        .all()
+    )
+    team_ids = [
+        t.id
+        for t in db.query(Team.id)
+        .filter(
+            Team.external_id > BENCH_EXTERNAL_ID,
+            Team.external_id <= BENCH_EXTERNAL_ID + TEAMS,
+        )
+        .order_by(Team.external_id)
+    ]
+    return {
+        "league_id": league.id,
+        "league_season_id": league_season.id,
+        "team_ids": team_ids,
+        "match_ids": [m.id for m in matches],
+        "finished_match_ids": [m.id for m in matches if m.status == "finished"],
+        "live_match_ids": [m.id for m in matches if m.status == "live"],
+        "user_id": BENCH_USER_ID,
+    }
+
+
+def seed_season(db: Session, seed: int = 42) -> dict:
+    """Legt die Benchmark-Saison an (falls nötig) und gibt die IDs zurück."""
+    league = db.query(League).filter(League.external_id == BENCH_EXTERNAL_ID).first()
+    if league is not None:
+        return _load(db, league)
+
+    rng = random.Random(seed)
+    season = db.query(Season).filter(Season.year == BENCH_SEASON_YEAR).first()
+    if season is None:
+        season = Season(year=BENCH_SEASON_YEAR, current=False)
+        db.add(season)
+    league = League(external_id=BENCH_EXTERNAL_ID, name="Benchmark Liga", type="League")
+    db.add(league)
+    db.flush()
+
+    round_names = [f"Regular Season - {r}" for r in range(1, 2 * (TEAMS - 1) + 1)]
+    league_season = LeagueSeason(
+        league_id=league.id,
+        season_id=season.id,
+        current_round=round_names[CURRENT_ROUND - 1],
+        total_rounds=len(round_names),
+        rounds=round_names,
+    )
+    teams = [
+        Team(
+            external_id=BENCH_EXTERNAL_ID + n,
+            name=f"Benchmark Team {n}",
+            short_name=f"Bench {n}",
+            code=f"B{n:02d}",
+            country="Benchmark",
+            is_partner=n <= 2,
+        )
+        for n in range(1, TEAMS + 1)
+    ]
+    db.add(league_season)
+    db.add_all(teams)
+    db.flush()
+    team_ids = [t.id for t in teams]
+
+    # Spielplan: CURRENT_ROUND heute, die anderen Spieltage im Wochenabstand
+    today = datetime.combine(date.today(), time(15, 30), tzinfo=timezone.utc)
+    match_rows = []
+    for r, pairs in enumerate(_round_robin(team_ids), start=1):
+        kickoff = today + timedelta(weeks=r - CURRENT_ROUND)
+        status = (
+            "finished"
+            if r < CURRENT_ROUND
+            else "live"
+            if r == CURRENT_ROUND
+            else "scheduled"
+        )
+        for home, away in pairs:
+            match_rows.append(
+                {
+                    "external_id": BENCH_EXTERNAL_ID * 100 + len(match_rows) + 1,
+                    "league_season_id": league_season.id,
+                    "home_team_id": home,
+                    "away_team_id": away,
+                    "round": round_names[r - 1],
+                    "match_date": kickoff,
+                    "status": status,
+                    "score_home": rng.randint(0, 4) if status != "scheduled" else 0,
+                    "score_away": rng.randint(0, 3) if status != "scheduled" else 0,
+                    "minute": 90
+                    if status == "finished"
+                    else 55
+                    if status == "live"
+                    else None,
+                }
+            )
+    match_ids = (
+        db.execute(
+            insert(Match).returning(Match.id, sort_by_parameter_order=True), match_rows
+        )
+        .scalars()
+        .all()
+    )
+
+    events, tickers, lineups, match_stats, player_stats = [], [], [], [], []
+    prematch = []
+    for match_id, row in zip(match_ids, match_rows):
+        if row["status"] == "scheduled":
+            continue
+        last_minute = row["minute"]
+        # verschiedene Minuten: (match, minute, player, type) ist unique
+        for minute in sorted(rng.sample(range(1, last_minute + 1), EVENTS_PER_MATCH)):
+            event_type, detail = rng.choice(EVENT_TYPES)
+            team_id = rng.choice((row["home_team_id"], row["away_team_id"]))
+            number = rng.randint(1, SQUAD_SIZE)
+            events.append(
+                {
+                    "match_id": match_id,
+                    "minute": minute,
+                    "team_id": team_id,
+                    "player_id": team_id * 100 + number,
+                    "player_name": f"Spieler {number}",
+                    "type": event_type,
+                    "detail": detail,
+                }
+            )
+        # Vorbericht vorhanden → GET /matches/{id} triggert keine Imports
+        prematch.append(
+            {
+                "match_id": match_id,
+                "event_type": "pre_match_prediction",
+                "minute": 0,
+                "context_data": {"advice": "Benchmark"},
+            }
+        )
+        for n in range(TICKER_ENTRIES_PER_MATCH):
+            tickers.append(
+                {
+                    "match_id": match_id,
+                    "minute": last_minute * n // TICKER_ENTRIES_PER_MATCH,
+                    "text": f"Benchmark-Ticker {n + 1}: " + "Lorem ipsum " * 10,
+                    "status": "published",
+                    "mode": "auto",
+                    "style": "neutral",
+                    "language": "de",
+                    "llm_model": "mock",
+                }
+            )
+        for team_id in (row["home_team_id"], row["away_team_id"]):
+            match_stats.append(
+                {
+                    "match_id": match_id,
+                    "team_id": team_id,
+                    "shots_on_goal": rng.randint(0, 10),
+                    "total_shots": rng.randint(5, 25),
+                    "fouls": rng.randint(5, 20),
+                    "corner_kicks": rng.randint(0, 12),
+                    "ball_possession": rng.randint(30, 70),
+                    "yellow_cards": rng.randint(0, 5),
+                    "red_cards": 0,
+                    "total_passes": rng.randint(300, 700),
+                }
+            )
+            for n in range(1, SQUAD_SIZE + 1):
+                substitute = n > len(POSITIONS)
+                lineups.append(
+                    {
+                        "match_id": match_id,
+                        "team_id": team_id,
+                        "formation": "4-4-2",
+                        "player_id": team_id * 100 + n,
+                        "player_name": f"Spieler {n}",
+                        "number": n,
+                        "position": rng.choice("DMF")
+                        if substitute
+                        else POSITIONS[n - 1],
+                        "grid": None if substitute else f"{n // 4 + 1}:{n % 4 + 1}",
+                        "is_substitute": substitute,
+                    }
+                )
+                player_stats.append(
+                    {
+                        "match_id": match_id,
+                        "team_id": team_id,
+                        "player_id": team_id * 100 + n,
+                        "player_name": f"Spieler {n}",
+                        "minutes_played": 0 if substitute else last_minute,
+                        "number": n,
+                        "substitute": substitute,
+                        "shots_total": rng.randint(0, 5),
+                        "passes_total": rng.randint(5, 80),
+                        "duels_total": rng.randint(0, 20),
+                    }
+                )
+
+    for model, rows in (
+        (Event, events),
+        (TickerEntry, tickers),
+        (MatchStatistic, match_stats),
+        (Lineup, lineups),
+        (PlayerStatistic, player_stats),
+        (SyntheticEvent, prematch),
+    ):
+        db.execute(insert(model), rows)
+    db.execute(
+        insert(UserFavorite),
+        [{"user_id": BENCH_USER_ID, "team_id": t} for t in team_ids[:FAVORITE_TEAMS]],
+    )
+    db.commit()
+    return _load(db, league)
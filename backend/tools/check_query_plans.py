@@ -0,0 +1,150 @@
+"""
+Query-Plan-Check für die Hot Paths (Indizes aus Migration b8e4f2a6d9c3).
+
+Führt die Repository-Methoden der häufigsten Lese-Queries gegen die
+konfigurierte PostgreSQL-DB aus, zeichnet das erzeugte SQL auf und prüft
+per EXPLAIN, dass die Zieltabelle nicht sequenziell gelesen wird. Mit
+enable_seqscan = off ist das Ergebnis auch auf einer fast leeren
+Entwicklungs-DB aussagekräftig: fehlt ein passender Index, bleibt dem
+Planer nur der Seq Scan.
+
+Start (im backend/-Verzeichnis, nach alembic upgrade head):
+    python -m tools.check_query_plans
+
+Exit-Code 1, sobald eine Query einen Seq Scan auf ihrer Tabelle hat.
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.models.synthetic_event import SyntheticEvent
+from app.repositories.lineup_repository import LineupRepository
+from app.repositories.match_repository import MatchRepository
+from app.repositories.match_statistic_repository import MatchStatisticRepository
+from app.repositories.ticker_entry_repository import TickerEntryRepository
+
+# (Name, Zieltabelle, Aufruf)
+CHECKS: list[tuple[str, str, Callable[[Session], object]]] = [
+    ("MatchRepository.get_live", "matches", lambda db: MatchRepository(db).get_live()),
+    (
+        "MatchRepository.get_by_date",
+        "matches",
+        lambda db: MatchRepository(db).get_by_date(datetime.now(timezone.utc)),
+    ),
+    (
+        "MatchRepository.get_by_league_season",
+        "matches",
+        lambda db: MatchRepository(db).get_by_league_season(1),
+    ),
+    (
+        "MatchRepository.get_by_round",
+        "matches",
+        lambda db: MatchRepository(db).get_by_round(1, "1"),
+    ),
+    (
+        "MatchRepository.get_by_team",
+        "matches",
+        lambda db: MatchRepository(db).get_by_team(1),
+    ),
+    (
+        "TickerEntryRepository.get_published",
+        "ticker_entries",
+        lambda db: TickerEntryRepository(db).get_published(1),
+    ),
+    (
+        "IngestionService._upsert_synthetic (Lookup)",
+        "synthetic_events",
+        lambda db: db.query(SyntheticEvent)
+        .filter(
+            SyntheticEvent.match_id == 1,
+            SyntheticEvent.event_type == "pre_match_prediction",
+            SyntheticEvent.team_id == None,
+        )
+        .first(),
+    ),
+    (
+        "LineupRepository.get_by_match",
+        "lineups",
+        lambda db: LineupRepository(db).get_by_match(1),
+    ),
+    (
+        "MatchStatisticRepository.get_by_team",
+        "match_statistics",
+        lambda db: MatchStatisticRepository(db).get_by_team(1),
+    ),
+]
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Relationen, die im Plan (rekursiv) per Seq Scan gelesen werden."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+def _capture(db: Session, call: Callable[[Session], object]) -> list[tuple]:
+    """Führt call aus und liefert alle SELECTs als (SQL, Parameter)."""
+    statements: list[tuple] = []
+    connection = db.connection()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        call(db)
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def explain(db: Session, call: Callable[[Session], object]) -> list[dict]:
+    """EXPLAIN-Pläne (JSON) aller SELECTs, die call ausführt."""
+    connection = db.connection()
+    plans = []
+    for statement, parameters in _capture(db, call):
+        raw = connection.exec_driver_sql(
+            "EXPLAIN (FORMAT JSON) " + statement, parameters
+        ).scalar()
+        plans.append((json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"])
+    return plans
+
+
+def check(db: Session) -> list[str]:
+    """Fehlermeldungen pro Query mit Seq Scan auf der Zieltabelle."""
+    db.connection().exec_driver_sql("SET LOCAL enable_seqscan = off")
+    failures = []
+    for name, table, call in CHECKS:
+        for plan in explain(db, call):
+            scans = seq_scans(plan)
+            status = "FAIL" if table in scans else "ok"
+            print(f"{status:4}  {name:45} {plan['Node Type']}")
+            if table in scans:
+                failures.append(f"{name}: Seq Scan auf {table}")
+    return failures
+
+
+def main() -> int:
+    db = SessionLocal()
+    try:
+        failures = check(db)
+    finally:
+        db.rollback()
+        db.close()
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+Fake API-Football Server für lokale Tests der nativen Ingestion.
+
+Liefert deterministische Daten pro Fixture im Format von api-sports v3
+(fixtures, fixtures/events, fixtures/statistics, fixtures/lineups,
+fixtures/players, injuries, predictions) inkl. ETag / 304. Die Spielzeit
+läuft ab Serverstart mit FAKE_SECONDS_PER_MINUTE (Standard 1s = 1 Minute),
+Events erscheinen also nach und nach.
+
+Start:
+    FAKE_LIVE_FIXTURES=1001,1002 uvicorn tools.fake_api_football:app --port 8081
+
+Backend dagegen laufen lassen:
+    API_FOOTBALL_BASE_URL=http://localhost:8081 INGESTION_MODE=native ...
+
+Team-IDs pro Fixture: teams_for_fixture(fixture_id) – Seeds (Teams/Matches)
+müssen dieselben external_ids verwenden.
+"""
+
+import hashlib
+import json
+import os
+import random
+import time
+
+from fastapi import FastAPI, Request, Response
+
+app = FastAPI(title="Fake API-Football")
+
+START = time.monotonic()
+SECONDS_PER_MINUTE = float(os.getenv("FAKE_SECONDS_PER_MINUTE", "1"))
+LIVE_FIXTURES = [
+    int(f) for f in os.getenv("FAKE_LIVE_FIXTURES", "").split(",") if f.strip()
+]
+
+STAT_TYPES = [
+    "Shots on Goal",
+    "Shots off Goal",
+    "Total Shots",
+    "Blocked Shots",
+    "Shots insidebox",
+    "Shots outsidebox",
+    "Fouls",
+    "Corner Kicks",
+    "Offsides",
+    "Ball Possession",
+    "Yellow Cards",
+    "Red Cards",
+    "Goalkeeper Saves",
+    "Total passes",
+    "Passes accurate",
+    "Passes %",
+]
+
+
+def teams_for_fixture(fixture_id: int) -> tuple[int, int]:
+    """External IDs (Heim, Gast) einer Fixture."""
+    base = 10000 + (fixture_id % 500) * 2
+    return base, base + 1
+
+
+def _player_id(team_id: int, number: int) -> int:
+    return team_id * 100 + number
+
+
+def _elapsed() -> int:
+    return min(90, int((time.monotonic() - START) / SECONDS_PER_MINUTE))
+
+
+def _team(team_id: int) -> dict:
+    return {"id": team_id, "name": f"Team {team_id}", "logo": None}
+
+
+def _fixture(fixture_id: int) -> dict:
+    home, away = teams_for_fixture(fixture_id)
+    elapsed = _elapsed()
+    goals = [e for e in _all_events(fixture_id) if e["type"] == "Goal"]
+    goals = [e for e in goals if e["time"]["elapsed"] <= elapsed]
+    return {
+        "fixture": {
+            "id": fixture_id,
+            "date": "2026-10-18T15:30:00+00:00",
+            "status": {
+                "short": "FT" if elapsed >= 90 else "2H" if elapsed > 45 else "1H",
+                "elapsed": elapsed,
+            },
+        },
+        "teams": {"home": _team(home), "away": _team(away)},
+        "goals": {
+            "home": sum(1 for e in goals if e["team"]["id"] == home),
+            "away": sum(1 for e in goals if e["team"]["id"] == away),
+        },
+    }
+
+
+def _all_events(fixture_id: int) -> list[dict]:
+    rng = random.Random(fixture_id)
+    teams = teams_for_fixture(fixture_id)
+    events = []
+    for _ in range(rng.randint(6, 14)):
+        team_id = rng.choice(teams)
+        number = rng.randint(1, 11)
+        kind, detail = rng.choice(
+            [
+                ("Goal", "Normal Goal"),
+                ("Card", "Yellow Card"),
+                ("Card", "Yellow Card"),
+                ("subst", "Substitution 1"),
+            ]
+        )
+        events.append(
+            {
+                "time": {"elapsed": rng.randint(1, 90), "extra": None},
+                "team": _team(team_id),
+                "player": {
+                    "id": _player_id(team_id, number),
+                    "name": f"Player {number}",
+                },
+                "assist": {"id": None, "name": None},
+                "type": kind,
+                "detail": detail,
+                "comments": None,
+            }
+        )
+    return sorted(events, key=lambda e: e["time"]["elapsed"])
+
+
+def _events(fixture_id: int) -> list[dict]:
+    elapsed = _elapsed()
+    return [e for e in _all_events(fixture_id) if e["time"]["elapsed"] <= elapsed]
+
+
+def _statistics(fixture_id: int) -> list[dict]:
+    rng = random.Random(fixture_id * 31 + _elapsed())
+    possession = rng.randint(35, 65)
+    result = []
+    for i, team_id in enumerate(teams_for_fixture(fixture_id)):
+        values = {t: rng.randint(0, 15) for t in STAT_TYPES}
+        values["Ball Possession"] = f"{possession if i == 0 else 100 - possession}%"
+        values["Passes %"] = f"{rng.randint(70, 90)}%"
+        values["Red Cards"] = None
+        result.append(
+            {
+                "team": _team(team_id),
+                "statistics": [{"type": t, "value": v} for t, v in values.items()],
+            }
+        )
+    return result
+
+
+def _lineups(fixture_id: int) -> list[dict]:
+    result = []
+    for team_id in teams_for_fixture(fixture_id):
+        players = [
+            {
+                "player": {
+                    "id": _player_id(team_id, n),
+                    "name": f"Player {n}",
+                    "number": n,
+                    "pos": "G" if n == 1 else "D" if n <= 5 else "M" if n <= 8 else "F",
+                    "grid": f"{min(n, 4)}:{n % 4 + 1}" if n <= 11 else None,
+                }
+            }
+            for n in range(1, 19)
+        ]
+        result.append(
+            {
+                "team": _team(team_id),
+                "formation": "4-3-3",
+                "coach": {"id": team_id, "name": f"Coach {team_id}"},
+                "startXI": players[:11],
+                "substitutes": players[11:],
+            }
+        )
+    return result
+
+
+def _players(fixture_id: int) -> list[dict]:
+    rng = random.Random(fixture_id * 17)
+    result = []
+    for team_id in teams_for_fixture(fixture_id):
+        players = []
+        for n in range(1, 15):
+            players.append(
+                {
+                    "player": {
+                        "id": _player_id(team_id, n),
+                        "name": f"Player {n}",
+                        "photo": None,
+                    },
+                    "statistics": [
+                        {
+                            "games": {
+                                "minutes": 90 if n <= 11 else rng.randint(5, 30),
+                                "number": n,
+                                "position": "G" if n == 1 else "M",
+                                "rating": f"{rng.uniform(5.5, 8.5):.1f}",
+                                "captain": n == 10,
+                                "substitute": n > 11,
+                            },
+                            "offsides": None,
+                            "shots": {"total": rng.randint(0, 4), "on": 1},
+                            "goals": {
+                                "total": None,
+                                "conceded": 0,
+                                "assists": None,
+                                "saves": None,
+                            },
+                            "passes": {
+                                "total": rng.randint(10, 70),
+                                "key": rng.randint(0, 3),
+                                "accuracy": str(rng.randint(60, 95)),
+                            },
+                            "tackles": {"total": 2, "blocks": None, "interceptions": 1},
+                            "duels": {"total": 8, "won": 4},
+                            "dribbles": {"attempts": 2, "success": 1, "past": None},
+                            "fouls": {"drawn": 1, "committed": 1},
+                            "cards": {"yellow": 0, "red": 0},
+                            "penalty": {
+                                "won": None,
+                                "commited": None,
+                                "scored": 0,
+                                "missed": 0,
+                                "saved": None,
+                            },
+                        }
+                    ],
+                }
+            )
+        result.append({"team": _team(team_id), "players": players})
+    return result
+
+
+def _injuries(fixture_id: int) -> list[dict]:
+    home, away = teams_for_fixture(fixture_id)
+    return [
+        {
+            "team": _team(team_id),
+            "player": {
+                "id": _player_id(team_id, 20),
+                "name": "Player 20",
+                "type": "Missing Fixture",
+                "reason": "Knee Injury",
+            },
+        }
+        for team_id in (home, away)
+    ]
+
+
+def _predictions(fixture_id: int) -> list[dict]:
+    home, away = teams_for_fixture(fixture_id)
+
+    def team(team_id: int) -> dict:
+        return {
+            **_team(team_id),
+            "last_5": {
+                "form": "60%",
+                "att": "55%",
+                "def": "50%",
+                "goals": {"for": {"average": "1.6"}, "against": {"average": "1.0"}},
+            },
+            "league": {
+                "fixtures": {
+                    "wins": {"total": 5},
+                    "draws": {"total": 2},
+                    "loses": {"total": 3},
+                },
+                "clean_sheet": {"total": 3},
+                "failed_to_score": {"total": 1},
+            },
+        }
+
+    return [
+        {
+            "predictions": {
+                "winner": {"id": home, "name": f"Team {home}", "comment": "Win"},
+                "advice": f"Double chance : Team {home} or draw",
+                "percent": {"home": "50%", "draw": "30%", "away": "20%"},
+            },
+            "teams": {"home": team(home), "away": team(away)},
+            "comparison": {
+                k: {"home": "55%", "away": "45%"}
+                for k in ("form", "att", "def", "h2h", "goals", "total")
+            },
+        }
+    ]
+
+
+def _respond(request: Request, endpoint: str, response: list) -> Response:
+    body = json.dumps(
+        {
+            "get": endpoint,
+            "parameters": dict(request.query_params),
+            "errors": [],
+            "results": len(response),
+            "response": response,
+        }
+    )
+    etag = '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@app.get("/fixtures")
+def fixtures(request: Request, id: int | None = None, live: str | None = None):
+    if live:
+        return _respond(request, "fixtures", [_fixture(f) for f in LIVE_FIXTURES])
+    return _respond(request, "fixtures", [_fixture(id)] if id else [])
+
+
+@app.get("/fixtures/events")
+def fixture_events(request: Request, fixture: int):
+    return _respond(request, "fixtures/events", _events(fixture))
+
+
+@app.get("/fixtures/statistics")
+def fixture_statistics(request: Request, fixture: int):
+    return _respond(request, "fixtures/statistics", _statistics(fixture))
+
+
+@app.get("/fixtures/lineups")
+def fixture_lineups(request: Request, fixture: int):
+    return _respond(request, "fixtures/lineups", _lineups(fixture))
+
+
+@app.get("/fixtures/players")
+def fixture_players(request: Request, fixture: int):
+    return _respond(request, "fixtures/players", _players(fixture))
+
+
+@app.get("/injuries")
+def injuries(request: Request, fixture: int):
+    return _respond(request, "injuries", _injuries(fixture))
+
+
+@app.get("/predictions")
+def predictions(request: Request, fixture: int):
+    return _respond(request, "predictions", _predictions(fixture))
@@ -70,7 +70,14 @@ function MatchHeader({ match, leagueSeason, favorites, onToggleFav }) {
   );
 }
 
-function TickerEvent({ event, tickerText, mode, generatingId, onGenerate }) {
+function TickerEvent({
+  event,
+  tickerText,
+  mode,
+  generatingId,
+  streamingText,
+  onGenerate,
+}) {
   const [editText, setEditText] = useState("");
   const [published, setPublished] = useState(false);
 
@@ -183,6 +190,9 @@ function TickerEvent({ event, tickerText, mode, generatingId, onGenerate }) {
         <span className="ev-icon">{icon}</span>
         <div className="ev-body">
           <div className="ev-raw">{rawText()}</div>
+          {generatingId === event.id && streamingText && (
+            <div className="ticker-text">{streamingText}</div>
+          )}
           <div className="gen-btns">
             {["neutral", "euphorisch", "kritisch"].map((s) => (
               <button
@@ -345,6 +355,7 @@ export default function LiveTicker() {
   const [selRound, setSelRound] = useState(null);
   const [selMatchId, setSelMatchId] = useState(null);
   const [generatingId, setGeneratingId] = useState(null);
+  const [streamingText, setStreamingText] = useState("");
 
   const {
     match,
@@ -464,11 +475,15 @@ export default function LiveTicker() {
   const generateTicker = useCallback(
     async (eventId, style) => {
       setGeneratingId(eventId);
+      setStreamingText("");
       try {
-        await api.generateTicker(eventId, style);
+        await api.streamTicker(eventId, style, (token) =>
+          setStreamingText((prev) => prev + token),
+        );
         await reload.loadTickerTexts();
       } finally {
         setGeneratingId(null);
+        setStreamingText("");
       }
     },
     [reload],
@@ -720,6 +735,7 @@ export default function LiveTicker() {
                 tickerText={tickerTexts.find((t) => t.event_id === ev.id)}
                 mode={tickerMode}
                 generatingId={generatingId}
+                streamingText={streamingText}
                 onGenerate={generateTicker}
               />
             ))}
@@ -34,6 +34,10 @@ export const fetchMatches = (lsId, round) =>
     `/matches/?league_season_id=${lsId}&round=${encodeURIComponent(round)}`,
   );
 export const fetchMatch = (id) => api.get(`/matches/${id}`);
+export const fetchMatchSnapshot = (id, fields) =>
+  api.get(`/matches/${id}/snapshot`, {
+    params: fields ? { fields: fields.join(",") } : undefined,
+  });
 export const fetchTodayMatches = () => api.get("/matches/today");
 export const fetchLiveMatches = () => api.get("/matches/live");
 
@@ -49,6 +53,38 @@ export const fetchLiveStats = (matchId) =>
   api.get(`/ticker/match/${matchId}/live`);
 export const generateTicker = (eventId, style) =>
   api.post(`/ticker/generate/${eventId}?style=${style}`);
+
+// Streaming-Variante (SSE per fetch, da EventSource kein POST kann):
+// ruft onToken pro Teilstück auf, liefert am Ende den gespeicherten Eintrag
+export const streamTicker = async (eventId, style, onToken) => {
+  const res = await fetch(
+    `${config.apiBase}/ticker/generate/${eventId}/stream?style=${style}`,
+    { method: "POST" },
+  );
+  if (!res.ok) throw new Error(`HTTP ${res.status}`);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let result = null;
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const messages = buffer.split("\n\n");
+    buffer = messages.pop();
+    for (const message of messages) {
+      const event = message.match(/^event: (.*)$/m)?.[1];
+      const data = message.match(/^data: (.*)$/m)?.[1];
+      if (!event || !data) continue;
+      const payload = JSON.parse(data);
+      if (event === "token") onToken(payload.text);
+      else if (event === "done") result = payload;
+      else if (event === "error") throw new Error(payload.detail);
+    }
+  }
+  return result;
+};
 export const createManualTicker = (matchId, text, icon = "📝", minute) =>
   api.post("/ticker/", {
     match_id: matchId,
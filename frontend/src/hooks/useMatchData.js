@@ -1,6 +1,16 @@
 import { useState, useEffect, useCallback, useRef } from "react";
 import * as api from "../api";
 
+// Ein Snapshot-Request statt acht Einzel-Requests; Polling lädt nur die
+// Felder, die sich während des Spiels ändern.
+const STATIC_FIELDS = [
+  "lineups",
+  "match_statistics",
+  "player_statistics",
+  "prematch",
+];
+const LIVE_FIELDS = ["events", "ticker_entries", "live_stats"];
+
 export function useMatchData(selectedMatchId) {
   const [match, setMatch] = useState(null);
   const [events, setEvents] = useState([]);
@@ -13,88 +23,54 @@ export function useMatchData(selectedMatchId) {
   const [loading, setLoading] = useState(false);
   const intervalRef = useRef(null);
 
-  const loadMatch = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchMatch(selectedMatchId);
-    setMatch(res.data);
-  }, [selectedMatchId]);
-
-  const loadEvents = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchEvents(selectedMatchId);
-    setEvents([...res.data].reverse());
-  }, [selectedMatchId]);
-
-  const loadTickerTexts = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchTickerTexts(selectedMatchId);
-    setTickerTexts(res.data);
-  }, [selectedMatchId]);
-
-  const loadPrematch = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchPrematch(selectedMatchId);
-    setPrematch(res.data);
-  }, [selectedMatchId]);
+  const loadSnapshot = useCallback(
+    async (fields) => {
+      if (!selectedMatchId) return;
+      const res = await api.fetchMatchSnapshot(selectedMatchId, fields);
+      const data = res.data;
+      if (data.match !== undefined) setMatch(data.match);
+      if (data.events !== undefined) setEvents([...data.events].reverse());
+      if (data.ticker_entries !== undefined)
+        setTickerTexts(data.ticker_entries);
+      if (data.prematch !== undefined) setPrematch(data.prematch);
+      if (data.live_stats !== undefined) setLiveStats(data.live_stats);
+      if (data.lineups !== undefined) setLineups(data.lineups);
+      if (data.match_statistics !== undefined)
+        setMatchStats(data.match_statistics);
+      if (data.player_statistics !== undefined)
+        setPlayerStats(data.player_statistics);
+    },
+    [selectedMatchId],
+  );
 
-  const loadLiveStats = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchLiveStats(selectedMatchId);
-    setLiveStats(res.data);
-  }, [selectedMatchId]);
-
-  const loadLineups = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchLineups(selectedMatchId);
-    setLineups(res.data);
-  }, [selectedMatchId]);
-
-  const loadMatchStats = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchMatchStats(selectedMatchId);
-    setMatchStats(res.data);
-  }, [selectedMatchId]);
-
-  const loadPlayerStats = useCallback(async () => {
-    if (!selectedMatchId) return;
-    const res = await api.fetchPlayerStats(selectedMatchId);
-    setPlayerStats(res.data);
-  }, [selectedMatchId]);
+  const loadEvents = useCallback(
+    () => loadSnapshot(["events"]),
+    [loadSnapshot],
+  );
+  const loadTickerTexts = useCallback(
+    () => loadSnapshot(["ticker_entries"]),
+    [loadSnapshot],
+  );
+  const loadPrematch = useCallback(
+    () => loadSnapshot(["prematch"]),
+    [loadSnapshot],
+  );
+  const loadLiveStats = useCallback(
+    () => loadSnapshot(["live_stats"]),
+    [loadSnapshot],
+  );
 
   // eslint-disable-next-line react-hooks/exhaustive-deps
   useEffect(() => {
     if (!selectedMatchId) return;
     setLoading(true);
 
-    Promise.all([
-      loadMatch(),
-      loadEvents(),
-      loadTickerTexts(),
-      loadPrematch(),
-      loadLiveStats(),
-      loadLineups(),
-      loadMatchStats(),
-      loadPlayerStats(),
-    ]).finally(() => setLoading(false));
+    loadSnapshot().finally(() => setLoading(false));
 
-    const t1 = setTimeout(() => {
-      loadLineups();
-      loadMatchStats();
-      loadPlayerStats();
-      loadPrematch();
-    }, 5000);
-    const t2 = setTimeout(() => {
-      loadLineups();
-      loadMatchStats();
-      loadPlayerStats();
-      loadPrematch();
-    }, 15000);
+    const t1 = setTimeout(() => loadSnapshot(STATIC_FIELDS), 5000);
+    const t2 = setTimeout(() => loadSnapshot(STATIC_FIELDS), 15000);
 
-    intervalRef.current = setInterval(() => {
-      loadEvents();
-      loadTickerTexts();
-      loadLiveStats();
-    }, 5000);
+    intervalRef.current = setInterval(() => loadSnapshot(LIVE_FIELDS), 5000);
 
     return () => {
       clearInterval(intervalRef.current);
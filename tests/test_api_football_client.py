@@ -0,0 +1,160 @@
+"""
+API-Football Client gegen einen httpx-MockTransport: Token Bucket,
+Request Coalescing und Response Cache.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services.api_football_client import (
+    ApiFootballClient,
+    ApiFootballError,
+    TokenBucket,
+)
+
+
+class FakeApi:
+    """Zählt Requests, antwortet nach delay Sekunden."""
+
+    def __init__(self, delay: float = 0.05, status: int = 200, etag: str | None = None):
+        self.delay = delay
+        self.status = status
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        headers = {"etag": self.etag} if self.etag else {}
+        body = {"errors": [], "response": [{"path": request.url.path}]}
+        return httpx.Response(self.status, json=body, headers=headers)
+
+
+def _client(api: FakeApi, **kwargs) -> ApiFootballClient:
+    kwargs.setdefault("rate_limit_per_minute", 6000)
+    return ApiFootballClient(
+        "http://api.test", "key", transport=httpx.MockTransport(api), **kwargs
+    )
+
+
+# ── Token Bucket ─────────────────────────────────────────
+
+
+def test_token_bucket_allows_burst_then_paces():
+    async def run() -> list[float]:
+        bucket = TokenBucket(rate_per_minute=600, capacity=2)  # 10/s
+        started = time.monotonic()
+        stamps = []
+        for _ in range(5):
+            await bucket.acquire()
+            stamps.append(time.monotonic() - started)
+        return stamps
+
+    stamps = asyncio.run(run())
+
+    assert stamps[1] < 0.02  # Burst bis zur Bucket-Größe
+    assert stamps[2] == pytest.approx(0.1, abs=0.04)
+    assert stamps[4] == pytest.approx(0.3, abs=0.06)
+
+
+def test_token_bucket_default_capacity():
+    assert TokenBucket(rate_per_minute=100).capacity == 10
+    assert TokenBucket(rate_per_minute=5).capacity == 1
+
+
+def test_client_requests_are_rate_limited():
+    api = FakeApi(delay=0)
+    client = _client(api, rate_limit_per_minute=600, cache_ttls={"teams": 0})
+    client.limiter = TokenBucket(rate_per_minute=600, capacity=1)
+
+    async def run() -> float:
+        started = time.monotonic()
+        for team in range(3):
+            await client.get("teams", id=team)
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) == pytest.approx(0.2, abs=0.05)
+    assert len(api.requests) == 3
+
+
+# ── Coalescing ───────────────────────────────────────────
+
+
+def test_identical_concurrent_gets_share_one_request():
+    api = FakeApi()
+    client = _client(api)
+
+    async def run():
+        return await asyncio.gather(
+            *(client.get("fixtures/events", fixture=1) for _ in range(5)),
+            client.get("fixtures/events", fixture=2),
+        )
+
+    results = asyncio.run(run())
+
+    assert len(api.requests) == 2
+    assert all(r == results[0] for r in results[:5])
+    assert client.stats()["coalesced"] == 4
+    assert client._in_flight == {}
+
+
+def test_error_reaches_coalesced_callers():
+    api = FakeApi(status=500)
+    client = _client(api)
+
+    async def run():
+        return await asyncio.gather(
+            *(client.get("fixtures", id=1) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert len(api.requests) == 1
+    assert all(isinstance(r, ApiFootballError) for r in results)
+
+
+def test_cancelled_leader_does_not_hang_followers():
+    api = FakeApi(delay=5)
+    client = _client(api)
+
+    async def run():
+        leader = asyncio.create_task(client.get("fixtures", id=1))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(client.get("fixtures", id=1))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(follower, timeout=1)
+
+    asyncio.run(run())
+    assert client._in_flight == {}
+
+
+# ── Cache ────────────────────────────────────────────────
+
+
+def test_cache_hit_and_conditional_revalidation():
+    api = FakeApi(delay=0, etag='"v1"')
+    client = _client(api, cache_ttls={"fixtures": 60})
+
+    async def run():
+        first = await client.get("fixtures", id=1)
+        assert await client.get("fixtures", id=1) == first
+        assert len(api.requests) == 1
+
+        # TTL abgelaufen → bedingter Request mit dem gespeicherten ETag
+        key, (_, validators, payload) = next(iter(client._cache.items()))
+        client._cache[key] = (0.0, validators, payload)
+        assert await client.get("fixtures", id=1) == first
+
+    asyncio.run(run())
+
+    assert len(api.requests) == 2
+    assert api.requests[1].headers["if-none-match"] == '"v1"'
+    stats = client.stats()
+    assert stats["cache_hits"] == 1 and stats["not_modified"] == 1
@@ -0,0 +1,146 @@
+"""
+Circuit Breaker und Degraded Mode des LLM-Routers (ohne Provider).
+"""
+
+import asyncio
+
+from app.services.llm_router import CircuitBreaker, LLMRouter
+
+
+def _breaker(**kwargs) -> CircuitBreaker:
+    kwargs.setdefault("window", 10)
+    kwargs.setdefault("min_calls", 4)
+    kwargs.setdefault("error_rate", 0.5)
+    kwargs.setdefault("slow_call_ms", 1000)
+    kwargs.setdefault("slow_rate", 0.75)
+    kwargs.setdefault("open_seconds", 60)
+    return CircuitBreaker(**kwargs)
+
+
+def _half_open() -> CircuitBreaker:
+    breaker = _breaker(open_seconds=0)
+    breaker._open()
+    return breaker
+
+
+def test_stays_closed_below_min_calls():
+    breaker = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    assert breaker.state == "closed"
+    assert breaker.allow_request()
+
+
+def test_opens_on_error_rate():
+    breaker = _breaker()
+    breaker.record_success(100)
+    breaker.record_success(100)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert breaker.opened_count == 1
+    assert not breaker.allow_request()
+
+
+def test_opens_on_slow_rate():
+    breaker = _breaker()
+    breaker.record_success(100)
+    for _ in range(3):
+        breaker.record_success(1500)
+
+    assert breaker.state == "open"
+
+
+def test_disabled_never_opens():
+    breaker = _breaker(enabled=False)
+    for _ in range(10):
+        breaker.record_failure()
+
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_single_probe():
+    breaker = _half_open()
+
+    assert breaker.allow_request()
+    assert breaker.state == "half_open"
+    assert not breaker.allow_request()
+
+
+def test_probe_success_closes():
+    breaker = _half_open()
+    breaker.allow_request()
+
+    breaker.record_success(100)
+
+    assert breaker.state == "closed"
+    assert breaker.allow_request() and breaker.allow_request()
+
+
+def test_probe_failure_or_slow_probe_reopens():
+    for outcome in ("failure", "slow"):
+        breaker = _half_open()
+        assert breaker.allow_request()
+        breaker.open_seconds = 60
+
+        if outcome == "failure":
+            breaker.record_failure()
+        else:
+            breaker.record_success(1500)
+
+        assert breaker.state == "open", outcome
+        assert breaker.opened_count == 2
+        assert not breaker.allow_request()
+
+
+def test_cancelled_probe_frees_slot():
+    breaker = _half_open()
+    breaker.allow_request()
+
+    breaker.release()
+
+    assert breaker.state == "half_open"
+    assert breaker.allow_request()
+
+
+# ── Degraded Mode ────────────────────────────────────────
+
+
+class BrokenBackend:
+    name = provider = model_label = "broken"
+    timeout = 1.0
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_ticker_text(self, **kwargs) -> str:
+        self.calls += 1
+        raise RuntimeError("provider down")
+
+
+def test_template_fallback_after_breaker_opens():
+    backend = BrokenBackend()
+    router = LLMRouter(
+        [backend],
+        breaker_factory=lambda: _breaker(min_calls=2),
+        fallback_enabled=True,
+    )
+
+    async def run():
+        return [
+            await router.generate(event_type="goal", event_detail="", minute=10)
+            for _ in range(4)
+        ]
+
+    results = asyncio.run(run())
+
+    assert all(used is router.fallback for _, used in results)
+    assert all(text for text, _ in results)
+    # nach zwei Fehlern offen: weitere Aufrufe gehen nicht mehr an den Provider
+    assert backend.calls == 2
+    assert router.breakers["broken"].state == "open"
+    assert router.stats()["fallbacks"] == 4
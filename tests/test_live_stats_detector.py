@@ -0,0 +1,90 @@
+"""
+Schwellwert-Regeln der Live-Stats-Erkennung (ohne DB: Vorstand per advance).
+"""
+
+from app.services.live_stats_detector import LiveStatsDetector, StatsObservation
+
+
+def _obs(match_id=1, team_id=10, **stats) -> StatsObservation:
+    return StatsObservation(match_id, team_id, stats, {"minute": 30})
+
+
+def _detector(**stats) -> LiveStatsDetector:
+    detector = LiveStatsDetector()
+    detector.advance([_obs(**stats)])
+    return detector
+
+
+def test_no_snapshot_no_trigger():
+    assert LiveStatsDetector().detect([_obs(shots_on_goal=5)]) == []
+
+
+def test_thresholds_reached():
+    detector = _detector(shots_on_goal=1, total_shots=3, corner_kicks=0, fouls=4)
+
+    (hit,) = detector.detect(
+        [_obs(shots_on_goal=2, total_shots=5, corner_kicks=1, fouls=5)]
+    )
+
+    assert hit.triggers == [
+        "+1 Schuss aufs Tor",
+        "+2 Schüsse gesamt",
+        "+1 Eckball",
+        "+1 Foul",
+    ]
+    assert hit.delta["total_shots"] == 2
+    assert hit.curr_stats["fouls"] == 5
+
+
+def test_below_threshold_not_reported():
+    detector = _detector(total_shots=3, ball_possession=50)
+
+    assert detector.detect([_obs(total_shots=4, ball_possession=54)]) == []
+
+
+def test_ball_possession_counts_both_directions():
+    detector = _detector(ball_possession=55)
+
+    (hit,) = detector.detect([_obs(ball_possession=48)])
+    assert hit.triggers == ["Ballbesitz-Shift: -7%"]
+
+    detector.advance([_obs(ball_possession=48)])
+    (hit,) = detector.detect([_obs(ball_possession=53.5)])
+    assert hit.triggers == ["Ballbesitz-Shift: +5.5%"]
+
+
+def test_falling_counter_is_no_trigger():
+    # Korrektur der API (Schuss aberkannt) ist kein Ereignis
+    detector = _detector(shots_on_goal=3)
+
+    assert detector.detect([_obs(shots_on_goal=2)]) == []
+
+
+def test_detect_does_not_advance():
+    detector = _detector(fouls=1)
+
+    assert detector.detect([_obs(fouls=2)])
+    # ohne advance (Commit fehlgeschlagen) bleibt das Delta erhalten
+    assert detector.detect([_obs(fouls=2)])
+
+    detector.advance([_obs(fouls=2)])
+    assert detector.detect([_obs(fouls=2)]) == []
+
+
+def test_keys_are_per_match_and_team():
+    detector = _detector(match_id=1, team_id=10, fouls=0)
+    detector.advance([_obs(match_id=1, team_id=11, fouls=5)])
+
+    hits = detector.detect(
+        [
+            _obs(match_id=1, team_id=10, fouls=1),
+            _obs(match_id=1, team_id=11, fouls=5),
+            _obs(match_id=2, team_id=10, fouls=9),
+        ]
+    )
+
+    assert [(h.observation.match_id, h.observation.team_id) for h in hits] == [(1, 10)]
+    assert detector.missing_match_ids([_obs(match_id=2)]) == {2}
+
+    detector.forget(1)
+    assert detector.snapshot_count() == 0
@@ -0,0 +1,134 @@
+"""
+LLM-Cache: Schlüssel, LRU-Verdrängung, TTL und Zähler; der persistente
+Modus mit ersetzten DB-Zugriffen.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.services.llm_cache import LLMCache, make_cache_key
+
+
+def _get(cache: LLMCache, key: str):
+    return asyncio.run(cache.get(key))
+
+
+def _set(cache: LLMCache, key: str, text: str | None = None):
+    asyncio.run(cache.set(key, text or f"text {key}", "model"))
+
+
+def test_key_normalises_whitespace_and_includes_model():
+    key = make_cache_key("Tor  für\nBayern ", "gpt")
+
+    assert key == make_cache_key("Tor für Bayern", "gpt")
+    assert key != make_cache_key("Tor für Bayern", "gemini")
+    assert len(key) == 64
+
+
+def test_hit_and_miss_counters():
+    cache = LLMCache()
+    _set(cache, "a")
+
+    assert _get(cache, "a") == "text a"
+    assert _get(cache, "b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LLMCache(max_size=2)
+    _set(cache, "a")
+    _set(cache, "b")
+    _get(cache, "a")  # a wieder zuletzt benutzt
+
+    _set(cache, "c")
+
+    assert _get(cache, "b") is None
+    assert _get(cache, "a") == "text a"
+    assert _get(cache, "c") == "text c"
+    assert cache.stats()["size"] == 2
+    assert cache.evictions == 1
+
+
+def test_overwrite_does_not_evict():
+    cache = LLMCache(max_size=2)
+    _set(cache, "a")
+    _set(cache, "b")
+    _set(cache, "a", "neu")
+
+    assert _get(cache, "a") == "neu"
+    assert _get(cache, "b") == "text b"
+    assert cache.evictions == 0
+
+
+def test_expired_entry_is_a_miss_and_removed():
+    cache = LLMCache(ttl_seconds=0.05)
+    _set(cache, "a")
+    assert _get(cache, "a") == "text a"
+
+    time.sleep(0.06)
+
+    assert _get(cache, "a") is None
+    assert cache.stats()["size"] == 0
+    assert cache.misses == 1
+
+
+def test_set_renews_ttl():
+    cache = LLMCache(ttl_seconds=0.1)
+    _set(cache, "a")
+    time.sleep(0.06)
+    _set(cache, "a")
+    time.sleep(0.06)
+
+    assert _get(cache, "a") == "text a"
+
+
+# ── Persistenter Modus (DB-Zugriffe ersetzt) ─────────────
+
+
+def test_db_hit_keeps_remaining_ttl_of_row(monkeypatch):
+    cache = LLMCache(ttl_seconds=3600, persistent=True)
+    reads = []
+
+    def db_get(key):
+        reads.append(key)
+        return "aus der DB", datetime.now(timezone.utc) + timedelta(seconds=0.05)
+
+    monkeypatch.setattr(cache, "_db_get", db_get)
+
+    assert _get(cache, "a") == "aus der DB"
+    assert _get(cache, "a") == "aus der DB"
+    assert len(reads) == 1  # zweiter Treffer aus dem Speicher
+
+    time.sleep(0.06)
+
+    # Zeile läuft ab → nicht eine volle TTL lang im Speicher weiterliefern
+    assert _get(cache, "a") == "aus der DB"
+    assert len(reads) == 2
+
+
+def test_purge_runs_on_start_and_periodically(monkeypatch):
+    cache = LLMCache(persistent=True, purge_interval_seconds=0.02)
+    runs = []
+    monkeypatch.setattr(cache, "_db_purge", lambda: runs.append(1) or 3)
+
+    async def run():
+        cache.start()
+        await asyncio.sleep(0.05)
+        await cache.stop()
+
+    asyncio.run(run())
+
+    assert len(runs) >= 2
+    assert cache.stats()["purged"] == 3 * len(runs)
+
+
+def test_purge_not_started_without_persistence():
+    async def run():
+        cache = LLMCache()
+        cache.start()
+        return cache._purge_task
+
+    assert asyncio.run(run()) is None
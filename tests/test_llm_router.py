@@ -0,0 +1,185 @@
+"""
+LLM-Router ohne Provider: Latenz-Perzentile, Reihenfolge, Hedging und
+Failover mit Fake-Backends fester Latenz.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.llm_router import LatencyTracker, LLMRouter, NoBackendAvailable
+
+
+class FakeBackend:
+    def __init__(self, name: str, latency_ms: float = 0, fail: bool = False):
+        self.name = name
+        self.provider = "fake"
+        self.model_label = name
+        self.timeout = 5.0
+        self.latency_ms = latency_ms
+        self.fail = fail
+        self.started = 0
+        self.finished = 0
+
+    async def generate_ticker_text(self, **kwargs) -> str:
+        self.started += 1
+        await asyncio.sleep(self.latency_ms / 1000)
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        self.finished += 1
+        return f"text from {self.name}"
+
+
+def _router(*backends, **kwargs) -> LLMRouter:
+    kwargs.setdefault("fallback_enabled", False)
+    return LLMRouter(list(backends), **kwargs)
+
+
+def _route(router: LLMRouter):
+    return asyncio.run(router._route({"event_type": "goal"}))
+
+
+# ── LatencyTracker ───────────────────────────────────────
+
+
+def test_percentile_nearest_rank():
+    tracker = LatencyTracker()
+    assert tracker.percentile(50) is None
+
+    for ms in range(1, 101):
+        tracker.record(ms)
+
+    assert tracker.percentile(50) == 50
+    assert tracker.percentile(95) == 95
+    assert tracker.percentile(99) == 99
+    assert tracker.percentile(100) == 100
+
+
+def test_window_and_error_rate():
+    tracker = LatencyTracker(window=4)
+    for ms in (1000, 1000, 10, 20, 30, 40):
+        tracker.record(ms)
+    tracker.record_error()
+
+    assert tracker.samples == 4
+    assert tracker.percentile(100) == 40  # alte Ausreißer aus dem Fenster
+    assert tracker.error_rate == 0.25
+
+
+# ── Reihenfolge ──────────────────────────────────────────
+
+
+def test_config_order_until_enough_samples():
+    slow, fast = FakeBackend("slow"), FakeBackend("fast")
+    router = _router(slow, fast, min_samples=3)
+    for _ in range(3):
+        router.trackers["slow"].record(900)
+    for _ in range(2):
+        router.trackers["fast"].record(100)
+
+    assert router.ranked() == [slow, fast]
+
+    router.trackers["fast"].record(100)
+    assert router.ranked() == [fast, slow]
+
+
+def test_error_rate_penalises_fast_backend():
+    flaky, steady = FakeBackend("flaky"), FakeBackend("steady")
+    router = _router(flaky, steady, min_samples=2)
+    for _ in range(2):
+        router.trackers["flaky"].record(100)
+        router.trackers["steady"].record(300)
+    for _ in range(3):
+        router.trackers["flaky"].record_error()
+
+    # 100 ms × (1 + 4 × 3/5) = 340 ms > 300 ms
+    assert router.ranked() == [steady, flaky]
+
+
+def test_hedge_delay_from_percentile():
+    backend = FakeBackend("a")
+    router = _router(backend, hedge_after_ms=1500, hedge_min_ms=150, min_samples=10)
+    assert router.hedge_delay(backend) == 1.5
+
+    for ms in range(10, 110, 10):
+        router.trackers["a"].record(ms)
+    assert router.hedge_delay(backend) == 0.15  # p95 = 100 ms < hedge_min_ms
+
+    for ms in range(400, 1400, 100):
+        router.trackers["a"].record(ms)
+    assert router.hedge_delay(backend) == pytest.approx(1.2)  # 19. von 20
+
+
+# ── Hedging / Failover ───────────────────────────────────
+
+
+def test_fast_first_backend_needs_no_hedge():
+    first, second = FakeBackend("first", 5), FakeBackend("second", 5)
+    router = _router(first, second, hedge_after_ms=500)
+
+    text, winner = _route(router)
+
+    assert winner is first and text == "text from first"
+    assert second.started == 0
+    assert router.stats()["hedges"] == 0
+
+
+def test_hedge_starts_next_backend_and_cancels_loser():
+    slow, fast = FakeBackend("slow", 500), FakeBackend("fast", 10)
+    router = _router(slow, fast, hedge_after_ms=30)
+
+    started = time.monotonic()
+    text, winner = _route(router)
+    elapsed = time.monotonic() - started
+
+    assert winner is fast and text == "text from fast"
+    assert elapsed < 0.3
+    assert slow.started == 1 and slow.finished == 0
+    stats = router.stats()
+    assert stats["hedges"] == 1
+    assert stats["backends"]["slow"]["cancelled"] == 1
+    assert stats["backends"]["fast"]["wins"] == 1
+    # Verlierer zählt mit seiner Laufzeit als Messwert
+    assert router.trackers["slow"].samples == 1
+
+
+def test_no_hedge_when_disabled():
+    slow, fast = FakeBackend("slow", 80), FakeBackend("fast", 1)
+    router = _router(slow, fast, hedge_enabled=False, hedge_after_ms=10)
+
+    _, winner = _route(router)
+
+    assert winner is slow and fast.started == 0
+
+
+def test_failover_without_waiting_for_hedge_delay():
+    broken, backup = FakeBackend("broken", 5, fail=True), FakeBackend("backup", 5)
+    router = _router(broken, backup, hedge_after_ms=5000)
+
+    started = time.monotonic()
+    _, winner = _route(router)
+
+    assert winner is backup
+    assert time.monotonic() - started < 1
+    assert router.stats()["backends"]["broken"]["errors"] == 1
+
+
+def test_all_backends_failing_raises_last_error():
+    router = _router(FakeBackend("a", fail=True), FakeBackend("b", fail=True))
+
+    with pytest.raises(RuntimeError, match="b down"):
+        _route(router)
+
+
+def test_open_breakers_are_skipped():
+    a, b = FakeBackend("a"), FakeBackend("b")
+    router = _router(a, b)
+    router.breakers["a"]._open()
+
+    _, winner = _route(router)
+    assert winner is b and a.started == 0
+
+    router.breakers["b"]._open()
+    with pytest.raises(NoBackendAvailable):
+        _route(router)
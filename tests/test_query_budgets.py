@@ -0,0 +1,47 @@
+"""
+Query-Budgets der Listen-Routes (QueryInspectorMiddleware im Strict-Modus,
+siehe conftest): Budget überschritten oder N+1-Lazy-Loads → der Request
+wirft QueryBudgetExceeded, zusätzlich prüfen die Tests die Zählung direkt.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.query_inspector import capture_queries
+
+
+@pytest.fixture(scope="module")
+def client(seeded):
+    # app.main legt beim Import Tabellen an → erst nach dem DB-Check importieren
+    from app.main import app
+
+    # ohne Context Manager: keine Startup-Events (LLM-Worker)
+    return TestClient(app)
+
+
+def _get_logged(client: TestClient, url: str):
+    with capture_queries() as logs:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert len(logs) == 1
+    return response, logs[0]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/v1/favorites/matches?user_id={user_id}",
+        "/api/v1/league-seasons/{league_season_id}/matches",
+        "/api/v1/league-seasons/{league_season_id}/matches?round=Regular Season - 1",
+    ],
+)
+def test_list_route_within_budget(client, seeded, url):
+    response, log = _get_logged(client, url.format(**seeded))
+
+    assert response.json(), "Benchmark-Saison liefert keine Matches"
+    assert log.budget == 2
+    assert log.count <= log.budget, log.statements
+    assert int(response.headers["X-Query-Count"]) == log.count
+    assert not log.lazy_loads, log.lazy_loads
+    assert not log.repeated_lazy_loads(settings.QUERY_INSPECTOR_N_PLUS_ONE_THRESHOLD)
@@ -0,0 +1,52 @@
+"""
+Query-Plan-Regression für die Hot Paths (Indizes aus Migration b8e4f2a6d9c3).
+
+Gleiche Prüfungen wie `python -m tools.check_query_plans`, aber auf der
+geseedeten Benchmark-Saison und pro Repository-Methode als eigener Test.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from tools.check_query_plans import CHECKS, explain, seq_scans
+
+HOT_PATH_TABLES = sorted({table for _, table, _ in CHECKS})
+
+
+@pytest.fixture
+def analyzed_db(db):
+    """Aktuelle Statistiken, Seq Scan nur als letzter Ausweg."""
+    for table in HOT_PATH_TABLES:
+        db.execute(text(f"ANALYZE {table}"))
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    return db
+
+
+@pytest.mark.parametrize(
+    "table, call", [(t, c) for _, t, c in CHECKS], ids=[n for n, _, _ in CHECKS]
+)
+def test_hot_path_uses_index(analyzed_db, table, call):
+    plans = explain(analyzed_db, call)
+    assert plans, "keine SELECTs aufgezeichnet"
+    for plan in plans:
+        assert table not in seq_scans(plan), plan
+
+
+def test_no_duplicate_indexes(db):
+    """Keine zwei Indizes mit gleichen Spalten, Ausdrücken und WHERE."""
+    duplicates = db.execute(
+        text(
+            """
+            SELECT indrelid::regclass::text AS tbl,
+                   array_agg(indexrelid::regclass::text ORDER BY indexrelid) AS names
+            FROM pg_index
+            WHERE indrelid::regclass::text = ANY(:tables)
+            GROUP BY indrelid, indkey::text, indclass::text,
+                     coalesce(pg_get_expr(indexprs, indrelid), ''),
+                     coalesce(pg_get_expr(indpred, indrelid), '')
+            HAVING count(*) > 1
+            """
+        ),
+        {"tables": HOT_PATH_TABLES},
+    ).all()
+    assert not duplicates, [(row.tbl, row.names) for row in duplicates]
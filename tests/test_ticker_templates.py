@@ -0,0 +1,136 @@
+"""
+Template-Engine: Slot-Fallback, Detail-/Stil-Fallback, Rotation und Policy.
+"""
+
+from app.services.ticker_templates import (
+    CompiledTemplate,
+    TemplatePolicy,
+    TickerTemplateEngine,
+)
+
+TEMPLATES = {
+    ("de", "Goal", "*"): {
+        "neutral": (
+            "Tor für {team}! {player} trifft ({minute}'). Vorlage: {assist}.",
+            "Tor für {team}! {player} trifft ({minute}').",
+        ),
+        "euphorisch": ("TOOOR! {player}!",),
+    },
+    ("de", "Card", "Yellow Card"): {
+        "neutral": ("Gelb für {player}.", "{player} sieht Gelb ({minute}')."),
+    },
+    ("de", "Card", "*"): {
+        "neutral": ("Rot für {player}.",),
+    },
+}
+
+
+def _engine(rules: str = "") -> TickerTemplateEngine:
+    return TickerTemplateEngine(TEMPLATES, policy=TemplatePolicy.from_string(rules))
+
+
+def test_compiled_template_renders_like_format():
+    source = "{minute}. Minute: {player} trifft für {team}."
+    template = CompiledTemplate(source)
+    values = {"minute": 12, "player": "Müller", "team": "Bayern"}
+
+    assert template.slots == {"minute", "player", "team"}
+    assert template.render(values) == source.format(**values)
+
+
+def test_variant_with_unfilled_slot_is_skipped():
+    engine = _engine()
+
+    texts = {
+        engine.render("Goal", minute=12, player_name="Müller", team_name="Bayern")
+        for _ in range(3)
+    }
+
+    # ohne Vorlagengeber nur die Variante ohne {assist}
+    assert texts == {"Tor für Bayern! Müller trifft (12')."}
+
+
+def test_no_usable_variant_returns_none():
+    assert _engine().render("Goal", minute=12) is None
+
+
+def test_slots_from_context_data():
+    text = _engine().render(
+        "Goal",
+        context_data={
+            "minute": 80,
+            "player_name": "Kane",
+            "team_name": "Bayern",
+            "assist": "Sané",
+        },
+    )
+
+    assert text in (
+        "Tor für Bayern! Kane trifft (80'). Vorlage: Sané.",
+        "Tor für Bayern! Kane trifft (80').",
+    )
+
+
+def test_detail_falls_back_to_wildcard():
+    engine = _engine()
+
+    assert engine.render("Card", "Red Card", player_name="Kim") == "Rot für Kim."
+    assert engine.render("Card", "Yellow Card", player_name="Kim") == "Gelb für Kim."
+    assert engine.render("Unknown", player_name="Kim") is None
+
+
+def test_unknown_style_falls_back_to_neutral():
+    engine = _engine()
+
+    assert engine.render("Card", "Red Card", player_name="Kim", style="kritisch") == (
+        "Rot für Kim."
+    )
+    assert engine.render("Goal", player_name="Kane", style="euphorisch") == (
+        "TOOOR! Kane!"
+    )
+
+
+def test_variants_rotate():
+    engine = _engine()
+    kwargs = dict(event_type="Card", event_detail="Yellow Card", minute=5)
+
+    texts = [engine.render(player_name="Kim", **kwargs) for _ in range(4)]
+
+    assert texts == [
+        "Gelb für Kim.",
+        "Kim sieht Gelb (5').",
+        "Gelb für Kim.",
+        "Kim sieht Gelb (5').",
+    ]
+
+
+def test_policy_by_type_and_detail():
+    policy = TemplatePolicy.from_string(" Card:Yellow Card , subst,")
+
+    assert policy.use_template("subst", None)
+    assert policy.use_template("Card", "Yellow Card")
+    assert not policy.use_template("Card", "Red Card")
+    assert not policy.use_template("Goal", "Normal Goal")
+
+
+def test_render_routine_respects_policy():
+    engine = _engine("Card:Yellow Card")
+
+    assert engine.render_routine(event_type="Goal", player_name="Kane") is None
+    assert (
+        engine.render_routine(
+            event_type="Card", event_detail="Yellow Card", player_name="Kim"
+        )
+        == "Gelb für Kim."
+    )
+    # Policy erlaubt, aber kein Template renderbar → LLM
+    assert engine.render_routine(event_type="Card", event_detail="Yellow Card") is None
+    assert engine.stats()["routine"] == 1
+
+    engine.enabled = False
+    assert (
+        engine.render_routine(
+            event_type="Card", event_detail="Yellow Card", player_name="Kim"
+        )
+        is None
+    )